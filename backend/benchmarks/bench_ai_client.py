@@ -0,0 +1,116 @@
+"""AI client benchmark: a new OpenAI client per call vs the pooled registry.
+
+Starts a local OpenAI-compatible stand-in (``POST /v1/chat/completions``
+answering with a canned JSON completion after ``--delay-ms``) and calls
+``chat_json`` in real mode against it.  "fresh" reproduces the old behaviour
+(a new ``OpenAI`` client, SSL context and connection pool per call); "pooled"
+is ``services.ai.client.get_client``, which keeps one client per process and
+reuses its keep-alive connection.  The stand-in is plain HTTP on loopback, so
+the saving shown here is client construction plus TCP setup only; against a
+remote provider each avoided TLS handshake adds its round trips on top.
+
+Run with:  python benchmarks/bench_ai_client.py [--calls 200] [--delay-ms 0]
+"""
+
+import argparse
+import json
+import logging
+import statistics
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from openai import OpenAI
+
+from applytrack.core.config import settings
+from applytrack.services.ai import client
+
+COMPLETION = json.dumps(
+    {
+        "id": "chatcmpl-bench",
+        "object": "chat.completion",
+        "created": 0,
+        "model": "bench",
+        "choices": [
+            {
+                "index": 0,
+                "message": {"role": "assistant", "content": '{"ok": true}'},
+                "finish_reason": "stop",
+            }
+        ],
+        "usage": {"prompt_tokens": 1, "completion_tokens": 1, "total_tokens": 2},
+    }
+).encode()
+
+
+def _serve(delay: float) -> ThreadingHTTPServer:
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"  # keep-alive
+        disable_nagle_algorithm = True  # headers and body go out as separate writes
+
+        def do_POST(self):
+            self.rfile.read(int(self.headers.get("Content-Length", 0)))
+            if delay:
+                time.sleep(delay)
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(COMPLETION)))
+            self.end_headers()
+            self.wfile.write(COMPLETION)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def _fresh_client() -> OpenAI:
+    return OpenAI(
+        base_url=settings.ai_base_url,
+        api_key=settings.ai_api_key,
+        timeout=settings.ai_timeout_seconds,
+    )
+
+
+def _measure(calls: int) -> list[float]:
+    samples = []
+    for _ in range(calls):
+        start = time.perf_counter()
+        text, _ = client.chat_json("system", "user", kind="bench")
+        samples.append(time.perf_counter() - start)
+        assert json.loads(text) == {"ok": True}
+    return samples
+
+
+def run(calls: int, delay_ms: float) -> None:
+    logging.getLogger().setLevel(logging.WARNING)  # one INFO line per call otherwise
+    server = _serve(delay_ms / 1000)
+    settings.ai_mode = "real"
+    settings.ai_api_key = "bench"
+    settings.ai_base_url = f"http://127.0.0.1:{server.server_port}/v1"
+
+    original = client.get_client
+    print(f"{calls} calls, stand-in delay {delay_ms:g} ms; per-call latency in ms")
+    print(f"{'client':>7}  {'mean':>7}  {'p50':>7}  {'p99':>7}")
+    for name, factory in (("fresh", _fresh_client), ("pooled", original)):
+        client.get_client = factory
+        _measure(5)  # warm-up
+        samples = sorted(_measure(calls))
+        p99 = samples[min(len(samples) - 1, int(len(samples) * 0.99))]
+        print(
+            f"{name:>7}  {statistics.mean(samples) * 1000:>7.2f}"
+            f"  {statistics.median(samples) * 1000:>7.2f}  {p99 * 1000:>7.2f}"
+        )
+    client.get_client = original
+    client.close_clients()
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=200)
+    parser.add_argument("--delay-ms", type=float, default=0)
+    args = parser.parse_args()
+    run(args.calls, args.delay_ms)
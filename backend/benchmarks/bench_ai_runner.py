@@ -0,0 +1,100 @@
+"""AI task throughput: one blocking task per slot vs the asyncio runner.
+
+Seeds a throwaway SQLite database with applications (distinct postings, so
+the result cache never hits) and runs ``task_parse_jd`` for each in mock mode,
+with the mock's model latency set by ``--delay-ms``.  Both runs play a single
+prefork slot receiving the tasks one after another.  "sync" is the default
+path, a task at a time; "async" sets ``AI_ASYNC_RUNNER``, so each task is
+dispatched to the process's event loop and the slot takes the next one at
+once, with up to ``--concurrency`` (``AI_MAX_CONCURRENCY``) pipelines in flight.
+
+Run with:  python benchmarks/bench_ai_runner.py [--tasks 64] [--delay-ms 300] [--concurrency 32]
+"""
+
+import argparse
+import logging
+import os
+import tempfile
+import time
+
+_tmp = tempfile.TemporaryDirectory()
+_path = os.path.join(_tmp.name, "bench.db")
+os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{_path}"
+
+from celery.exceptions import Ignore  # noqa: E402
+from sqlalchemy import create_engine  # noqa: E402
+from sqlalchemy.orm import Session  # noqa: E402
+
+import applytrack.db.models  # noqa: E402, F401
+from applytrack.core.config import settings  # noqa: E402
+from applytrack.db.base import Base  # noqa: E402
+from applytrack.db.models.application import Application  # noqa: E402
+from applytrack.db.models.job_posting import JobPosting  # noqa: E402
+from applytrack.db.models.user import User  # noqa: E402
+from applytrack.services.ai import client  # noqa: E402
+from applytrack.workers import async_runner, tasks_ai  # noqa: E402
+
+
+def _seed(count: int, offset: int) -> list[str]:
+    engine = create_engine(f"sqlite:///{_path}")
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        user = User(email=f"bench{offset}@example.com", password_hash="x")
+        session.add(user)
+        session.flush()
+        app_ids = []
+        for i in range(count):
+            posting = JobPosting(title="SWE", description_raw=f"Posting {offset + i}")
+            session.add(posting)
+            session.flush()
+            app = Application(user_id=user.id, job_posting_id=posting.id)
+            session.add(app)
+            session.flush()
+            app_ids.append(app.id)
+        session.commit()
+    engine.dispose()
+    return app_ids
+
+
+def run(tasks: int, delay_ms: float, concurrency: int) -> None:
+    logging.getLogger().setLevel(logging.WARNING)  # several INFO lines per task otherwise
+    client.MOCK_DELAY_SECONDS = delay_ms / 1000
+    tasks_ai.count_lookup = lambda hit: None  # no Redis for the cache counters here
+    settings.ai_max_concurrency = concurrency
+
+    print(f"{tasks} parse_jd tasks, model latency {delay_ms:g} ms")
+    print(f"{'runner':>6}  {'seconds':>8}  {'tasks/s':>8}")
+
+    app_ids = _seed(tasks, 0)
+    start = time.perf_counter()
+    for app_id in app_ids:
+        tasks_ai.task_parse_jd.run(app_id)
+    elapsed = time.perf_counter() - start
+    print(f"{'sync':>6}  {elapsed:>8.2f}  {tasks / elapsed:>8.1f}")
+
+    settings.ai_async_runner = True
+    tasks_ai._mark_outcome = lambda *outcome: None  # nor a result backend
+    app_ids = _seed(tasks, tasks)
+    task = tasks_ai.task_parse_jd
+    start = time.perf_counter()
+    for i, app_id in enumerate(app_ids):
+        # as the worker delivers it, so the task is dispatched, not awaited
+        task.push_request(id=f"bench-{i}", is_eager=False)
+        try:
+            task.run(app_id)
+        except Ignore:
+            pass
+        finally:
+            task.pop_request()
+    async_runner.shutdown()  # waits for the dispatched pipelines
+    elapsed = time.perf_counter() - start
+    print(f"{'async':>6}  {elapsed:>8.2f}  {tasks / elapsed:>8.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tasks", type=int, default=64)
+    parser.add_argument("--delay-ms", type=float, default=300)
+    parser.add_argument("--concurrency", type=int, default=32)
+    args = parser.parse_args()
+    run(args.tasks, args.delay_ms, args.concurrency)
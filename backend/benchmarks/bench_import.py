@@ -0,0 +1,55 @@
+"""API cold-start benchmark: ``python -X importtime -c "import applytrack.main"``.
+
+Each run is a fresh interpreter, so this is the import cost a new uvicorn
+worker pays before serving its first request.  Prints the median total over
+the runs and the heaviest top-level dependencies of the last run.
+
+Run with:  python benchmarks/bench_import.py [--runs 5] [--top 15]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+
+def _importtime() -> list[tuple[str, int, int]]:
+    env = os.environ | {"DATABASE_URL": "sqlite+aiosqlite://"}
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import applytrack.main"],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+    rows = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.removeprefix("import time:").split("|")
+        depth = (len(name) - len(name.lstrip())) // 2
+        rows.append((name.strip(), int(cumulative), depth))
+    return rows
+
+
+def run(runs: int, top: int) -> None:
+    totals = []
+    for _ in range(runs):
+        rows = _importtime()
+        totals.append(next(c for name, c, _ in rows if name == "applytrack.main") / 1000)
+    print(f"import applytrack.main: median {statistics.median(totals):.1f} ms over {runs} runs")
+
+    # direct imports of the interpreter's top level (plus our own modules one level down)
+    heavy = sorted((r for r in rows if r[2] <= 1), key=lambda r: r[1], reverse=True)[:top]
+    print(f"{'module':<40}  {'cumulative (ms)':>15}")
+    for name, cumulative, _ in heavy:
+        print(f"{name:<40}  {cumulative / 1000:>15.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15)
+    args = parser.parse_args()
+    run(args.runs, args.top)
@@ -0,0 +1,117 @@
+"""Login flood benchmark: argon2 on the event loop vs the hashing pool.
+
+Runs the API in-process against a throwaway SQLite database, fires a burst of
+concurrent logins and meanwhile polls ``/auth/me`` one request at a time.
+The probe's latency shows how much the login burst stalls everything else on
+the worker.  "inline" reproduces the old behaviour (argon2 called directly in
+the handler); "pool" is the bounded executor in ``core.security``.
+
+Run with:  python benchmarks/bench_login.py [--logins 200] [--concurrency 50]
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+
+_tmp = tempfile.TemporaryDirectory()
+os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{os.path.join(_tmp.name, 'bench.db')}"
+
+from httpx import ASGITransport, AsyncClient  # noqa: E402
+
+import applytrack.db.models  # noqa: E402, F401
+from applytrack.api import auth  # noqa: E402
+from applytrack.core import security  # noqa: E402
+from applytrack.db.base import Base  # noqa: E402
+from applytrack.db.session import engine  # noqa: E402
+from applytrack.main import app  # noqa: E402
+
+EMAIL = "bench@example.com"
+PASSWORD = "Bench!Pass123"
+
+
+async def _inline_verify(plain: str, hashed: str) -> bool:
+    return security.verify_password(plain, hashed)
+
+
+def _percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct))] * 1000
+
+
+async def _probe(client: AsyncClient, headers: dict, done: asyncio.Event) -> list[float]:
+    samples = []
+    while not done.is_set():
+        start = time.perf_counter()
+        resp = await client.get("/api/v1/auth/me", headers=headers)
+        samples.append(time.perf_counter() - start)
+        assert resp.status_code == 200
+        await asyncio.sleep(0.005)
+    return samples
+
+
+async def _flood(client: AsyncClient, logins: int, concurrency: int) -> float:
+    gate = asyncio.Semaphore(concurrency)
+
+    async def _login():
+        async with gate:
+            resp = await client.post(
+                "/api/v1/auth/login", data={"username": EMAIL, "password": PASSWORD}
+            )
+            assert resp.status_code == 200
+
+    start = time.perf_counter()
+    await asyncio.gather(*(_login() for _ in range(logins)))
+    return time.perf_counter() - start
+
+
+async def _scenario(client: AsyncClient, headers: dict, logins: int, concurrency: int):
+    done = asyncio.Event()
+    probe = asyncio.create_task(_probe(client, headers, done))
+    elapsed = await _flood(client, logins, concurrency) if logins else 0.5
+    if not logins:
+        await asyncio.sleep(elapsed)
+    done.set()
+    samples = await probe
+    return logins / elapsed, statistics.median(samples) * 1000, _percentile(samples, 0.99)
+
+
+async def run(logins: int, concurrency: int) -> None:
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://bench") as client:
+        resp = await client.post(
+            "/api/v1/auth/register", json={"email": EMAIL, "password": PASSWORD}
+        )
+        assert resp.status_code == 201, resp.text
+        resp = await client.post(
+            "/api/v1/auth/login", data={"username": EMAIL, "password": PASSWORD}
+        )
+        headers = {"Authorization": f"Bearer {resp.json()['access_token']}"}
+
+        print(f"{logins} logins, {concurrency} concurrent, {security.password_hash_stats()}")
+        print(f"{'mode':>8}  {'logins/s':>9}  {'/me p50 (ms)':>13}  {'/me p99 (ms)':>13}")
+        idle = await _scenario(client, headers, 0, concurrency)
+        print(f"{'idle':>8}  {'-':>9}  {idle[1]:>13.2f}  {idle[2]:>13.2f}")
+
+        pooled = auth.verify_password_async
+        for mode, verify in (("inline", _inline_verify), ("pool", pooled)):
+            auth.verify_password_async = verify
+            rate, p50, p99 = await _scenario(client, headers, logins, concurrency)
+            print(f"{mode:>8}  {rate:>9.1f}  {p50:>13.2f}  {p99:>13.2f}")
+        auth.verify_password_async = pooled
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--logins", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=50)
+    args = parser.parse_args()
+    asyncio.run(run(args.logins, args.concurrency))
+    _tmp.cleanup()
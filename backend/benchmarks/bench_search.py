@@ -0,0 +1,116 @@
+"""Application search benchmark: Python-side filtering vs SQL search.
+
+Seeds a throwaway SQLite database with a growing number of applications for
+one user (a fixed handful of which match the search term) and times both the
+old "load everything, filter in Python" path and ``apply_search``.
+
+Run with:  python benchmarks/bench_search.py [--sizes 1000,5000,20000]
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+import uuid
+
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import selectinload
+
+import applytrack.db.models  # noqa: F401
+from applytrack.db.base import Base
+from applytrack.db.models import Application, Company, JobPosting, User
+from applytrack.db.search import apply_search
+
+TERM = "zebra"
+MATCHING_ROWS = 10
+REPEATS = 20
+
+
+async def _seed(session: AsyncSession, user_id: str, count: int) -> None:
+    companies, postings, apps = [], [], []
+    for i in range(count):
+        company_id, posting_id = str(uuid.uuid4()), str(uuid.uuid4())
+        name = f"Zebra Labs {i}" if i < MATCHING_ROWS else f"Company {i}"
+        companies.append({"id": company_id, "user_id": user_id, "name": name})
+        postings.append(
+            {
+                "id": posting_id,
+                "company_id": company_id,
+                "title": f"Engineer {i}",
+                "description_raw": "lorem ipsum " * 200,
+            }
+        )
+        apps.append({"id": str(uuid.uuid4()), "user_id": user_id, "job_posting_id": posting_id})
+    await session.execute(insert(Company), companies)
+    await session.execute(insert(JobPosting), postings)
+    await session.execute(insert(Application), apps)
+    await session.commit()
+
+
+def _base_query(user_id: str):
+    return (
+        select(Application)
+        .where(Application.user_id == user_id)
+        .options(selectinload(Application.job_posting).selectinload(JobPosting.company))
+        .order_by(Application.updated_at.desc())
+    )
+
+
+async def _python_filter(session: AsyncSession, user_id: str) -> int:
+    apps = (await session.execute(_base_query(user_id))).scalars().all()
+    return len(
+        [
+            a
+            for a in apps
+            if TERM in (a.job_posting.title or "").lower()
+            or TERM in (a.job_posting.company.name if a.job_posting.company else "").lower()
+        ]
+    )
+
+
+async def _sql_search(session: AsyncSession, user_id: str) -> int:
+    stmt = apply_search(_base_query(user_id), TERM, session.get_bind().dialect.name)
+    return len((await session.execute(stmt)).scalars().all())
+
+
+async def _time(fn, sessionmaker, user_id: str) -> tuple[float, int]:
+    samples, found = [], 0
+    for _ in range(REPEATS):
+        async with sessionmaker() as session:
+            start = time.perf_counter()
+            found = await fn(session, user_id)
+            samples.append(time.perf_counter() - start)
+    return statistics.median(samples) * 1000, found
+
+
+async def run(sizes: list[int]) -> None:
+    print(f"{'rows':>8}  {'python filter (ms)':>20}  {'sql search (ms)':>16}  matches")
+    for size in sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            engine = create_async_engine(f"sqlite+aiosqlite:///{os.path.join(tmp, 'bench.db')}")
+            async with engine.begin() as conn:
+                await conn.run_sync(Base.metadata.create_all)
+            sessionmaker = async_sessionmaker(engine, expire_on_commit=False)
+
+            async with sessionmaker() as session:
+                user = User(email="bench@applytrack.local", password_hash="x")
+                session.add(user)
+                await session.flush()
+                await _seed(session, user.id, size)
+                user_id = user.id
+
+            py_ms, py_found = await _time(_python_filter, sessionmaker, user_id)
+            sql_ms, sql_found = await _time(_sql_search, sessionmaker, user_id)
+            assert py_found == sql_found == MATCHING_ROWS
+            print(f"{size:>8}  {py_ms:>20.2f}  {sql_ms:>16.2f}  {sql_found}")
+            await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="1000,5000,20000")
+    args = parser.parse_args()
+    asyncio.run(run([int(s) for s in args.sizes.split(",")]))
@@ -0,0 +1,158 @@
+"""SQLite concurrency benchmark: default journaling vs the WAL profile.
+
+Mimics a single-node deployment: worker processes write AI outputs and
+timeline events through the sync engine (as ``tasks_ai`` does) while the API
+process serves application-list reads through the async engine.  Each mode
+runs on a fresh database file; it reports read latency, write throughput and
+how many writes failed with ``database is locked``.
+
+Run with:  python benchmarks/bench_sqlite_concurrency.py [--workers 2] [--seconds 5]
+"""
+
+import argparse
+import asyncio
+import multiprocessing
+import os
+import statistics
+import tempfile
+import time
+import uuid
+
+from sqlalchemy import create_engine, exc, insert, select
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.orm import selectinload
+
+import applytrack.db.models  # noqa: F401
+from applytrack.core.config import settings
+from applytrack.db.base import Base
+from applytrack.db.models import ActivityEvent, AIOutput, Application, Company, JobPosting, User
+from applytrack.db.models.activity_event import ActivityEventType
+from applytrack.db.models.ai_output import AIOutputKind
+from applytrack.db.sqlite import configure_sqlite
+
+APPLICATIONS = 500
+
+
+def _writer(path: str, tuned: bool, app_ids: list[str], seconds: float, results) -> None:
+    settings.sqlite_tuning = tuned
+    engine = create_engine(f"sqlite:///{path}")
+    configure_sqlite(engine)
+    writes = locked = 0
+    deadline = time.monotonic() + seconds
+    i = 0
+    while time.monotonic() < deadline:
+        app_id = app_ids[i % len(app_ids)]
+        i += 1
+        try:
+            with engine.begin() as conn:
+                conn.execute(
+                    insert(AIOutput).values(
+                        id=str(uuid.uuid4()),
+                        application_id=app_id,
+                        kind=AIOutputKind.match,
+                        input_hash="bench",
+                        output_json={"match_score": i % 100, "notes": "x" * 2000},
+                        model="mock",
+                        latency_seconds=0.1,
+                    )
+                )
+                conn.execute(
+                    insert(ActivityEvent).values(
+                        id=str(uuid.uuid4()),
+                        application_id=app_id,
+                        type=ActivityEventType.ai_ready,
+                        payload_json={"kind": "match"},
+                    )
+                )
+            writes += 1
+        except exc.OperationalError:
+            locked += 1
+    engine.dispose()
+    results.put((writes, locked))
+
+
+async def _seed(path: str) -> tuple[str, list[str]]:
+    engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        user_id = str(uuid.uuid4())
+        await conn.execute(
+            insert(User).values(id=user_id, email="bench@example.com", password_hash="x")
+        )
+        companies, postings, apps = [], [], []
+        for i in range(APPLICATIONS):
+            company_id, posting_id = str(uuid.uuid4()), str(uuid.uuid4())
+            companies.append({"id": company_id, "user_id": user_id, "name": f"Company {i}"})
+            postings.append({"id": posting_id, "company_id": company_id, "title": f"Role {i}"})
+            apps.append({"id": str(uuid.uuid4()), "user_id": user_id, "job_posting_id": posting_id})
+        await conn.execute(insert(Company), companies)
+        await conn.execute(insert(JobPosting), postings)
+        await conn.execute(insert(Application), apps)
+    await engine.dispose()
+    return user_id, [a["id"] for a in apps]
+
+
+async def _reader(path: str, user_id: str, seconds: float) -> list[float]:
+    engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+    configure_sqlite(engine.sync_engine)
+    stmt = (
+        select(Application)
+        .where(Application.user_id == user_id)
+        .options(selectinload(Application.job_posting).selectinload(JobPosting.company))
+        .order_by(Application.updated_at.desc(), Application.id.desc())
+        .limit(50)
+    )
+    samples = []
+    deadline = time.monotonic() + seconds
+    while time.monotonic() < deadline:
+        start = time.perf_counter()
+        async with engine.connect() as conn:
+            (await conn.execute(stmt)).all()
+        samples.append(time.perf_counter() - start)
+    await engine.dispose()
+    return samples
+
+
+async def _run_mode(tuned: bool, workers: int, seconds: float) -> tuple:
+    settings.sqlite_tuning = tuned
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "bench.db")
+        user_id, app_ids = await _seed(path)
+
+        ctx = multiprocessing.get_context("spawn")
+        results = ctx.Queue()
+        procs = [
+            ctx.Process(target=_writer, args=(path, tuned, app_ids, seconds, results))
+            for _ in range(workers)
+        ]
+        for proc in procs:
+            proc.start()
+        samples = await _reader(path, user_id, seconds)
+        totals = [results.get() for _ in procs]
+        for proc in procs:
+            proc.join()
+
+    writes = sum(w for w, _ in totals)
+    locked = sum(lk for _, lk in totals)
+    ordered = sorted(samples)
+    p99 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+    return len(samples), statistics.median(samples) * 1000, p99 * 1000, writes / seconds, locked
+
+
+async def run(workers: int, seconds: float) -> None:
+    print(f"{workers} writer processes, {seconds:.0f}s per mode")
+    print(
+        f"{'mode':>8}  {'reads':>6}  {'read p50 (ms)':>14}  {'read p99 (ms)':>14}"
+        f"  {'writes/s':>9}  {'locked':>6}"
+    )
+    for name, tuned in (("default", False), ("wal", True)):
+        reads, p50, p99, rate, locked = await _run_mode(tuned, workers, seconds)
+        print(f"{name:>8}  {reads:>6}  {p50:>14.2f}  {p99:>14.2f}  {rate:>9.1f}  {locked:>6}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--seconds", type=float, default=5.0)
+    args = parser.parse_args()
+    asyncio.run(run(args.workers, args.seconds))
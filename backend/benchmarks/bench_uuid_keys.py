@@ -0,0 +1,100 @@
+"""Primary-key benchmark: text UUIDs vs 16-byte UUIDs, random vs time-ordered.
+
+Builds an ``applications``-shaped table (UUID primary key, two UUID foreign
+keys, the list index on ``(user_id, updated_at, id)``) in a throwaway SQLite
+database per scheme, inserts rows in batches and reports insert throughput
+plus the on-disk size of the table and its indexes (from ``dbstat``).
+
+Run with:  python benchmarks/bench_uuid_keys.py [--rows 200000] [--batch 1000]
+"""
+
+import argparse
+import os
+import sqlite3
+import tempfile
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import Column, DateTime, Index, MetaData, String, Table, create_engine, insert
+
+from applytrack.db.types import UUIDKey, uuid7
+
+USERS = 50
+SCHEMES = (
+    ("text uuid4", String, uuid.uuid4),
+    ("blob uuid4", UUIDKey, uuid.uuid4),
+    ("text uuid7", String, uuid7),
+    ("blob uuid7", UUIDKey, uuid7),
+)
+
+
+def _table(key_type) -> Table:
+    table = Table(
+        "applications",
+        MetaData(),
+        Column("id", key_type, primary_key=True),
+        Column("user_id", key_type, nullable=False),
+        Column("job_posting_id", key_type, nullable=False, index=True),
+        Column("updated_at", DateTime(timezone=True), nullable=False),
+    )
+    Index("ix_applications_user_updated", table.c.user_id, table.c.updated_at, table.c.id)
+    return table
+
+
+def _sizes(path: str) -> dict[str, int]:
+    with sqlite3.connect(path) as conn:
+        rows = conn.execute("SELECT name, SUM(pgsize) FROM dbstat GROUP BY name").fetchall()
+    return dict(rows)
+
+
+def _run(key_type, make_id, rows: int, batch: int) -> tuple[float, dict[str, int]]:
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "bench.db")
+        engine = create_engine(f"sqlite:///{path}")
+        table = _table(key_type)
+        table.metadata.create_all(engine)
+
+        users = [str(uuid.uuid4()) for _ in range(USERS)]
+        start_ts = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        elapsed = 0.0
+        for offset in range(0, rows, batch):
+            values = [
+                {
+                    "id": str(make_id()),
+                    "user_id": users[i % USERS],
+                    "job_posting_id": str(make_id()),
+                    "updated_at": start_ts + timedelta(seconds=i),
+                }
+                for i in range(offset, min(offset + batch, rows))
+            ]
+            start = time.perf_counter()
+            with engine.begin() as conn:
+                conn.execute(insert(table), values)
+            elapsed += time.perf_counter() - start
+        engine.dispose()
+        return rows / elapsed, _sizes(path)
+
+
+def run(rows: int, batch: int) -> None:
+    print(f"{rows} rows, batches of {batch}; sizes in KiB")
+    print(
+        f"{'scheme':>11}  {'rows/s':>9}  {'table+pk':>9}  {'ix_user_updated':>15}"
+        f"  {'ix_job_posting':>14}"
+    )
+    for name, key_type, make_id in SCHEMES:
+        rate, sizes = _run(key_type, make_id, rows, batch)
+        table_bytes = sizes.get("applications", 0) + sizes.get("sqlite_autoindex_applications_1", 0)
+        print(
+            f"{name:>11}  {rate:>9.0f}  {table_bytes / 1024:>9.0f}"
+            f"  {sizes.get('ix_applications_user_updated', 0) / 1024:>15.0f}"
+            f"  {sizes.get('ix_applications_job_posting_id', 0) / 1024:>14.0f}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--batch", type=int, default=1000)
+    args = parser.parse_args()
+    run(args.rows, args.batch)
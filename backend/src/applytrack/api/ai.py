@@ -1,35 +1,47 @@
-"""AI endpoints: trigger background tasks, poll status."""
+"""AI endpoints: trigger background tasks, poll status.
+
+The Celery app and the task module (OpenAI SDK, the worker's sync engine)
+are imported on the first AI request rather than at API startup.  A trigger
+for a job that is already running returns that job's task id (see
+``services.ai.inflight``).  Triggered with ``stream=true``, a task's output
+can be followed live at ``/tasks/{task_id}/stream`` (``services.ai.stream``)
+by the user who owns the application.
+"""
 
 from typing import Annotated
 
-from celery.result import AsyncResult
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
 from applytrack.api.deps import get_current_user
+from applytrack.db.models.activity_event import ActivityEvent, ActivityEventType
+from applytrack.db.models.ai_output import AIOutputKind
 from applytrack.db.models.application import Application
-from applytrack.db.models.user import User
+from applytrack.db.models.profile import Profile
 from applytrack.db.session import get_db
 from applytrack.schemas.ai_schemas import AITaskResponse, AITaskStatusResponse
-from applytrack.workers.celery_app import celery_app
-from applytrack.workers.tasks_ai import (
-    task_interview_prep,
-    task_match,
-    task_outreach,
-    task_parse_jd,
-    task_tailor_cv,
-)
+from applytrack.schemas.auth import CurrentUser
+from applytrack.services.activity import record_event
+from applytrack.services.ai.cache import hash_inputs, profile_dict
+from applytrack.services.ai.inflight import claim_task, release_task
+from applytrack.services.ai.stream import relay_events
 
 router = APIRouter()
 
 
-async def _verify_ownership(application_id: str, user: User, db: AsyncSession) -> Application:
+async def _verify_ownership(
+    application_id: str, user: CurrentUser, db: AsyncSession
+) -> Application:
     result = await db.execute(
-        select(Application).where(
+        select(Application)
+        .where(
             Application.id == application_id,
             Application.user_id == user.id,
         )
+        .options(selectinload(Application.job_posting))
     )
     app = result.scalars().first()
     if not app:
@@ -37,64 +49,117 @@ async def _verify_ownership(application_id: str, user: User, db: AsyncSession) -
     return app
 
 
-def _submit(task_func, application_id: str) -> AITaskResponse:
-    result = task_func.delay(application_id)
+async def _input_hash(db: AsyncSession, app: Application, kind: AIOutputKind) -> str:
+    """Same fingerprint the worker computes, so both sides agree on the job."""
+    jd_text = (app.job_posting.description_raw if app.job_posting else None) or ""
+    profile_data = {}
+    if kind is not AIOutputKind.parse_jd:  # every other kind reads the profile
+        result = await db.execute(select(Profile).where(Profile.user_id == app.user_id))
+        profile = result.scalars().first()
+        if profile:
+            profile_data = profile_dict(profile)
+    return hash_inputs(jd_text, profile_data)
+
+
+async def _submit(
+    db: AsyncSession,
+    app: Application,
+    kind: AIOutputKind,
+    force: bool = False,
+    stream: bool = False,
+) -> AITaskResponse:
+    input_hash = await _input_hash(db, app, kind)
+    task_id, is_new = await claim_task(app.id, kind.value, input_hash, force)
+    if not is_new:
+        return AITaskResponse(task_id=task_id, status="in_progress")
+
+    from applytrack.workers import tasks_ai
+
+    task = getattr(tasks_ai, f"task_{kind.value}")
+    # stamped before the enqueue so it precedes the task's own events, but only
+    # committed once the broker has accepted the task
+    event = record_event(
+        db, app.id, ActivityEventType.ai_requested, kind=kind.value, task_id=task_id
+    )
+    event.task_id = task_id  # indexed, for the stream's ownership check
+    try:
+        result = task.apply_async((app.id,), {"force": force, "stream": stream}, task_id=task_id)
+    except Exception:
+        # free the slot, or every trigger would be told this job is running
+        await release_task(app.id, kind.value, input_hash, force, task_id)
+        await db.rollback()
+        raise
+    await db.commit()
     return AITaskResponse(task_id=result.id, status="submitted")
 
 
 @router.post("/parse-jd/{application_id}", response_model=AITaskResponse)
 async def trigger_parse_jd(
     application_id: str,
-    current_user: Annotated[User, Depends(get_current_user)],
+    current_user: Annotated[CurrentUser, Depends(get_current_user)],
     db: Annotated[AsyncSession, Depends(get_db)],
+    force: bool = Query(False, description="Skip the result cache"),
+    stream: bool = Query(False, description="Stream output to /tasks/{task_id}/stream"),
 ):
-    await _verify_ownership(application_id, current_user, db)
-    return _submit(task_parse_jd, application_id)
+    app = await _verify_ownership(application_id, current_user, db)
+    return await _submit(db, app, AIOutputKind.parse_jd, force, stream)
 
 
 @router.post("/match/{application_id}", response_model=AITaskResponse)
 async def trigger_match(
     application_id: str,
-    current_user: Annotated[User, Depends(get_current_user)],
+    current_user: Annotated[CurrentUser, Depends(get_current_user)],
     db: Annotated[AsyncSession, Depends(get_db)],
+    force: bool = Query(False, description="Skip the result cache"),
+    stream: bool = Query(False, description="Stream output to /tasks/{task_id}/stream"),
 ):
-    await _verify_ownership(application_id, current_user, db)
-    return _submit(task_match, application_id)
+    app = await _verify_ownership(application_id, current_user, db)
+    return await _submit(db, app, AIOutputKind.match, force, stream)
 
 
 @router.post("/tailor-cv/{application_id}", response_model=AITaskResponse)
 async def trigger_tailor_cv(
     application_id: str,
-    current_user: Annotated[User, Depends(get_current_user)],
+    current_user: Annotated[CurrentUser, Depends(get_current_user)],
     db: Annotated[AsyncSession, Depends(get_db)],
+    force: bool = Query(False, description="Skip the result cache"),
+    stream: bool = Query(False, description="Stream output to /tasks/{task_id}/stream"),
 ):
-    await _verify_ownership(application_id, current_user, db)
-    return _submit(task_tailor_cv, application_id)
+    app = await _verify_ownership(application_id, current_user, db)
+    return await _submit(db, app, AIOutputKind.tailor_cv, force, stream)
 
 
 @router.post("/outreach/{application_id}", response_model=AITaskResponse)
 async def trigger_outreach(
     application_id: str,
-    current_user: Annotated[User, Depends(get_current_user)],
+    current_user: Annotated[CurrentUser, Depends(get_current_user)],
     db: Annotated[AsyncSession, Depends(get_db)],
+    force: bool = Query(False, description="Skip the result cache"),
+    stream: bool = Query(False, description="Stream output to /tasks/{task_id}/stream"),
 ):
-    await _verify_ownership(application_id, current_user, db)
-    return _submit(task_outreach, application_id)
+    app = await _verify_ownership(application_id, current_user, db)
+    return await _submit(db, app, AIOutputKind.outreach, force, stream)
 
 
 @router.post("/interview-prep/{application_id}", response_model=AITaskResponse)
 async def trigger_interview_prep(
     application_id: str,
-    current_user: Annotated[User, Depends(get_current_user)],
+    current_user: Annotated[CurrentUser, Depends(get_current_user)],
     db: Annotated[AsyncSession, Depends(get_db)],
+    force: bool = Query(False, description="Skip the result cache"),
+    stream: bool = Query(False, description="Stream output to /tasks/{task_id}/stream"),
 ):
-    await _verify_ownership(application_id, current_user, db)
-    return _submit(task_interview_prep, application_id)
+    app = await _verify_ownership(application_id, current_user, db)
+    return await _submit(db, app, AIOutputKind.interview_prep, force, stream)
 
 
 @router.get("/tasks/{task_id}", response_model=AITaskStatusResponse)
 async def poll_task(task_id: str):
     """Check the status of a Celery task.  Frontend polls this until done."""
+    from celery.result import AsyncResult
+
+    from applytrack.workers.celery_app import celery_app
+
     result = AsyncResult(task_id, app=celery_app)
     response = AITaskStatusResponse(
         task_id=task_id,
@@ -106,3 +171,37 @@ async def poll_task(task_id: str):
         except Exception:
             response.result = {"error": "Task failed"}
     return response
+
+
+@router.get("/tasks/{task_id}/stream")
+async def stream_task(
+    task_id: str,
+    current_user: Annotated[CurrentUser, Depends(get_current_user)],
+    db: Annotated[AsyncSession, Depends(get_db)],
+):
+    """Server-Sent Events for a task triggered with ``stream=true``.
+
+    ``partial`` events carry the output parsed so far; the stream ends with a
+    ``done`` event holding the validated result, an ``error`` event, or a
+    ``timeout`` event if the task is still running after the stream's limit.
+    """
+    # the ai_requested event recorded when the task was accepted ties it to
+    # an application, and so to its owner
+    owned = await db.scalar(
+        select(ActivityEvent.id)
+        .join(Application, ActivityEvent.application_id == Application.id)
+        .where(
+            Application.user_id == current_user.id,
+            ActivityEvent.task_id == task_id,
+        )
+        .limit(1)
+    )
+    if owned is None:
+        raise HTTPException(status_code=404, detail="Task not found")
+    # the stream may stay open for minutes; don't hold a pooled connection for it
+    await db.close()
+    return StreamingResponse(
+        relay_events(task_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
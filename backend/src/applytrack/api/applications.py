@@ -2,23 +2,52 @@
 
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy import select
+from fastapi import APIRouter, Body, Depends, HTTPException, Query, Request, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, StreamingResponse
+from sqlalchemy import func, literal, select, tuple_, update
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import defer, load_only, selectinload
 
-from applytrack.api.deps import get_current_user
+from applytrack.api.deps import get_current_user, get_read_db
+from applytrack.api.etag import check_etag, make_etag
+from applytrack.api.pagination import (
+    DEFAULT_PAGE_SIZE,
+    MAX_PAGE_SIZE,
+    decode_cursor,
+    encode_cursor,
+)
+from applytrack.api.stats import invalidate_stats
+from applytrack.db.models.activity_event import ActivityEvent, ActivityEventType
 from applytrack.db.models.ai_output import AIOutput
-from applytrack.db.models.application import Application
-from applytrack.db.models.company import Company
+from applytrack.db.models.application import Application, ApplicationStatus
 from applytrack.db.models.job_posting import JobPosting
-from applytrack.db.models.user import User
+from applytrack.db.search import apply_search
 from applytrack.db.session import get_db
+from applytrack.db.upsert import get_or_create_company
+from applytrack.schemas.activity import ActivityPage
 from applytrack.schemas.ai_schemas import AIOutputResponse
 from applytrack.schemas.application import (
+    ApplicationBulkUpdateItem,
+    ApplicationBulkUpdateResult,
     ApplicationCreate,
+    ApplicationPage,
     ApplicationResponse,
+    ApplicationSummary,
     ApplicationUpdate,
+    BoardColumn,
+    BoardResponse,
+    ImportResult,
+    JobPostingSummary,
+)
+from applytrack.schemas.auth import CurrentUser
+from applytrack.services.activity import record_event
+from applytrack.services.exporter import MEDIA_TYPES, ExportFormat, export_lines
+from applytrack.services.importer import (
+    ApplicationImporter,
+    ImportFormat,
+    iter_lines,
+    iter_records,
 )
 
 router = APIRouter()
@@ -33,90 +62,267 @@ def _app_query(user_id: str):
     )
 
 
-@router.get("/", response_model=list[ApplicationResponse])
+SUMMARY_FIELDS = tuple(ApplicationSummary.model_fields)
+
+
+def _parse_fields(fields: str | None) -> list[str] | None:
+    """Validate a ``fields=a,b,c`` sparse fieldset against the summary schema."""
+    if not fields:
+        return None
+    requested = {f.strip() for f in fields.split(",") if f.strip()}
+    unknown = requested.difference(SUMMARY_FIELDS)
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown fields: {', '.join(sorted(unknown))}")
+    return [f for f in SUMMARY_FIELDS if f in requested]
+
+
+def _summary_query(user_id: str, fields: list[str] | None = None):
+    """List/board query: ``Text`` bodies are never loaded.
+
+    With *fields*, only those columns (plus the keyset columns) are selected and
+    the job posting is skipped unless asked for.  ``raiseload`` turns an
+    accidental access to an unloaded column into an error instead of a lazy
+    load per row.
+    """
+    stmt = select(Application).where(Application.user_id == user_id)
+    posting = selectinload(Application.job_posting).options(
+        defer(JobPosting.description_raw, raiseload=True),
+        selectinload(JobPosting.company),
+    )
+    if fields is None:
+        return stmt.options(defer(Application.notes, raiseload=True), posting)
+
+    columns = {"id", "updated_at", *fields}
+    if "job_posting" in columns:
+        columns.discard("job_posting")
+        columns.add("job_posting_id")
+        stmt = stmt.options(posting)
+    return stmt.options(
+        load_only(*(getattr(Application, c) for c in sorted(columns)), raiseload=True)
+    )
+
+
+async def _list_etag(db: AsyncSession, user_id: str) -> str:
+    """Validator for every list/board view of the user's applications.
+
+    Any insert or update moves ``max(updated_at)`` and any delete changes the
+    count; both come straight off ``ix_applications_user_updated``.
+    """
+    result = await db.execute(
+        select(func.count(), func.max(Application.updated_at)).where(Application.user_id == user_id)
+    )
+    count, last_updated = result.one()
+    return make_etag(user_id, count, last_updated)
+
+
+def _sparse_item(app: Application, fields: list[str]) -> dict:
+    item = {f: getattr(app, f) for f in fields}
+    if item.get("job_posting") is not None:
+        item["job_posting"] = JobPostingSummary.model_validate(item["job_posting"])
+    return item
+
+
+@router.get("/", response_model=ApplicationPage)
 async def list_applications(
-    current_user: Annotated[User, Depends(get_current_user)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    request: Request,
+    response: Response,
+    current_user: Annotated[CurrentUser, Depends(get_current_user)],
+    db: Annotated[AsyncSession, Depends(get_read_db)],
     status: str | None = Query(None, description="Filter by status"),
     search: str | None = Query(None, description="Search company or role"),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE, description="Page size"),
+    cursor: str | None = Query(None, description="next_cursor from the previous page"),
+    fields: str | None = Query(
+        None, description="Comma-separated subset of ApplicationSummary fields to return"
+    ),
 ):
-    stmt = _app_query(current_user.id)
+    selected = _parse_fields(fields)
+    if not_modified := check_etag(request, response, await _list_etag(db, current_user.id)):
+        return not_modified
+
+    stmt = _summary_query(current_user.id, selected)
 
     if status:
         stmt = stmt.where(Application.status == status)
 
-    result = await db.execute(stmt.order_by(Application.updated_at.desc()))
-    apps = result.scalars().all()
+    if search:
+        stmt = apply_search(stmt, search, db.get_bind().dialect.name)
+
+    if cursor:
+        updated_at, app_id = decode_cursor(cursor)
+        stmt = stmt.where(
+            tuple_(Application.updated_at, Application.id)
+            < tuple_(updated_at, literal(app_id, Application.id.type))
+        )
+
+    # fetch one extra row to learn whether another page exists
+    stmt = stmt.order_by(Application.updated_at.desc(), Application.id.desc()).limit(limit + 1)
+    apps = (await db.execute(stmt)).scalars().all()
 
+    next_cursor = None
+    if len(apps) > limit:
+        apps = apps[:limit]
+        next_cursor = encode_cursor(apps[-1].updated_at, apps[-1].id)
+
+    if selected is not None:
+        # partial items don't fit ApplicationPage, so serialize them directly
+        items = [_sparse_item(app, selected) for app in apps]
+        return JSONResponse(
+            jsonable_encoder({"items": items, "next_cursor": next_cursor}),
+            headers=dict(response.headers),
+        )
+    return ApplicationPage(items=apps, next_cursor=next_cursor)
+
+
+@router.get("/board", response_model=BoardResponse)
+async def read_board(
+    request: Request,
+    response: Response,
+    current_user: Annotated[CurrentUser, Depends(get_current_user)],
+    db: Annotated[AsyncSession, Depends(get_read_db)],
+    per_column: int = Query(20, ge=1, le=MAX_PAGE_SIZE, description="Cards per column"),
+    search: str | None = Query(None, description="Search company or role"),
+):
+    """Per-status counts plus the first *per_column* cards of every column."""
+    if not_modified := check_etag(request, response, await _list_etag(db, current_user.id)):
+        return not_modified
+
+    dialect = db.get_bind().dialect.name
+
+    counts_stmt = (
+        select(Application.status, func.count())
+        .where(Application.user_id == current_user.id)
+        .group_by(Application.status)
+    )
     if search:
-        q = search.lower()
-        apps = [
-            a
-            for a in apps
-            if q in (a.job_posting.title or "").lower()
-            or q
-            in (
-                a.job_posting.company.name if a.job_posting and a.job_posting.company else ""
-            ).lower()
-        ]
+        counts_stmt = apply_search(counts_stmt, search, dialect)
+    counts = dict((await db.execute(counts_stmt)).all())
 
-    return apps
+    # rank cards inside each column, then hydrate only the top of each
+    rank = (
+        func.row_number()
+        .over(
+            partition_by=Application.status,
+            order_by=(Application.updated_at.desc(), Application.id.desc()),
+        )
+        .label("rank")
+    )
+    ranked = select(Application.id, rank).where(Application.user_id == current_user.id)
+    if search:
+        ranked = apply_search(ranked, search, dialect)
+    ranked = ranked.subquery()
+
+    stmt = (
+        _summary_query(current_user.id)
+        .add_columns(ranked.c.rank)
+        .join(ranked, ranked.c.id == Application.id)
+        .where(ranked.c.rank <= per_column)
+    )
+    rows = (await db.execute(stmt)).all()
+
+    # at most per_column rows per status, so ordering them here is cheap
+    by_status: dict[ApplicationStatus, list[Application]] = {s: [] for s in ApplicationStatus}
+    for app, _ in sorted(rows, key=lambda row: row.rank):
+        by_status[app.status].append(app)
+
+    columns = []
+    for status, items in by_status.items():
+        count = counts.get(status, 0)
+        next_cursor = None
+        if count > len(items):
+            next_cursor = encode_cursor(items[-1].updated_at, items[-1].id)
+        columns.append(
+            BoardColumn(status=status, count=count, items=items, next_cursor=next_cursor)
+        )
+    return BoardResponse(columns=columns)
+
+
+@router.get("/export")
+async def export_applications(
+    current_user: Annotated[CurrentUser, Depends(get_current_user)],
+    db: Annotated[AsyncSession, Depends(get_read_db)],
+    fmt: ExportFormat = Query(ExportFormat.ndjson, alias="format", description="ndjson or csv"),
+):
+    """Every application with its posting, company and latest AI output per kind.
+
+    Rows are streamed from a server-side cursor as they are serialized.
+    """
+    return StreamingResponse(
+        export_lines(db, current_user.id, fmt),
+        media_type=MEDIA_TYPES[fmt],
+        headers={"Content-Disposition": f'attachment; filename="applications.{fmt.value}"'},
+    )
 
 
 @router.post("/", response_model=ApplicationResponse, status_code=201)
 async def create_application(
     body: ApplicationCreate,
-    current_user: Annotated[User, Depends(get_current_user)],
+    current_user: Annotated[CurrentUser, Depends(get_current_user)],
     db: Annotated[AsyncSession, Depends(get_db)],
 ):
-    # find or create company (scoped to user)
-    result = await db.execute(
-        select(Company).where(
-            Company.name == body.company_name,
-            Company.user_id == current_user.id,
-        )
-    )
-    company = result.scalars().first()
-    if not company:
-        company = Company(
-            name=body.company_name,
-            user_id=current_user.id,
-        )
-        db.add(company)
-        await db.flush()
+    company = await get_or_create_company(db, current_user.id, body.company_name)
 
-    # create job posting
+    # posting + application go out in a single flush at commit
     posting = JobPosting(
-        company_id=company.id,
+        company=company,
         title=body.role_title,
         posting_url=body.job_url,
         description_raw=body.job_description,
     )
-    db.add(posting)
-    await db.flush()
-
-    # create application
     application = Application(
         user_id=current_user.id,
-        job_posting_id=posting.id,
+        job_posting=posting,
         status=body.status,
         priority=body.priority,
         notes=body.notes,
     )
     db.add(application)
     await db.commit()
+    invalidate_stats(current_user.id)
+
+    # every response field is already on the in-memory objects
+    return application
+
+
+@router.post("/import", response_model=ImportResult)
+async def import_applications(
+    request: Request,
+    current_user: Annotated[CurrentUser, Depends(get_current_user)],
+    db: Annotated[AsyncSession, Depends(get_db)],
+    fmt: ImportFormat = Query(ImportFormat.csv, alias="format", description="csv or jsonl"),
+):
+    """Bulk-create applications from a raw CSV or JSON Lines request body.
 
-    # reload with relations
-    result = await db.execute(_app_query(current_user.id).where(Application.id == application.id))
-    return result.scalars().first()
+    Rows use the ``ApplicationCreate`` fields (CSV needs a header row).  The
+    body is consumed as a stream; invalid rows are skipped and reported.
+    """
+    importer = ApplicationImporter(db, current_user.id)
+    result = await importer.run(iter_records(iter_lines(request.stream()), fmt))
+    invalidate_stats(current_user.id)
+    return result
 
 
 @router.get("/{application_id}", response_model=ApplicationResponse)
 async def read_application(
     application_id: str,
-    current_user: Annotated[User, Depends(get_current_user)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    request: Request,
+    response: Response,
+    current_user: Annotated[CurrentUser, Depends(get_current_user)],
+    db: Annotated[AsyncSession, Depends(get_read_db)],
 ):
+    # job postings and companies are immutable, so the row's updated_at is enough
+    result = await db.execute(
+        select(Application.updated_at).where(
+            Application.id == application_id,
+            Application.user_id == current_user.id,
+        )
+    )
+    updated_at = result.scalar_one_or_none()
+    if updated_at is None:
+        raise HTTPException(status_code=404, detail="Application not found")
+    if not_modified := check_etag(request, response, make_etag(application_id, updated_at)):
+        return not_modified
+
     result = await db.execute(_app_query(current_user.id).where(Application.id == application_id))
     app = result.scalars().first()
     if not app:
@@ -128,7 +334,7 @@ async def read_application(
 async def update_application(
     application_id: str,
     body: ApplicationUpdate,
-    current_user: Annotated[User, Depends(get_current_user)],
+    current_user: Annotated[CurrentUser, Depends(get_current_user)],
     db: Annotated[AsyncSession, Depends(get_db)],
 ):
     result = await db.execute(_app_query(current_user.id).where(Application.id == application_id))
@@ -136,18 +342,110 @@ async def update_application(
     if not app:
         raise HTTPException(status_code=404, detail="Application not found")
 
-    for field, value in body.model_dump(exclude_unset=True).items():
+    changes = body.model_dump(exclude_unset=True)
+    if "status" in changes and changes["status"] != app.status:
+        record_event(
+            db,
+            app.id,
+            ActivityEventType.status_changed,
+            **{"from": app.status.value, "to": changes["status"].value},
+        )
+    if changes.get("notes") and changes["notes"] != app.notes:
+        record_event(db, app.id, ActivityEventType.note_added)
+
+    for field, value in changes.items():
         setattr(app, field, value)
 
     await db.commit()
-    await db.refresh(app)
+    invalidate_stats(current_user.id)
     return app
 
 
+@router.patch("/", response_model=list[ApplicationBulkUpdateResult])
+async def bulk_update_applications(
+    items: Annotated[list[ApplicationBulkUpdateItem], Body(min_length=1, max_length=MAX_PAGE_SIZE)],
+    current_user: Annotated[CurrentUser, Depends(get_current_user)],
+    db: Annotated[AsyncSession, Depends(get_db)],
+):
+    """Apply status/priority changes to many cards in one transaction.
+
+    Items sharing the same change set become a single
+    ``UPDATE ... WHERE id IN (...) AND user_id = ...``.  If any id is missing or
+    not owned by the caller, nothing is changed and the request 404s.
+    """
+    # later entries for the same id win, field by field
+    changes_by_id: dict[str, dict] = {}
+    for item in items:
+        changes_by_id.setdefault(item.id, {}).update(
+            item.model_dump(include={"status", "priority"}, exclude_none=True)
+        )
+
+    changes_by_id = {app_id: changes for app_id, changes in changes_by_id.items() if changes}
+
+    ids_by_changes: dict[tuple, list[str]] = {}
+    for app_id, changes in changes_by_id.items():
+        ids_by_changes.setdefault(tuple(sorted(changes.items())), []).append(app_id)
+
+    # the UPDATE can't return the old status, so read it first; locked on
+    # Postgres so a concurrent change can't slip in between
+    status_ids = [app_id for app_id, changes in changes_by_id.items() if "status" in changes]
+    previous_status = {}
+    if status_ids:
+        result = await db.execute(
+            select(Application.id, Application.status)
+            .where(Application.id.in_(status_ids), Application.user_id == current_user.id)
+            .with_for_update()
+        )
+        previous_status = dict(result.all())
+
+    returning = db.get_bind().dialect.update_returning
+    columns = (Application.id, Application.status, Application.priority, Application.updated_at)
+    rows = {}
+    for changes, ids in ids_by_changes.items():
+        stmt = (
+            update(Application)
+            .where(Application.id.in_(ids), Application.user_id == current_user.id)
+            .values(dict(changes))
+        )
+        if returning:
+            result = await db.execute(stmt.returning(*columns))
+            rows.update((row.id, row) for row in result)
+        else:
+            await db.execute(stmt)
+
+    if not returning:
+        result = await db.execute(
+            select(*columns).where(
+                Application.id.in_(changes_by_id), Application.user_id == current_user.id
+            )
+        )
+        rows.update((row.id, row) for row in result)
+
+    missing = [app_id for app_id in changes_by_id if app_id not in rows]
+    if missing:
+        await db.rollback()
+        raise HTTPException(status_code=404, detail=f"Applications not found: {', '.join(missing)}")
+
+    # like update_application: only rows whose status actually changed
+    for app_id in status_ids:
+        old, new = previous_status[app_id], changes_by_id[app_id]["status"]
+        if new != old:
+            record_event(
+                db,
+                app_id,
+                ActivityEventType.status_changed,
+                **{"from": old.value, "to": new.value},
+            )
+
+    await db.commit()
+    invalidate_stats(current_user.id)
+    return [ApplicationBulkUpdateResult.model_validate(rows[app_id]) for app_id in changes_by_id]
+
+
 @router.delete("/{application_id}", status_code=204)
 async def delete_application(
     application_id: str,
-    current_user: Annotated[User, Depends(get_current_user)],
+    current_user: Annotated[CurrentUser, Depends(get_current_user)],
     db: Annotated[AsyncSession, Depends(get_db)],
 ):
     result = await db.execute(
@@ -162,23 +460,34 @@ async def delete_application(
 
     await db.delete(app)
     await db.commit()
+    invalidate_stats(current_user.id)
 
 
 @router.get("/{application_id}/ai-outputs", response_model=list[AIOutputResponse])
 async def list_ai_outputs(
     application_id: str,
-    current_user: Annotated[User, Depends(get_current_user)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    request: Request,
+    response: Response,
+    current_user: Annotated[CurrentUser, Depends(get_current_user)],
+    db: Annotated[AsyncSession, Depends(get_read_db)],
 ):
-    # verify access
+    # verify access and build the validator in one round trip; outputs are
+    # append-only, so their count and newest created_at identify the list
     result = await db.execute(
-        select(Application).where(
+        select(func.count(AIOutput.id), func.max(AIOutput.created_at))
+        .select_from(Application)
+        .outerjoin(AIOutput, AIOutput.application_id == Application.id)
+        .where(
             Application.id == application_id,
             Application.user_id == current_user.id,
         )
+        .group_by(Application.id)
     )
-    if not result.scalars().first():
+    row = result.one_or_none()
+    if row is None:
         raise HTTPException(status_code=404, detail="Application not found")
+    if not_modified := check_etag(request, response, make_etag(application_id, *row)):
+        return not_modified
 
     result = await db.execute(
         select(AIOutput)
@@ -186,3 +495,37 @@ async def list_ai_outputs(
         .order_by(AIOutput.created_at.desc())
     )
     return result.scalars().all()
+
+
+@router.get("/{application_id}/timeline", response_model=ActivityPage)
+async def read_timeline(
+    application_id: str,
+    current_user: Annotated[CurrentUser, Depends(get_current_user)],
+    db: Annotated[AsyncSession, Depends(get_read_db)],
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE, description="Page size"),
+    cursor: str | None = Query(None, description="next_cursor from the previous page"),
+):
+    result = await db.execute(
+        select(Application.id).where(
+            Application.id == application_id,
+            Application.user_id == current_user.id,
+        )
+    )
+    if result.first() is None:
+        raise HTTPException(status_code=404, detail="Application not found")
+
+    stmt = select(ActivityEvent).where(ActivityEvent.application_id == application_id)
+    if cursor:
+        created_at, event_id = decode_cursor(cursor)
+        stmt = stmt.where(
+            tuple_(ActivityEvent.created_at, ActivityEvent.id)
+            < tuple_(created_at, literal(event_id, ActivityEvent.id.type))
+        )
+    stmt = stmt.order_by(ActivityEvent.created_at.desc(), ActivityEvent.id.desc()).limit(limit + 1)
+    events = (await db.execute(stmt)).scalars().all()
+
+    next_cursor = None
+    if len(events) > limit:
+        events = events[:limit]
+        next_cursor = encode_cursor(events[-1].created_at, events[-1].id)
+    return ActivityPage(items=events, next_cursor=next_cursor)
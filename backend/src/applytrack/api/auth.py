@@ -9,11 +9,15 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from applytrack.api.deps import get_current_user
 from applytrack.core.config import settings
-from applytrack.core.security import create_access_token, hash_password, verify_password
+from applytrack.core.security import (
+    create_access_token,
+    hash_password_async,
+    verify_password_async,
+)
 from applytrack.db.models.profile import Profile
 from applytrack.db.models.user import User
 from applytrack.db.session import get_db
-from applytrack.schemas.auth import Token, UserCreate, UserResponse
+from applytrack.schemas.auth import CurrentUser, Token, UserCreate, UserResponse
 
 router = APIRouter()
 
@@ -33,7 +37,7 @@ async def register(body: UserCreate, db: Annotated[AsyncSession, Depends(get_db)
             detail="An account with this email already exists",
         )
 
-    user = User(email=body.email, password_hash=hash_password(body.password))
+    user = User(email=body.email, password_hash=await hash_password_async(body.password))
     db.add(user)
     await db.flush()
 
@@ -52,8 +56,10 @@ async def login(
     """OAuth2-compatible login.  The 'username' field is treated as the email."""
     result = await db.execute(select(User).where(User.email == form_data.username))
     user = result.scalars().first()
+    # end the read so the pooled connection isn't held while argon2 runs
+    await db.commit()
 
-    if not user or not verify_password(form_data.password, user.password_hash):
+    if not user or not await verify_password_async(form_data.password, user.password_hash):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
@@ -65,5 +71,5 @@ async def login(
 
 
 @router.get("/me", response_model=UserResponse)
-async def whoami(current_user: Annotated[User, Depends(get_current_user)]):
+async def whoami(current_user: Annotated[CurrentUser, Depends(get_current_user)]):
     return current_user
@@ -6,10 +6,9 @@ from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from applytrack.api.deps import get_current_user
+from applytrack.api.deps import get_current_user, get_read_db
 from applytrack.db.models.company import Company
-from applytrack.db.models.user import User
-from applytrack.db.session import get_db
+from applytrack.schemas.auth import CurrentUser
 from applytrack.schemas.company import CompanyResponse
 
 router = APIRouter()
@@ -17,8 +16,8 @@ router = APIRouter()
 
 @router.get("/", response_model=list[CompanyResponse])
 async def list_companies(
-    current_user: Annotated[User, Depends(get_current_user)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    current_user: Annotated[CurrentUser, Depends(get_current_user)],
+    db: Annotated[AsyncSession, Depends(get_read_db)],
 ):
     result = await db.execute(
         select(Company).where(Company.user_id == current_user.id).order_by(Company.name)
@@ -29,8 +28,8 @@ async def list_companies(
 @router.get("/{company_id}", response_model=CompanyResponse)
 async def read_company(
     company_id: str,
-    current_user: Annotated[User, Depends(get_current_user)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    current_user: Annotated[CurrentUser, Depends(get_current_user)],
+    db: Annotated[AsyncSession, Depends(get_read_db)],
 ):
     result = await db.execute(
         select(Company).where(
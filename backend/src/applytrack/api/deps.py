@@ -1,27 +1,106 @@
 """Dependency injection helpers for FastAPI routes."""
 
+import logging
 from typing import Annotated
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError, jwt
 from pydantic import ValidationError
-from sqlalchemy import select
+from sqlalchemy import event, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import ORMExecuteState, Session
 
+from applytrack.core.cache import TTLCache
 from applytrack.core.config import settings
 from applytrack.db.models.user import User
-from applytrack.db.session import get_db
-from applytrack.schemas.auth import TokenPayload
+from applytrack.db.session import ReadSessionLocal, engine, get_db, read_engine
+from applytrack.schemas.auth import CurrentUser, TokenPayload
+
+log = logging.getLogger(__name__)
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login")
 
+# token subject -> CurrentUser, so authenticated requests skip the users lookup.
+# With USER_CACHE_REDIS the entries are shared by every API worker; either way
+# account changes must call invalidate_user().
+user_cache = TTLCache(maxsize=settings.user_cache_size, ttl=settings.user_cache_ttl_seconds)
+_redis = None
+
+
+def _redis_client():
+    global _redis
+    if _redis is None:
+        # imported here so deployments without Redis tiers don't pay for it at startup
+        from redis.asyncio import Redis
+
+        _redis = Redis.from_url(settings.redis_url)
+    return _redis
+
+
+def _redis_tier():
+    if not (settings.user_cache_redis and user_cache.enabled):
+        return None
+    return _redis_client()
+
+
+def _redis_key(user_id: str) -> str:
+    return f"applytrack:user:{user_id}"
+
+
+async def _cached_user(user_id: str) -> CurrentUser | None:
+    user = user_cache.get(user_id)
+    if user is not None:
+        return user
+    redis = _redis_tier()
+    if redis is None:
+        return None
+    from redis.exceptions import RedisError
+
+    try:
+        raw = await redis.get(_redis_key(user_id))
+    except RedisError:
+        log.warning("user cache: Redis unavailable, falling back to the database")
+        return None
+    if raw is None:
+        return None
+    user = CurrentUser.model_validate_json(raw)
+    user_cache.set(user_id, user)
+    return user
+
+
+async def _cache_user(user: CurrentUser) -> None:
+    user_cache.set(user.id, user)
+    redis = _redis_tier()
+    if redis is None:
+        return
+    from redis.exceptions import RedisError
+
+    try:
+        await redis.set(_redis_key(user.id), user.model_dump_json(), ex=max(1, int(user_cache.ttl)))
+    except RedisError:
+        log.warning("user cache: Redis unavailable, entry kept in process only")
+
+
+async def invalidate_user(user_id: str) -> None:
+    """Forget a cached identity after the account is changed or deleted."""
+    user_cache.delete(user_id)
+    redis = _redis_tier()
+    if redis is None:
+        return
+    from redis.exceptions import RedisError
+
+    try:
+        await redis.delete(_redis_key(user_id))
+    except RedisError:
+        log.warning("user cache: Redis unavailable, %s may stay cached until expiry", user_id)
+
 
 async def get_current_user(
     token: Annotated[str, Depends(oauth2_scheme)],
     db: Annotated[AsyncSession, Depends(get_db)],
-) -> User:
-    """Decode JWT and return the authenticated user, or 401."""
+) -> CurrentUser:
+    """Decode JWT and return the authenticated user's identity, or 401."""
     bad_credentials = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
@@ -35,9 +114,106 @@ async def get_current_user(
 
     if token_data.sub is None:
         raise bad_credentials
+    # lets the write listeners below attribute this session's changes
+    db.info["user_id"] = token_data.sub
+
+    user = await _cached_user(token_data.sub)
+    if user is not None:
+        return user
 
-    result = await db.execute(select(User).where(User.id == token_data.sub))
-    user = result.scalars().first()
-    if user is None:
+    result = await db.execute(select(User.id, User.email).where(User.id == token_data.sub))
+    row = result.first()
+    if row is None:
         raise bad_credentials
+    user = CurrentUser(id=row.id, email=row.email)
+    await _cache_user(user)
     return user
+
+
+# user_id -> True while that user's reads must stay on the primary.  With a
+# replica and READ_YOUR_WRITES_REDIS the marker is also stored in Redis, so the
+# user's next request finds it whichever API worker serves it; this copy spares
+# the round trip when it is the same one.
+recent_writes = TTLCache(maxsize=100_000, ttl=settings.read_your_writes_seconds)
+
+
+def _writes_tier():
+    if read_engine is engine or not settings.read_your_writes_redis:
+        return None
+    return _redis_client()
+
+
+def _writes_key(user_id: str) -> str:
+    return f"applytrack:wrote:{user_id}"
+
+
+def _note_write(session: Session) -> None:
+    user_id = session.info.get("user_id")
+    if user_id is not None:
+        recent_writes.set(user_id, True)
+        session.info["wrote"] = True
+
+
+@event.listens_for(Session, "after_flush")
+def _after_flush(session: Session, flush_context) -> None:
+    _note_write(session)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _on_execute(state: ORMExecuteState) -> None:
+    # bulk UPDATE / INSERT / DELETE statements bypass the flush
+    if state.is_insert or state.is_update or state.is_delete:
+        _note_write(state.session)
+
+
+async def share_writes(db: Annotated[AsyncSession, Depends(get_db)]):
+    """Store the request's write marker in Redis before the response is sent.
+
+    The listeners above run inside the flush and cannot await; this runs
+    around every route (``scope="function"``), so the marker is in place by the
+    time the client can make its next request.
+    """
+    try:
+        yield
+    finally:
+        redis = _writes_tier()
+        if db.info.pop("wrote", False) and redis is not None and recent_writes.enabled:
+            from redis.exceptions import RedisError
+
+            user_id = db.info["user_id"]
+            try:
+                await redis.set(_writes_key(user_id), 1, px=int(recent_writes.ttl * 1000))
+            except RedisError:
+                log.warning(
+                    "read-your-writes: Redis unavailable, marker for %s kept locally", user_id
+                )
+
+
+async def _wrote_recently(user_id: str) -> bool:
+    if recent_writes.get(user_id):
+        return True
+    redis = _writes_tier()
+    if redis is None:
+        return False
+    from redis.exceptions import RedisError
+
+    try:
+        return bool(await redis.exists(_writes_key(user_id)))
+    except RedisError:
+        log.warning("read-your-writes: Redis unavailable, reading from the primary")
+        return True
+
+
+async def get_read_db(
+    current_user: Annotated[CurrentUser, Depends(get_current_user)],
+    db: Annotated[AsyncSession, Depends(get_db)],
+):
+    """Session for read-only routes: the replica, unless the user wrote recently.
+
+    Without ``DATABASE_READ_URL`` this is the request's primary session.
+    """
+    if read_engine is engine or await _wrote_recently(current_user.id):
+        yield db
+        return
+    async with ReadSessionLocal() as session:
+        yield session
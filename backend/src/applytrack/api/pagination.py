@@ -0,0 +1,30 @@
+"""Opaque keyset cursors shared by paginated list endpoints.
+
+A cursor encodes the ``(timestamp, id)`` sort key of the last row on a page.
+The next page starts strictly after that key, so its cost depends only on the
+page size — never on how deep the client has paged.
+"""
+
+import base64
+import json
+from datetime import datetime
+
+from fastapi import HTTPException
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+
+def encode_cursor(ts: datetime, row_id: str) -> str:
+    raw = json.dumps([ts.isoformat(), row_id]).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, str]:
+    """Decode a cursor from :func:`encode_cursor`, or 400 if it is malformed."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        ts, row_id = json.loads(base64.urlsafe_b64decode(padded))
+        return datetime.fromisoformat(ts), str(row_id)
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
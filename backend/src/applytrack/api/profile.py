@@ -6,10 +6,10 @@ from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from applytrack.api.deps import get_current_user
+from applytrack.api.deps import get_current_user, get_read_db
 from applytrack.db.models.profile import Profile
-from applytrack.db.models.user import User
 from applytrack.db.session import get_db
+from applytrack.schemas.auth import CurrentUser
 from applytrack.schemas.profile import ProfileResponse, ProfileUpdate
 
 router = APIRouter()
@@ -17,8 +17,8 @@ router = APIRouter()
 
 @router.get("/", response_model=ProfileResponse)
 async def read_profile(
-    current_user: Annotated[User, Depends(get_current_user)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    current_user: Annotated[CurrentUser, Depends(get_current_user)],
+    db: Annotated[AsyncSession, Depends(get_read_db)],
 ):
     result = await db.execute(select(Profile).where(Profile.user_id == current_user.id))
     profile = result.scalars().first()
@@ -30,7 +30,7 @@ async def read_profile(
 @router.put("/", response_model=ProfileResponse)
 async def update_profile(
     body: ProfileUpdate,
-    current_user: Annotated[User, Depends(get_current_user)],
+    current_user: Annotated[CurrentUser, Depends(get_current_user)],
     db: Annotated[AsyncSession, Depends(get_db)],
 ):
     result = await db.execute(select(Profile).where(Profile.user_id == current_user.id))
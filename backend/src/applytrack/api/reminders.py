@@ -1,17 +1,32 @@
-"""Reminder endpoints: create, list, update."""
+"""Reminder endpoints: create, list (per user or per application), update."""
 
+from datetime import datetime
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy import select
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import literal, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from applytrack.api.deps import get_current_user
+from applytrack.api.deps import get_current_user, get_read_db
+from applytrack.api.pagination import (
+    DEFAULT_PAGE_SIZE,
+    MAX_PAGE_SIZE,
+    decode_cursor,
+    encode_cursor,
+)
+from applytrack.api.stats import invalidate_stats
+from applytrack.db.models.activity_event import ActivityEventType
 from applytrack.db.models.application import Application
 from applytrack.db.models.reminder import Reminder
-from applytrack.db.models.user import User
 from applytrack.db.session import get_db
-from applytrack.schemas.reminder import ReminderCreate, ReminderResponse, ReminderUpdate
+from applytrack.schemas.auth import CurrentUser
+from applytrack.schemas.reminder import (
+    ReminderCreate,
+    ReminderPage,
+    ReminderResponse,
+    ReminderUpdate,
+)
+from applytrack.services.activity import record_event
 
 router = APIRouter()
 
@@ -24,7 +39,7 @@ router = APIRouter()
 async def create_reminder(
     application_id: str,
     body: ReminderCreate,
-    current_user: Annotated[User, Depends(get_current_user)],
+    current_user: Annotated[CurrentUser, Depends(get_current_user)],
     db: Annotated[AsyncSession, Depends(get_db)],
 ):
     # verify the user owns the application
@@ -44,21 +59,78 @@ async def create_reminder(
         due_at=body.due_at,
     )
     db.add(reminder)
+    record_event(
+        db,
+        application_id,
+        ActivityEventType.reminder_created,
+        text=body.text,
+        due_at=body.due_at.isoformat(),
+    )
     await db.commit()
+    invalidate_stats(current_user.id)
     await db.refresh(reminder)
     return reminder
 
 
+@router.get("/applications/{application_id}/reminders", response_model=ReminderPage)
+async def list_application_reminders(
+    application_id: str,
+    current_user: Annotated[CurrentUser, Depends(get_current_user)],
+    db: Annotated[AsyncSession, Depends(get_read_db)],
+    done: bool | None = None,
+    due_before: datetime | None = Query(None, description="Only reminders due before this"),
+    due_after: datetime | None = Query(None, description="Only reminders due at or after this"),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE, description="Page size"),
+    cursor: str | None = Query(None, description="next_cursor from the previous page"),
+):
+    result = await db.execute(
+        select(Application.id).where(
+            Application.id == application_id,
+            Application.user_id == current_user.id,
+        )
+    )
+    if result.first() is None:
+        raise HTTPException(status_code=404, detail="Application not found")
+
+    # served by ix_reminders_application_due, or ix_reminders_application_done_due
+    # when filtering on done
+    stmt = select(Reminder).where(Reminder.application_id == application_id)
+    if done is not None:
+        stmt = stmt.where(Reminder.done == done)
+    if due_before is not None:
+        stmt = stmt.where(Reminder.due_at < due_before)
+    if due_after is not None:
+        stmt = stmt.where(Reminder.due_at >= due_after)
+    if cursor:
+        due_at, reminder_id = decode_cursor(cursor)
+        stmt = stmt.where(
+            tuple_(Reminder.due_at, Reminder.id)
+            > tuple_(due_at, literal(reminder_id, Reminder.id.type))
+        )
+
+    stmt = stmt.order_by(Reminder.due_at.asc(), Reminder.id.asc()).limit(limit + 1)
+    reminders = (await db.execute(stmt)).scalars().all()
+
+    next_cursor = None
+    if len(reminders) > limit:
+        reminders = reminders[:limit]
+        next_cursor = encode_cursor(reminders[-1].due_at, reminders[-1].id)
+    return ReminderPage(items=reminders, next_cursor=next_cursor)
+
+
 @router.get("/reminders", response_model=list[ReminderResponse])
 async def list_reminders(
-    current_user: Annotated[User, Depends(get_current_user)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    current_user: Annotated[CurrentUser, Depends(get_current_user)],
+    db: Annotated[AsyncSession, Depends(get_read_db)],
     done: bool | None = None,
+    limit: int | None = Query(None, ge=1, le=MAX_PAGE_SIZE, description="Soonest N only"),
 ):
     stmt = select(Reminder).where(Reminder.user_id == current_user.id)
     if done is not None:
         stmt = stmt.where(Reminder.done == done)
     stmt = stmt.order_by(Reminder.due_at.asc())
+    if limit is not None:
+        stmt = stmt.limit(limit)
 
     result = await db.execute(stmt)
     return result.scalars().all()
@@ -68,7 +140,7 @@ async def list_reminders(
 async def update_reminder(
     reminder_id: str,
     body: ReminderUpdate,
-    current_user: Annotated[User, Depends(get_current_user)],
+    current_user: Annotated[CurrentUser, Depends(get_current_user)],
     db: Annotated[AsyncSession, Depends(get_db)],
 ):
     result = await db.execute(
@@ -81,9 +153,20 @@ async def update_reminder(
     if not reminder:
         raise HTTPException(status_code=404, detail="Reminder not found")
 
-    for field, value in body.model_dump(exclude_unset=True).items():
+    changes = body.model_dump(exclude_unset=True)
+    if changes.get("done") and not reminder.done:
+        record_event(
+            db,
+            reminder.application_id,
+            ActivityEventType.reminder_done,
+            reminder_id=reminder.id,
+            text=changes.get("text", reminder.text),
+        )
+
+    for field, value in changes.items():
         setattr(reminder, field, value)
 
     await db.commit()
+    invalidate_stats(current_user.id)
     await db.refresh(reminder)
     return reminder
@@ -1,10 +1,11 @@
 """Central API router — wires every sub-router under /api/v1."""
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
 
-from applytrack.api import ai, applications, auth, companies, profile, reminders
+from applytrack.api import ai, applications, auth, companies, profile, reminders, stats
+from applytrack.api.deps import share_writes
 
-api_router = APIRouter()
+api_router = APIRouter(dependencies=[Depends(share_writes, scope="function")])
 
 api_router.include_router(auth.router, prefix="/auth", tags=["auth"])
 api_router.include_router(profile.router, prefix="/profile", tags=["profile"])
@@ -12,3 +13,4 @@ api_router.include_router(companies.router, prefix="/companies", tags=["companie
 api_router.include_router(applications.router, prefix="/applications", tags=["applications"])
 api_router.include_router(reminders.router, tags=["reminders"])
 api_router.include_router(ai.router, prefix="/ai", tags=["ai"])
+api_router.include_router(stats.router, prefix="/stats", tags=["stats"])
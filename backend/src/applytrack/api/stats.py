@@ -0,0 +1,117 @@
+"""Dashboard statistics, aggregated in the database."""
+
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy import Date, cast, false, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from applytrack.api.deps import get_current_user
+from applytrack.core.cache import TTLCache
+from applytrack.core.config import settings
+from applytrack.db.models.application import Application, ApplicationStatus
+from applytrack.db.models.reminder import Reminder
+from applytrack.db.session import get_db
+from applytrack.schemas.auth import CurrentUser
+from applytrack.schemas.stats import ReminderStats, StatsResponse, WeeklyCount
+
+router = APIRouter()
+
+SUBMITTED = (
+    ApplicationStatus.applied,
+    ApplicationStatus.interview,
+    ApplicationStatus.offer,
+    ApplicationStatus.rejected,
+)
+RESPONDED = (
+    ApplicationStatus.interview,
+    ApplicationStatus.offer,
+    ApplicationStatus.rejected,
+)
+
+# user_id -> {weeks: StatsResponse}; disabled unless STATS_CACHE_TTL_SECONDS > 0
+stats_cache = TTLCache(maxsize=10_000, ttl=settings.stats_cache_ttl_seconds)
+
+
+def invalidate_stats(user_id: str) -> None:
+    """Drop cached stats after the user's applications or reminders change."""
+    stats_cache.delete(user_id)
+
+
+def _week_start(column, dialect_name: str):
+    """Monday of the week containing *column*, as a SQL date expression."""
+    if dialect_name == "sqlite":
+        return func.date(column, "weekday 0", "-6 days")
+    return cast(func.date_trunc("week", column), Date)
+
+
+def _as_date(value) -> date:
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return date.fromisoformat(value)
+
+
+@router.get("/", response_model=StatsResponse)
+async def read_stats(
+    current_user: Annotated[CurrentUser, Depends(get_current_user)],
+    db: Annotated[AsyncSession, Depends(get_db)],
+    weeks: int = Query(12, ge=1, le=104, description="Weeks of history to bucket"),
+):
+    cached = stats_cache.get(current_user.id, {})
+    if weeks in cached:
+        return cached[weeks]
+
+    dialect = db.get_bind().dialect.name
+    now = datetime.now(timezone.utc)
+
+    # status counts
+    result = await db.execute(
+        select(Application.status, func.count())
+        .where(Application.user_id == current_user.id)
+        .group_by(Application.status)
+    )
+    status_counts = {s: 0 for s in ApplicationStatus}
+    status_counts.update(dict(result.all()))
+
+    submitted = sum(status_counts[s] for s in SUBMITTED)
+    responded = sum(status_counts[s] for s in RESPONDED)
+
+    # applications created per week
+    this_monday = now.date() - timedelta(days=now.weekday())
+    first_week = this_monday - timedelta(weeks=weeks - 1)
+    week = _week_start(Application.created_at, dialect).label("week")
+    result = await db.execute(
+        select(week, func.count())
+        .where(
+            Application.user_id == current_user.id,
+            Application.created_at >= datetime.combine(first_week, time.min, timezone.utc),
+        )
+        .group_by(week)
+    )
+    per_week = {_as_date(w): n for w, n in result.all()}
+
+    # open reminders by urgency, in a single pass
+    result = await db.execute(
+        select(
+            func.count(),
+            func.count().filter(Reminder.due_at < now),
+            func.count().filter(Reminder.due_at >= now, Reminder.due_at < now + timedelta(days=7)),
+        ).where(Reminder.user_id == current_user.id, Reminder.done == false())
+    )
+    open_count, overdue, due_soon = result.one()
+
+    stats = StatsResponse(
+        total=sum(status_counts.values()),
+        status_counts=status_counts,
+        response_rate=round(responded / submitted, 4) if submitted else 0.0,
+        applications_per_week=[
+            WeeklyCount(week_start=d, count=per_week.get(d, 0))
+            for d in (first_week + timedelta(weeks=i) for i in range(weeks))
+        ],
+        reminders=ReminderStats(open=open_count, overdue=overdue, due_next_7_days=due_soon),
+    )
+    stats_cache.set(current_user.id, {**cached, weeks: stats})
+    return stats
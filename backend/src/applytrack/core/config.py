@@ -18,6 +18,34 @@ class Settings(BaseSettings):
 
     # --- database ---
     database_url: str = "sqlite+aiosqlite:///./applytrack.db"
+    # optional read replica for GET endpoints; empty = read from the primary
+    database_read_url: str = ""
+    # after a write, that user's reads stay on the primary for this many seconds
+    # so they see their own change despite replication lag
+    read_your_writes_seconds: float = 5
+    # keep those markers in Redis (REDIS_URL) so every API worker sees them;
+    # only used with a replica.  false = per process, for a single worker
+    read_your_writes_redis: bool = True
+    # what the API does with the schema on boot: "create_all" (quick start),
+    # "check" (require the Alembic head revision; migrate before deploying) or "skip"
+    db_startup: Literal["create_all", "check", "skip"] = "create_all"
+    alembic_config: str = "alembic.ini"
+    # 7 = time-ordered UUIDv7 primary keys (inserts append to the index; ids
+    # reveal their creation time), 4 = random UUIDv4
+    id_uuid_version: Literal[4, 7] = 4
+    # pool profile for the API engine; the worker engine has its own size below
+    db_pool_size: int = 10
+    db_max_overflow: int = 10
+    db_pool_timeout: float = 30.0  # seconds to wait for a free connection
+    db_pool_recycle: int = 1800  # seconds; reconnect before server-side idle timeouts
+    db_pool_pre_ping: bool = True
+    worker_db_pool_size: int = 2
+    worker_db_max_overflow: int = 2
+    # SQLite file databases: WAL + tuned pragmas on every connection (db/sqlite.py)
+    sqlite_tuning: bool = True
+    sqlite_busy_timeout_ms: int = 5000
+    sqlite_mmap_size_mb: int = 256
+    sqlite_cache_size_mb: int = 64
 
     # --- auth ---
     jwt_secret: str = Field(
@@ -27,6 +55,8 @@ class Settings(BaseSettings):
     jwt_algorithm: str = "HS256"
     access_token_expire_minutes: int = 60 * 24  # 24 hours
     allow_registration: bool = True
+    # threads that run argon2 for the API; each in-flight hash uses one core
+    password_hash_workers: int = Field(default=2, ge=1)
 
     # --- cors ---
     cors_origins: str = "http://localhost:3000,http://127.0.0.1:3000"
@@ -42,6 +72,30 @@ class Settings(BaseSettings):
     ai_base_url: str = "https://openrouter.ai/api/v1"
     ai_model: str = "anthropic/claude-3.5-sonnet"
     ai_timeout_seconds: float = 60.0
+    # connection pool of the per-process provider client; HTTP/2 needs the
+    # "http2" extra (h2) installed
+    ai_max_connections: int = 20
+    ai_max_keepalive_connections: int = 10
+    ai_keepalive_expiry_seconds: float = 60.0
+    ai_http2: bool = False
+    # run AI tasks as coroutines on a per-process event loop, freeing the pool
+    # slot at once; at most ai_max_concurrency in flight per process
+    ai_async_runner: bool = False
+    ai_max_concurrency: int = Field(default=32, ge=1)
+    # upper bound on how long a trigger is coalesced with a running task of the
+    # same (application, kind, inputs); 0 turns coalescing off
+    ai_inflight_ttl_seconds: int = 600
+
+    # --- caching ---
+    # per-user /stats cache; 0 disables it.  Writes invalidate the entry in the
+    # same process, so with several API workers this bounds cross-worker staleness.
+    stats_cache_ttl_seconds: float = 0
+    # token subject -> user identity in get_current_user; 0 disables it.  Only
+    # matters for account changes, which call invalidate_user() locally; set
+    # USER_CACHE_REDIS to share entries (and invalidations) across workers.
+    user_cache_ttl_seconds: float = 60
+    user_cache_size: int = 10_000
+    user_cache_redis: bool = False
 
     # --- logging ---
     log_level: str = "INFO"
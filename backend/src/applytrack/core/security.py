@@ -1,5 +1,14 @@
-"""JWT token creation and password hashing helpers."""
+"""JWT token creation and password hashing helpers.
 
+argon2 is deliberately slow (tens of milliseconds per call), so the async
+API never runs it on the event loop: ``hash_password_async`` and
+``verify_password_async`` hand it to a small dedicated thread pool.  argon2
+releases the GIL, so the pool hashes in parallel while the loop keeps serving
+other requests, and its size caps the CPU a login burst can take.
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 
 from jose import jwt
@@ -9,6 +18,12 @@ from applytrack.core.config import settings
 
 pwd_context = CryptContext(schemes=["argon2"], deprecated="auto")
 
+_hash_executor = ThreadPoolExecutor(
+    max_workers=settings.password_hash_workers, thread_name_prefix="password-hash"
+)
+# calls submitted and not yet finished; only touched from the event loop
+_in_flight = 0
+
 
 def create_access_token(subject: str, expires_delta: timedelta | None = None) -> str:
     now = datetime.now(timezone.utc)
@@ -23,3 +38,30 @@ def verify_password(plain: str, hashed: str) -> bool:
 
 def hash_password(plain: str) -> str:
     return pwd_context.hash(plain)
+
+
+def password_hash_stats() -> dict[str, int]:
+    """Pool size, calls in flight and how many of those are waiting for a worker."""
+    workers = settings.password_hash_workers
+    return {
+        "workers": workers,
+        "in_flight": _in_flight,
+        "queued": max(0, _in_flight - workers),
+    }
+
+
+async def _run_in_pool(fn, *args):
+    global _in_flight
+    _in_flight += 1
+    try:
+        return await asyncio.get_running_loop().run_in_executor(_hash_executor, fn, *args)
+    finally:
+        _in_flight -= 1
+
+
+async def verify_password_async(plain: str, hashed: str) -> bool:
+    return await _run_in_pool(verify_password, plain, hashed)
+
+
+async def hash_password_async(plain: str) -> str:
+    return await _run_in_pool(hash_password, plain)
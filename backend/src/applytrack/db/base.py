@@ -1,7 +1,20 @@
 """SQLAlchemy declarative base."""
 
+from datetime import datetime, timezone
+
 from sqlalchemy.orm import DeclarativeBase
 
 
 class Base(DeclarativeBase):
     pass
+
+
+def utcnow() -> datetime:
+    """Python-side timestamp default.
+
+    Used for columns that act as pagination keys: SQLite stores ``func.now()``
+    with second precision in a different text format than bound datetimes,
+    which breaks exact equality at a cursor boundary.  It also keeps the value
+    on freshly inserted objects, so responses can be built without a reload.
+    """
+    return datetime.now(timezone.utc)
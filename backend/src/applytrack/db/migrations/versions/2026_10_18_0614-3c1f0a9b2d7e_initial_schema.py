@@ -0,0 +1,396 @@
+"""initial schema
+
+Baseline for databases previously created by ``Base.metadata.create_all``:
+stamp them with ``alembic stamp 3c1f0a9b2d7e`` instead of upgrading.
+
+Revision ID: 3c1f0a9b2d7e
+Revises:
+Create Date: 2026-10-18 06:14:12.068036
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3c1f0a9b2d7e"
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+PG_TRGM_EXTENSION = "CREATE EXTENSION IF NOT EXISTS pg_trgm"
+
+# frozen copy of the SQLite search objects in applytrack/db/search.py as of
+# this revision; later edits to the app must not change what this creates
+SEARCH_TABLE = "application_search"
+
+SEARCH_DDL = [
+    f"""
+    CREATE VIRTUAL TABLE IF NOT EXISTS {SEARCH_TABLE} USING fts5(
+        application_id UNINDEXED,
+        title,
+        company_name,
+        tokenize = 'trigram'
+    )
+    """,
+    # backfill once, for databases that already hold applications
+    f"""
+    INSERT INTO {SEARCH_TABLE} (application_id, title, company_name)
+    SELECT a.id, p.title, c.name
+    FROM applications a
+    JOIN job_postings p ON p.id = a.job_posting_id
+    LEFT JOIN companies c ON c.id = p.company_id
+    WHERE NOT EXISTS (SELECT 1 FROM {SEARCH_TABLE})
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS applications_search_ai AFTER INSERT ON applications
+    BEGIN
+        INSERT INTO {SEARCH_TABLE} (application_id, title, company_name)
+        SELECT NEW.id, p.title, c.name
+        FROM job_postings p LEFT JOIN companies c ON c.id = p.company_id
+        WHERE p.id = NEW.job_posting_id;
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS applications_search_ad AFTER DELETE ON applications
+    BEGIN
+        DELETE FROM {SEARCH_TABLE} WHERE application_id = OLD.id;
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS applications_search_au
+    AFTER UPDATE OF job_posting_id ON applications
+    BEGIN
+        DELETE FROM {SEARCH_TABLE} WHERE application_id = OLD.id;
+        INSERT INTO {SEARCH_TABLE} (application_id, title, company_name)
+        SELECT NEW.id, p.title, c.name
+        FROM job_postings p LEFT JOIN companies c ON c.id = p.company_id
+        WHERE p.id = NEW.job_posting_id;
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS job_postings_search_au
+    AFTER UPDATE OF title, company_id ON job_postings
+    BEGIN
+        UPDATE {SEARCH_TABLE}
+        SET title = NEW.title,
+            company_name = (SELECT name FROM companies WHERE id = NEW.company_id)
+        WHERE application_id IN (SELECT id FROM applications WHERE job_posting_id = NEW.id);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS companies_search_au AFTER UPDATE OF name ON companies
+    BEGIN
+        UPDATE {SEARCH_TABLE}
+        SET company_name = NEW.name
+        WHERE application_id IN (
+            SELECT a.id FROM applications a
+            JOIN job_postings p ON p.id = a.job_posting_id
+            WHERE p.company_id = NEW.id
+        );
+    END
+    """,
+]
+
+SEARCH_TRIGGERS = (
+    "applications_search_ai",
+    "applications_search_ad",
+    "applications_search_au",
+    "job_postings_search_au",
+    "companies_search_au",
+)
+
+# triggers first: a dangling trigger body breaks later ALTER TABLE ... RENAME
+SEARCH_DROP = [f"DROP TRIGGER IF EXISTS {name}" for name in SEARCH_TRIGGERS] + [
+    f"DROP TABLE IF EXISTS {SEARCH_TABLE}"
+]
+
+
+def _create_search_objects(conn) -> None:
+    if conn.dialect.name == "sqlite":
+        for stmt in SEARCH_DDL:
+            conn.exec_driver_sql(stmt)
+
+
+def _drop_search_objects(conn) -> None:
+    if conn.dialect.name == "sqlite":
+        for stmt in SEARCH_DROP:
+            conn.exec_driver_sql(stmt)
+
+
+def upgrade() -> None:
+    # ### commands auto generated by Alembic - please adjust! ###
+    op.create_table(
+        "users",
+        sa.Column("id", sa.String(), nullable=False),
+        sa.Column("email", sa.String(), nullable=False),
+        sa.Column("password_hash", sa.String(), nullable=False),
+        sa.Column(
+            "created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(op.f("ix_users_email"), "users", ["email"], unique=True)
+    op.create_table(
+        "companies",
+        sa.Column("id", sa.String(), nullable=False),
+        sa.Column("user_id", sa.String(), nullable=False),
+        sa.Column("name", sa.String(), nullable=False),
+        sa.Column("website_url", sa.String(), nullable=True),
+        sa.Column("linkedin_url", sa.String(), nullable=True),
+        sa.Column("careers_url", sa.String(), nullable=True),
+        sa.Column("hq_location", sa.String(), nullable=True),
+        sa.Column("notes", sa.Text(), nullable=True),
+        sa.Column(
+            "created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False
+        ),
+        sa.ForeignKeyConstraint(
+            ["user_id"],
+            ["users.id"],
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(op.f("ix_companies_name"), "companies", ["name"], unique=False)
+    op.create_index(op.f("ix_companies_user_id"), "companies", ["user_id"], unique=False)
+    op.create_table(
+        "profiles",
+        sa.Column("id", sa.String(), nullable=False),
+        sa.Column("user_id", sa.String(), nullable=False),
+        sa.Column("headline", sa.String(), nullable=True),
+        sa.Column("summary", sa.String(), nullable=True),
+        sa.Column("location", sa.String(), nullable=True),
+        sa.Column("links_json", sa.JSON(), nullable=True),
+        sa.Column("skills_json", sa.JSON(), nullable=True),
+        sa.Column("projects_json", sa.JSON(), nullable=True),
+        sa.Column("experience_json", sa.JSON(), nullable=True),
+        sa.Column(
+            "updated_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False
+        ),
+        sa.ForeignKeyConstraint(
+            ["user_id"],
+            ["users.id"],
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(op.f("ix_profiles_user_id"), "profiles", ["user_id"], unique=True)
+    op.create_table(
+        "job_postings",
+        sa.Column("id", sa.String(), nullable=False),
+        sa.Column("company_id", sa.String(), nullable=True),
+        sa.Column("title", sa.String(), nullable=False),
+        sa.Column("location", sa.String(), nullable=True),
+        sa.Column(
+            "remote_type", sa.Enum("onsite", "hybrid", "remote", name="remotetype"), nullable=False
+        ),
+        sa.Column("posting_url", sa.String(), nullable=True),
+        sa.Column(
+            "source",
+            sa.Enum("linkedin", "indeed", "company", "other", name="jobsource"),
+            nullable=False,
+        ),
+        sa.Column("description_raw", sa.Text(), nullable=True),
+        sa.Column(
+            "created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False
+        ),
+        sa.ForeignKeyConstraint(
+            ["company_id"],
+            ["companies.id"],
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(op.f("ix_job_postings_title"), "job_postings", ["title"], unique=False)
+    op.create_table(
+        "applications",
+        sa.Column("id", sa.String(), nullable=False),
+        sa.Column("user_id", sa.String(), nullable=False),
+        sa.Column("job_posting_id", sa.String(), nullable=False),
+        sa.Column(
+            "status",
+            sa.Enum(
+                "not_applied",
+                "applied",
+                "interview",
+                "offer",
+                "rejected",
+                "archived",
+                name="applicationstatus",
+            ),
+            nullable=False,
+        ),
+        sa.Column(
+            "priority", sa.Enum("low", "medium", "high", name="applicationpriority"), nullable=False
+        ),
+        sa.Column("notes", sa.Text(), nullable=False),
+        sa.Column("applied_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("next_followup_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("salary_expectation", sa.Integer(), nullable=True),
+        sa.Column(
+            "created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False
+        ),
+        sa.Column(
+            "updated_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False
+        ),
+        sa.ForeignKeyConstraint(
+            ["job_posting_id"],
+            ["job_postings.id"],
+        ),
+        sa.ForeignKeyConstraint(
+            ["user_id"],
+            ["users.id"],
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        op.f("ix_applications_job_posting_id"), "applications", ["job_posting_id"], unique=False
+    )
+    op.create_index(op.f("ix_applications_user_id"), "applications", ["user_id"], unique=False)
+    op.create_table(
+        "activity_events",
+        sa.Column("id", sa.String(), nullable=False),
+        sa.Column("application_id", sa.String(), nullable=False),
+        sa.Column(
+            "type",
+            sa.Enum(
+                "status_changed",
+                "note_added",
+                "ai_requested",
+                "ai_ready",
+                "reminder_created",
+                "reminder_done",
+                name="activityeventtype",
+            ),
+            nullable=False,
+        ),
+        sa.Column("payload_json", sa.JSON(), nullable=True),
+        sa.Column(
+            "created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False
+        ),
+        sa.ForeignKeyConstraint(
+            ["application_id"],
+            ["applications.id"],
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        op.f("ix_activity_events_application_id"),
+        "activity_events",
+        ["application_id"],
+        unique=False,
+    )
+    op.create_table(
+        "ai_outputs",
+        sa.Column("id", sa.String(), nullable=False),
+        sa.Column("application_id", sa.String(), nullable=False),
+        sa.Column(
+            "kind",
+            sa.Enum(
+                "parse_jd", "match", "tailor_cv", "outreach", "interview_prep", name="aioutputkind"
+            ),
+            nullable=False,
+        ),
+        sa.Column("input_hash", sa.String(), nullable=False),
+        sa.Column("output_json", sa.JSON(), nullable=False),
+        sa.Column("evidence_json", sa.JSON(), nullable=True),
+        sa.Column("model", sa.String(), nullable=False),
+        sa.Column("latency_seconds", sa.Float(), nullable=False),
+        sa.Column(
+            "created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False
+        ),
+        sa.ForeignKeyConstraint(
+            ["application_id"],
+            ["applications.id"],
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        op.f("ix_ai_outputs_application_id"), "ai_outputs", ["application_id"], unique=False
+    )
+    op.create_table(
+        "reminders",
+        sa.Column("id", sa.String(), nullable=False),
+        sa.Column("application_id", sa.String(), nullable=False),
+        sa.Column("user_id", sa.String(), nullable=False),
+        sa.Column("text", sa.String(), nullable=False),
+        sa.Column("due_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("done", sa.Boolean(), nullable=False),
+        sa.Column(
+            "created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False
+        ),
+        sa.ForeignKeyConstraint(
+            ["application_id"],
+            ["applications.id"],
+        ),
+        sa.ForeignKeyConstraint(
+            ["user_id"],
+            ["users.id"],
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        op.f("ix_reminders_application_id"), "reminders", ["application_id"], unique=False
+    )
+    op.create_index(op.f("ix_reminders_user_id"), "reminders", ["user_id"], unique=False)
+    # ### end Alembic commands ###
+
+    # application search (see applytrack/db/search.py)
+    bind = op.get_bind()
+    if bind.dialect.name == "postgresql":
+        op.execute(PG_TRGM_EXTENSION)
+        op.create_index(
+            "ix_job_postings_title_trgm",
+            "job_postings",
+            ["title"],
+            postgresql_using="gin",
+            postgresql_ops={"title": "gin_trgm_ops"},
+        )
+        op.create_index(
+            "ix_companies_name_trgm",
+            "companies",
+            ["name"],
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        )
+    _create_search_objects(bind)
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    _drop_search_objects(bind)
+    if bind.dialect.name == "postgresql":
+        op.drop_index("ix_companies_name_trgm", table_name="companies")
+        op.drop_index("ix_job_postings_title_trgm", table_name="job_postings")
+
+    # ### commands auto generated by Alembic - please adjust! ###
+    op.drop_index(op.f("ix_reminders_user_id"), table_name="reminders")
+    op.drop_index(op.f("ix_reminders_application_id"), table_name="reminders")
+    op.drop_table("reminders")
+    op.drop_index(op.f("ix_ai_outputs_application_id"), table_name="ai_outputs")
+    op.drop_table("ai_outputs")
+    op.drop_index(op.f("ix_activity_events_application_id"), table_name="activity_events")
+    op.drop_table("activity_events")
+    op.drop_index(op.f("ix_applications_user_id"), table_name="applications")
+    op.drop_index(op.f("ix_applications_job_posting_id"), table_name="applications")
+    op.drop_table("applications")
+    op.drop_index(op.f("ix_job_postings_title"), table_name="job_postings")
+    op.drop_table("job_postings")
+    op.drop_index(op.f("ix_profiles_user_id"), table_name="profiles")
+    op.drop_table("profiles")
+    op.drop_index(op.f("ix_companies_user_id"), table_name="companies")
+    op.drop_index(op.f("ix_companies_name"), table_name="companies")
+    op.drop_table("companies")
+    op.drop_index(op.f("ix_users_email"), table_name="users")
+    op.drop_table("users")
+    # ### end Alembic commands ###
+
+    if bind.dialect.name == "postgresql":
+        for enum_name in (
+            "activityeventtype",
+            "aioutputkind",
+            "applicationpriority",
+            "applicationstatus",
+            "jobsource",
+            "remotetype",
+        ):
+            sa.Enum(name=enum_name).drop(bind, checkfirst=True)
@@ -0,0 +1,42 @@
+"""board status index descending
+
+Rebuild ix_applications_user_status_updated with descending sort keys so
+the Kanban board's per-status ROW_NUMBER() window reads the index in order
+instead of sorting each column.
+
+Revision ID: b7a93e5f1d24
+Revises: 8e4d2b61c0a5
+Create Date: 2026-10-18 07:02:31.418220
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b7a93e5f1d24"
+down_revision: Union[str, None] = "8e4d2b61c0a5"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.drop_index("ix_applications_user_status_updated", table_name="applications")
+    op.create_index(
+        "ix_applications_user_status_updated",
+        "applications",
+        ["user_id", "status", sa.text("updated_at DESC"), sa.text("id DESC")],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_applications_user_status_updated", table_name="applications")
+    op.create_index(
+        "ix_applications_user_status_updated",
+        "applications",
+        ["user_id", "status", "updated_at", "id"],
+        unique=False,
+    )
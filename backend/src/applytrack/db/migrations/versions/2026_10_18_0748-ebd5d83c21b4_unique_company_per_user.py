@@ -0,0 +1,191 @@
+"""unique company per user
+
+Add companies.normalized_name (case- and whitespace-insensitive name) with a
+unique (user_id, normalized_name) index, the ON CONFLICT target of the
+find-or-create upsert.  Existing duplicates are merged into the oldest row
+and their job postings repointed before the index is built.  The index also
+covers user_id lookups, so ix_companies_user_id is dropped.
+
+Revision ID: ebd5d83c21b4
+Revises: b7a93e5f1d24
+Create Date: 2026-10-18 07:48:12.903115
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "ebd5d83c21b4"
+down_revision: Union[str, None] = "b7a93e5f1d24"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# frozen copy of the SQLite search objects in applytrack/db/search.py as of
+# this revision; later edits to the app must not change what this creates
+SEARCH_TABLE = "application_search"
+
+SEARCH_DDL = [
+    f"""
+    CREATE VIRTUAL TABLE IF NOT EXISTS {SEARCH_TABLE} USING fts5(
+        application_id UNINDEXED,
+        title,
+        company_name,
+        tokenize = 'trigram'
+    )
+    """,
+    # backfill once, for databases that already hold applications
+    f"""
+    INSERT INTO {SEARCH_TABLE} (application_id, title, company_name)
+    SELECT a.id, p.title, c.name
+    FROM applications a
+    JOIN job_postings p ON p.id = a.job_posting_id
+    LEFT JOIN companies c ON c.id = p.company_id
+    WHERE NOT EXISTS (SELECT 1 FROM {SEARCH_TABLE})
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS applications_search_ai AFTER INSERT ON applications
+    BEGIN
+        INSERT INTO {SEARCH_TABLE} (application_id, title, company_name)
+        SELECT NEW.id, p.title, c.name
+        FROM job_postings p LEFT JOIN companies c ON c.id = p.company_id
+        WHERE p.id = NEW.job_posting_id;
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS applications_search_ad AFTER DELETE ON applications
+    BEGIN
+        DELETE FROM {SEARCH_TABLE} WHERE application_id = OLD.id;
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS applications_search_au
+    AFTER UPDATE OF job_posting_id ON applications
+    BEGIN
+        DELETE FROM {SEARCH_TABLE} WHERE application_id = OLD.id;
+        INSERT INTO {SEARCH_TABLE} (application_id, title, company_name)
+        SELECT NEW.id, p.title, c.name
+        FROM job_postings p LEFT JOIN companies c ON c.id = p.company_id
+        WHERE p.id = NEW.job_posting_id;
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS job_postings_search_au
+    AFTER UPDATE OF title, company_id ON job_postings
+    BEGIN
+        UPDATE {SEARCH_TABLE}
+        SET title = NEW.title,
+            company_name = (SELECT name FROM companies WHERE id = NEW.company_id)
+        WHERE application_id IN (SELECT id FROM applications WHERE job_posting_id = NEW.id);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS companies_search_au AFTER UPDATE OF name ON companies
+    BEGIN
+        UPDATE {SEARCH_TABLE}
+        SET company_name = NEW.name
+        WHERE application_id IN (
+            SELECT a.id FROM applications a
+            JOIN job_postings p ON p.id = a.job_posting_id
+            WHERE p.company_id = NEW.id
+        );
+    END
+    """,
+]
+
+SEARCH_TRIGGERS = (
+    "applications_search_ai",
+    "applications_search_ad",
+    "applications_search_au",
+    "job_postings_search_au",
+    "companies_search_au",
+)
+
+# triggers first: a dangling trigger body breaks later ALTER TABLE ... RENAME
+SEARCH_DROP = [f"DROP TRIGGER IF EXISTS {name}" for name in SEARCH_TRIGGERS] + [
+    f"DROP TABLE IF EXISTS {SEARCH_TABLE}"
+]
+
+
+def _create_search_objects(conn) -> None:
+    if conn.dialect.name == "sqlite":
+        for stmt in SEARCH_DDL:
+            conn.exec_driver_sql(stmt)
+
+
+def _drop_search_objects(conn) -> None:
+    if conn.dialect.name == "sqlite":
+        for stmt in SEARCH_DROP:
+            conn.exec_driver_sql(stmt)
+
+
+companies = sa.table(
+    "companies",
+    sa.column("id", sa.String),
+    sa.column("user_id", sa.String),
+    sa.column("name", sa.String),
+    sa.column("normalized_name", sa.String),
+    sa.column("created_at", sa.DateTime),
+)
+job_postings = sa.table(
+    "job_postings",
+    sa.column("company_id", sa.String),
+)
+
+
+def _normalize_company_name(name: str) -> str:
+    """Frozen copy of applytrack.db.models.company.normalize_company_name."""
+    return " ".join(name.split()).casefold()
+
+
+def _backfill(conn) -> None:
+    rows = conn.execute(
+        sa.select(companies.c.id, companies.c.user_id, companies.c.name).order_by(
+            companies.c.created_at, companies.c.id
+        )
+    ).all()
+    keep: dict[tuple[str, str], str] = {}
+    for company_id, user_id, name in rows:
+        normalized = _normalize_company_name(name)
+        survivor = keep.setdefault((user_id, normalized), company_id)
+        if survivor == company_id:
+            conn.execute(
+                companies.update()
+                .where(companies.c.id == company_id)
+                .values(normalized_name=normalized)
+            )
+        else:
+            conn.execute(
+                job_postings.update()
+                .where(job_postings.c.company_id == company_id)
+                .values(company_id=survivor)
+            )
+            conn.execute(companies.delete().where(companies.c.id == company_id))
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+    op.add_column("companies", sa.Column("normalized_name", sa.String(), nullable=True))
+    _backfill(conn)
+
+    # SQLite rebuilds the table to add NOT NULL, which drops its search triggers
+    _drop_search_objects(conn)
+    with op.batch_alter_table("companies") as batch_op:
+        batch_op.alter_column("normalized_name", existing_type=sa.String(), nullable=False)
+        batch_op.drop_index("ix_companies_user_id")
+        batch_op.create_index(
+            "uq_companies_user_normalized_name", ["user_id", "normalized_name"], unique=True
+        )
+    _create_search_objects(conn)
+
+
+def downgrade() -> None:
+    conn = op.get_bind()
+    _drop_search_objects(conn)
+    with op.batch_alter_table("companies") as batch_op:
+        batch_op.drop_index("uq_companies_user_normalized_name")
+        batch_op.create_index("ix_companies_user_id", ["user_id"], unique=False)
+        batch_op.drop_column("normalized_name")
+    _create_search_objects(conn)
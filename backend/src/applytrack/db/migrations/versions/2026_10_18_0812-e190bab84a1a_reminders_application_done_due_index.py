@@ -0,0 +1,38 @@
+"""reminders application done due index
+
+Replace the single-column reminders.application_id index with
+(application_id, done, due_at) so the per-application reminder list is an
+index range scan in due order.
+
+Revision ID: e190bab84a1a
+Revises: ebd5d83c21b4
+Create Date: 2026-10-18 08:12:40.551902
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e190bab84a1a"
+down_revision: Union[str, None] = "ebd5d83c21b4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.drop_index(op.f("ix_reminders_application_id"), table_name="reminders")
+    op.create_index(
+        "ix_reminders_application_done_due",
+        "reminders",
+        ["application_id", "done", "due_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_reminders_application_done_due", table_name="reminders")
+    op.create_index(
+        op.f("ix_reminders_application_id"), "reminders", ["application_id"], unique=False
+    )
@@ -0,0 +1,41 @@
+"""activity events application created index
+
+Replace the single-column activity_events.application_id index with
+(application_id, created_at) so the application timeline is an index range
+scan in time order.
+
+Revision ID: 5a2c7e91d3f0
+Revises: e190bab84a1a
+Create Date: 2026-10-18 08:40:17.204318
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5a2c7e91d3f0"
+down_revision: Union[str, None] = "e190bab84a1a"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.drop_index(op.f("ix_activity_events_application_id"), table_name="activity_events")
+    op.create_index(
+        "ix_activity_events_application_created",
+        "activity_events",
+        ["application_id", "created_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_activity_events_application_created", table_name="activity_events")
+    op.create_index(
+        op.f("ix_activity_events_application_id"),
+        "activity_events",
+        ["application_id"],
+        unique=False,
+    )
@@ -0,0 +1,236 @@
+"""native uuid keys
+
+Store every primary and foreign key as a native ``uuid`` on Postgres and a
+16-byte BLOB on SQLite instead of 36-character text.
+
+Postgres converts in place with ``USING col::uuid``; foreign keys are dropped
+first and recreated afterwards because both sides of a constraint must change
+type together.  SQLite rewrites the values to their 16-byte form, then
+rebuilds each table with the new column types; the FTS5 search table is
+recreated and backfilled from the converted rows.
+
+Revision ID: 9c4e1f7a2b63
+Revises: 5a2c7e91d3f0
+Create Date: 2026-10-18 09:05:33.718240
+
+"""
+
+import uuid
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "9c4e1f7a2b63"
+down_revision: Union[str, None] = "5a2c7e91d3f0"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+class UUIDKey(sa.types.TypeDecorator):
+    """Frozen copy of applytrack.db.types.UUIDKey's storage type."""
+
+    impl = sa.LargeBinary(16)
+    cache_ok = True
+
+    def load_dialect_impl(self, dialect):
+        if dialect.name == "postgresql":
+            return dialect.type_descriptor(postgresql.UUID(as_uuid=True))
+        return dialect.type_descriptor(sa.LargeBinary(16))
+
+
+# frozen copy of the SQLite search objects in applytrack/db/search.py as of
+# this revision; later edits to the app must not change what this creates
+SEARCH_TABLE = "application_search"
+
+SEARCH_DDL = [
+    f"""
+    CREATE VIRTUAL TABLE IF NOT EXISTS {SEARCH_TABLE} USING fts5(
+        application_id UNINDEXED,
+        title,
+        company_name,
+        tokenize = 'trigram'
+    )
+    """,
+    # backfill once, for databases that already hold applications
+    f"""
+    INSERT INTO {SEARCH_TABLE} (application_id, title, company_name)
+    SELECT a.id, p.title, c.name
+    FROM applications a
+    JOIN job_postings p ON p.id = a.job_posting_id
+    LEFT JOIN companies c ON c.id = p.company_id
+    WHERE NOT EXISTS (SELECT 1 FROM {SEARCH_TABLE})
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS applications_search_ai AFTER INSERT ON applications
+    BEGIN
+        INSERT INTO {SEARCH_TABLE} (application_id, title, company_name)
+        SELECT NEW.id, p.title, c.name
+        FROM job_postings p LEFT JOIN companies c ON c.id = p.company_id
+        WHERE p.id = NEW.job_posting_id;
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS applications_search_ad AFTER DELETE ON applications
+    BEGIN
+        DELETE FROM {SEARCH_TABLE} WHERE application_id = OLD.id;
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS applications_search_au
+    AFTER UPDATE OF job_posting_id ON applications
+    BEGIN
+        DELETE FROM {SEARCH_TABLE} WHERE application_id = OLD.id;
+        INSERT INTO {SEARCH_TABLE} (application_id, title, company_name)
+        SELECT NEW.id, p.title, c.name
+        FROM job_postings p LEFT JOIN companies c ON c.id = p.company_id
+        WHERE p.id = NEW.job_posting_id;
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS job_postings_search_au
+    AFTER UPDATE OF title, company_id ON job_postings
+    BEGIN
+        UPDATE {SEARCH_TABLE}
+        SET title = NEW.title,
+            company_name = (SELECT name FROM companies WHERE id = NEW.company_id)
+        WHERE application_id IN (SELECT id FROM applications WHERE job_posting_id = NEW.id);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS companies_search_au AFTER UPDATE OF name ON companies
+    BEGIN
+        UPDATE {SEARCH_TABLE}
+        SET company_name = NEW.name
+        WHERE application_id IN (
+            SELECT a.id FROM applications a
+            JOIN job_postings p ON p.id = a.job_posting_id
+            WHERE p.company_id = NEW.id
+        );
+    END
+    """,
+]
+
+SEARCH_TRIGGERS = (
+    "applications_search_ai",
+    "applications_search_ad",
+    "applications_search_au",
+    "job_postings_search_au",
+    "companies_search_au",
+)
+
+# triggers first: a dangling trigger body breaks later ALTER TABLE ... RENAME
+SEARCH_DROP = [f"DROP TRIGGER IF EXISTS {name}" for name in SEARCH_TRIGGERS] + [
+    f"DROP TABLE IF EXISTS {SEARCH_TABLE}"
+]
+
+
+def _create_search_objects(conn) -> None:
+    if conn.dialect.name == "sqlite":
+        for stmt in SEARCH_DDL:
+            conn.exec_driver_sql(stmt)
+
+
+def _drop_search_objects(conn) -> None:
+    if conn.dialect.name == "sqlite":
+        for stmt in SEARCH_DROP:
+            conn.exec_driver_sql(stmt)
+
+
+KEY_COLUMNS = {
+    "users": ["id"],
+    "profiles": ["id", "user_id"],
+    "companies": ["id", "user_id"],
+    "job_postings": ["id", "company_id"],
+    "applications": ["id", "user_id", "job_posting_id"],
+    "reminders": ["id", "application_id", "user_id"],
+    "ai_outputs": ["id", "application_id"],
+    "activity_events": ["id", "application_id"],
+}
+
+
+def _to_bytes(value):
+    return None if value is None else uuid.UUID(value).bytes
+
+
+def _to_text(value):
+    return None if value is None else str(uuid.UUID(bytes=value))
+
+
+def _rewrite_sqlite_values(conn, convert) -> None:
+    for table_name, columns in KEY_COLUMNS.items():
+        table = sa.table(table_name, sa.column("rowid"), *(sa.column(c) for c in columns))
+        rows = conn.execute(sa.select(table.c.rowid, *(table.c[c] for c in columns))).all()
+        if not rows:
+            continue
+        stmt = (
+            table.update()
+            .where(table.c.rowid == sa.bindparam("_rowid"))
+            .values({c: sa.bindparam(f"_{c}") for c in columns})
+        )
+        conn.execute(
+            stmt,
+            [
+                {"_rowid": row[0], **{f"_{c}": convert(v) for c, v in zip(columns, row[1:])}}
+                for row in rows
+            ],
+        )
+
+
+def _alter_sqlite_types(new_type, old_type) -> None:
+    for table_name, columns in KEY_COLUMNS.items():
+        with op.batch_alter_table(table_name) as batch_op:
+            for column in columns:
+                batch_op.alter_column(column, type_=new_type, existing_type=old_type)
+
+
+def _alter_postgres_types(conn, type_sql: str) -> None:
+    inspector = sa.inspect(conn)
+    foreign_keys = {t: inspector.get_foreign_keys(t) for t in KEY_COLUMNS}
+    for table_name, fks in foreign_keys.items():
+        for fk in fks:
+            op.drop_constraint(fk["name"], table_name, type_="foreignkey")
+
+    for table_name, columns in KEY_COLUMNS.items():
+        for column in columns:
+            op.execute(
+                f"ALTER TABLE {table_name} ALTER COLUMN {column} "
+                f"TYPE {type_sql} USING {column}::{type_sql}"
+            )
+
+    for table_name, fks in foreign_keys.items():
+        for fk in fks:
+            op.create_foreign_key(
+                fk["name"],
+                table_name,
+                fk["referred_table"],
+                fk["constrained_columns"],
+                fk["referred_columns"],
+                **fk.get("options", {}),
+            )
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+    if conn.dialect.name == "postgresql":
+        _alter_postgres_types(conn, "uuid")
+        return
+
+    _drop_search_objects(conn)
+    _rewrite_sqlite_values(conn, _to_bytes)
+    _alter_sqlite_types(UUIDKey(), sa.String())
+    _create_search_objects(conn)
+
+
+def downgrade() -> None:
+    conn = op.get_bind()
+    if conn.dialect.name == "postgresql":
+        _alter_postgres_types(conn, "varchar")
+        return
+
+    _drop_search_objects(conn)
+    _rewrite_sqlite_values(conn, _to_text)
+    _alter_sqlite_types(sa.String(), UUIDKey())
+    _create_search_objects(conn)
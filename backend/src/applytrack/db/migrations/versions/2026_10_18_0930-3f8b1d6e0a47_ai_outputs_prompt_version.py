@@ -0,0 +1,39 @@
+"""ai outputs prompt version
+
+Record the prompt version each AI output was produced with and index the
+result-cache key (input_hash, kind, model, prompt_version, created_at) so the
+worker can reuse a stored output instead of calling the model.  Existing rows
+keep a NULL version and are never served from the cache.
+
+Revision ID: 3f8b1d6e0a47
+Revises: 9c4e1f7a2b63
+Create Date: 2026-10-18 09:30:42.518903
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3f8b1d6e0a47"
+down_revision: Union[str, None] = "9c4e1f7a2b63"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("ai_outputs", sa.Column("prompt_version", sa.String(), nullable=True))
+    op.create_index(
+        "ix_ai_outputs_cache_key",
+        "ai_outputs",
+        ["input_hash", "kind", "model", "prompt_version", "created_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_ai_outputs_cache_key", table_name="ai_outputs")
+    with op.batch_alter_table("ai_outputs") as batch_op:
+        batch_op.drop_column("prompt_version")
@@ -0,0 +1,49 @@
+"""reminders application due id indexes
+
+Serve the per-application reminder list's ``ORDER BY due_at, id`` straight
+from an index: add ``id`` to (application_id, done, due_at) for the
+``done``-filtered list, and add (application_id, due_at, id) for the
+unfiltered one the application page loads.
+
+Revision ID: 7d2e9a4c1b58
+Revises: 3f8b1d6e0a47
+Create Date: 2026-10-18 10:10:27.604113
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "7d2e9a4c1b58"
+down_revision: Union[str, None] = "3f8b1d6e0a47"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.drop_index("ix_reminders_application_done_due", table_name="reminders")
+    op.create_index(
+        "ix_reminders_application_done_due",
+        "reminders",
+        ["application_id", "done", "due_at", "id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_reminders_application_due",
+        "reminders",
+        ["application_id", "due_at", "id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_reminders_application_due", table_name="reminders")
+    op.drop_index("ix_reminders_application_done_due", table_name="reminders")
+    op.create_index(
+        "ix_reminders_application_done_due",
+        "reminders",
+        ["application_id", "done", "due_at"],
+        unique=False,
+    )
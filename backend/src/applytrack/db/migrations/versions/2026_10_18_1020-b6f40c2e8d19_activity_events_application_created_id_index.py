@@ -0,0 +1,41 @@
+"""activity events application created id index
+
+Add id to the timeline index: the timeline orders by ``created_at DESC,
+id DESC``, and without the tie-break column SQLite sorts the right part of
+the ORDER BY in a temp B-tree.
+
+Revision ID: b6f40c2e8d19
+Revises: 7d2e9a4c1b58
+Create Date: 2026-10-18 10:20:41.918270
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b6f40c2e8d19"
+down_revision: Union[str, None] = "7d2e9a4c1b58"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.drop_index("ix_activity_events_application_created", table_name="activity_events")
+    op.create_index(
+        "ix_activity_events_application_created",
+        "activity_events",
+        ["application_id", "created_at", "id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_activity_events_application_created", table_name="activity_events")
+    op.create_index(
+        "ix_activity_events_application_created",
+        "activity_events",
+        ["application_id", "created_at"],
+        unique=False,
+    )
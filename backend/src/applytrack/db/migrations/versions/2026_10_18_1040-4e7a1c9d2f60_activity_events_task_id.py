@@ -0,0 +1,81 @@
+"""activity events task id
+
+Copy the Celery task id of ``ai_requested`` events out of ``payload_json``
+into an indexed ``task_id`` column, so the AI stream endpoint can find the
+event that owns a task without scanning every event's JSON.
+
+Revision ID: 4e7a1c9d2f60
+Revises: b6f40c2e8d19
+Create Date: 2026-10-18 10:40:17.502913
+
+"""
+
+import uuid
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "4e7a1c9d2f60"
+down_revision: Union[str, None] = "b6f40c2e8d19"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+class UUIDKey(sa.types.TypeDecorator):
+    """Frozen copy of applytrack.db.types.UUIDKey."""
+
+    impl = sa.LargeBinary(16)
+    cache_ok = True
+
+    def load_dialect_impl(self, dialect):
+        if dialect.name == "postgresql":
+            return dialect.type_descriptor(postgresql.UUID(as_uuid=True))
+        return dialect.type_descriptor(sa.LargeBinary(16))
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        value = uuid.UUID(value)
+        return value if dialect.name == "postgresql" else value.bytes
+
+
+# id is left untyped so its stored form is read and written back unchanged
+activity_events = sa.table(
+    "activity_events",
+    sa.column("id"),
+    sa.column("type", sa.String),
+    sa.column("payload_json", sa.JSON),
+    sa.column("task_id", UUIDKey),
+)
+
+
+def _backfill(conn) -> None:
+    rows = conn.execute(
+        sa.select(
+            activity_events.c.id,
+            activity_events.c.payload_json["task_id"].as_string(),
+        ).where(activity_events.c.type == "ai_requested")
+    ).all()
+    params = [{"_id": event_id, "_task_id": task_id} for event_id, task_id in rows if task_id]
+    if params:
+        conn.execute(
+            activity_events.update()
+            .where(activity_events.c.id == sa.bindparam("_id"))
+            .values(task_id=sa.bindparam("_task_id")),
+            params,
+        )
+
+
+def upgrade() -> None:
+    op.add_column("activity_events", sa.Column("task_id", UUIDKey(), nullable=True))
+    _backfill(op.get_bind())
+    op.create_index("ix_activity_events_task_id", "activity_events", ["task_id"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_activity_events_task_id", table_name="activity_events")
+    with op.batch_alter_table("activity_events") as batch_op:
+        batch_op.drop_column("task_id")
@@ -12,3 +12,7 @@ from applytrack.db.models.job_posting import JobPosting, JobSource, RemoteType
 from applytrack.db.models.profile import Profile  # noqa: F401
 from applytrack.db.models.reminder import Reminder  # noqa: F401
 from applytrack.db.models.user import User  # noqa: F401
+
+# isort: split
+# search DDL hooks (pg_trgm / FTS5) must be registered before create_all runs
+import applytrack.db.search  # noqa: E402, F401
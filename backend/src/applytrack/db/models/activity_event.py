@@ -1,13 +1,13 @@
 """Activity event log for an application timeline."""
 
 import enum
-import uuid
 from typing import TYPE_CHECKING
 
-from sqlalchemy import JSON, DateTime, Enum, ForeignKey, String, func
+from sqlalchemy import JSON, DateTime, Enum, ForeignKey, Index, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from applytrack.db.base import Base
+from applytrack.db.base import Base, utcnow
+from applytrack.db.types import UUIDKey, new_id
 
 if TYPE_CHECKING:
     from applytrack.db.models.application import Application
@@ -24,14 +24,24 @@ class ActivityEventType(str, enum.Enum):
 
 class ActivityEvent(Base):
     __tablename__ = "activity_events"
+    __table_args__ = (
+        # timeline: WHERE application_id ORDER BY created_at DESC, id DESC
+        Index("ix_activity_events_application_created", "application_id", "created_at", "id"),
+        # AI stream ownership: WHERE task_id
+        Index("ix_activity_events_task_id", "task_id"),
+    )
 
-    id: Mapped[str] = mapped_column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
-    application_id: Mapped[str] = mapped_column(String, ForeignKey("applications.id"), index=True)
+    id: Mapped[str] = mapped_column(UUIDKey, primary_key=True, default=new_id)
+    application_id: Mapped[str] = mapped_column(UUIDKey, ForeignKey("applications.id"))
 
     type: Mapped[ActivityEventType] = mapped_column(Enum(ActivityEventType))
     payload_json: Mapped[dict | None] = mapped_column(JSON, nullable=True)
+    # the Celery task an ai_requested event enqueued
+    task_id: Mapped[str | None] = mapped_column(UUIDKey, nullable=True)
 
-    created_at: Mapped[DateTime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    created_at: Mapped[DateTime] = mapped_column(
+        DateTime(timezone=True), default=utcnow, server_default=func.now()
+    )
 
     application: Mapped["Application"] = relationship(
         "Application", back_populates="activity_events"
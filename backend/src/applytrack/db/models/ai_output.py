@@ -1,13 +1,13 @@
 """Stored AI output for an application."""
 
 import enum
-import uuid
 from typing import TYPE_CHECKING
 
-from sqlalchemy import JSON, DateTime, Enum, Float, ForeignKey, String, func
+from sqlalchemy import JSON, DateTime, Enum, Float, ForeignKey, Index, String, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from applytrack.db.base import Base
+from applytrack.db.types import UUIDKey, new_id
 
 if TYPE_CHECKING:
     from applytrack.db.models.application import Application
@@ -23,9 +23,22 @@ class AIOutputKind(str, enum.Enum):
 
 class AIOutput(Base):
     __tablename__ = "ai_outputs"
-
-    id: Mapped[str] = mapped_column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
-    application_id: Mapped[str] = mapped_column(String, ForeignKey("applications.id"), index=True)
+    __table_args__ = (
+        # list: WHERE application_id ORDER BY created_at DESC
+        Index("ix_ai_outputs_application_created", "application_id", "created_at"),
+        # result cache: WHERE input_hash, kind, model, prompt_version ORDER BY created_at DESC
+        Index(
+            "ix_ai_outputs_cache_key",
+            "input_hash",
+            "kind",
+            "model",
+            "prompt_version",
+            "created_at",
+        ),
+    )
+
+    id: Mapped[str] = mapped_column(UUIDKey, primary_key=True, default=new_id)
+    application_id: Mapped[str] = mapped_column(UUIDKey, ForeignKey("applications.id"))
 
     kind: Mapped[AIOutputKind] = mapped_column(Enum(AIOutputKind))
     input_hash: Mapped[str] = mapped_column(String)
@@ -34,6 +47,7 @@ class AIOutput(Base):
     evidence_json: Mapped[dict | None] = mapped_column(JSON, nullable=True)
 
     model: Mapped[str] = mapped_column(String)
+    prompt_version: Mapped[str | None] = mapped_column(String, nullable=True)
     latency_seconds: Mapped[float] = mapped_column(Float)
 
     created_at: Mapped[DateTime] = mapped_column(DateTime(timezone=True), server_default=func.now())
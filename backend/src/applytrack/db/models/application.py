@@ -1,13 +1,13 @@
 """Application — the central entity on the Kanban board."""
 
 import enum
-import uuid
 from typing import TYPE_CHECKING
 
-from sqlalchemy import DateTime, Enum, ForeignKey, Integer, String, Text, func
+from sqlalchemy import DateTime, Enum, ForeignKey, Index, Integer, Text, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from applytrack.db.base import Base
+from applytrack.db.base import Base, utcnow
+from applytrack.db.types import UUIDKey, new_id
 
 if TYPE_CHECKING:
     from applytrack.db.models.activity_event import ActivityEvent
@@ -34,10 +34,14 @@ class ApplicationPriority(str, enum.Enum):
 
 class Application(Base):
     __tablename__ = "applications"
+    __table_args__ = (
+        # list: WHERE user_id ORDER BY updated_at DESC, id DESC
+        Index("ix_applications_user_updated", "user_id", "updated_at", "id"),
+    )
 
-    id: Mapped[str] = mapped_column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
-    user_id: Mapped[str] = mapped_column(String, ForeignKey("users.id"), index=True)
-    job_posting_id: Mapped[str] = mapped_column(String, ForeignKey("job_postings.id"), index=True)
+    id: Mapped[str] = mapped_column(UUIDKey, primary_key=True, default=new_id)
+    user_id: Mapped[str] = mapped_column(UUIDKey, ForeignKey("users.id"))
+    job_posting_id: Mapped[str] = mapped_column(UUIDKey, ForeignKey("job_postings.id"), index=True)
 
     status: Mapped[ApplicationStatus] = mapped_column(
         Enum(ApplicationStatus), default=ApplicationStatus.not_applied
@@ -53,9 +57,11 @@ class Application(Base):
     )
     salary_expectation: Mapped[int | None] = mapped_column(Integer, nullable=True)
 
-    created_at: Mapped[DateTime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    created_at: Mapped[DateTime] = mapped_column(
+        DateTime(timezone=True), default=utcnow, server_default=func.now()
+    )
     updated_at: Mapped[DateTime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+        DateTime(timezone=True), default=utcnow, server_default=func.now(), onupdate=utcnow
     )
 
     # relationships
@@ -70,3 +76,14 @@ class Application(Base):
     activity_events: Mapped[list["ActivityEvent"]] = relationship(
         "ActivityEvent", back_populates="application", cascade="all, delete-orphan"
     )
+
+
+# list/board: WHERE user_id AND status ORDER BY updated_at DESC, id DESC.  Descending
+# keys let the board's per-status ROW_NUMBER() window read it without a sort.
+Index(
+    "ix_applications_user_status_updated",
+    Application.user_id,
+    Application.status,
+    Application.updated_at.desc(),
+    Application.id.desc(),
+)
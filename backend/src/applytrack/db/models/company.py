@@ -1,31 +1,55 @@
 """Company entity — user-scoped."""
 
-import uuid
 from typing import TYPE_CHECKING
 
-from sqlalchemy import DateTime, ForeignKey, String, Text, func
+from sqlalchemy import DateTime, ForeignKey, Index, String, Text, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from applytrack.db.base import Base
+from applytrack.db.base import Base, utcnow
+from applytrack.db.types import UUIDKey, new_id
 
 if TYPE_CHECKING:
     from applytrack.db.models.job_posting import JobPosting
     from applytrack.db.models.user import User
 
 
+def normalize_company_name(name: str) -> str:
+    """Case- and whitespace-insensitive key: "  ACME  corp" → "acme corp"."""
+    return " ".join(name.split()).casefold()
+
+
+def _default_normalized_name(context) -> str:
+    return normalize_company_name(context.get_current_parameters()["name"])
+
+
 class Company(Base):
     __tablename__ = "companies"
-
-    id: Mapped[str] = mapped_column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
-    user_id: Mapped[str] = mapped_column(String, ForeignKey("users.id"), index=True)
+    __table_args__ = (
+        # trigram index backs case-insensitive substring search (see db/search.py)
+        Index(
+            "ix_companies_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ).ddl_if(dialect="postgresql"),
+        # one company per user and name; also the ON CONFLICT target for the
+        # find-or-create upsert in create_application
+        Index("uq_companies_user_normalized_name", "user_id", "normalized_name", unique=True),
+    )
+
+    id: Mapped[str] = mapped_column(UUIDKey, primary_key=True, default=new_id)
+    user_id: Mapped[str] = mapped_column(UUIDKey, ForeignKey("users.id"))
     name: Mapped[str] = mapped_column(String, index=True)
+    normalized_name: Mapped[str] = mapped_column(String, default=_default_normalized_name)
     website_url: Mapped[str | None] = mapped_column(String, nullable=True)
     linkedin_url: Mapped[str | None] = mapped_column(String, nullable=True)
     careers_url: Mapped[str | None] = mapped_column(String, nullable=True)
     hq_location: Mapped[str | None] = mapped_column(String, nullable=True)
     notes: Mapped[str | None] = mapped_column(Text, nullable=True)
 
-    created_at: Mapped[DateTime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    created_at: Mapped[DateTime] = mapped_column(
+        DateTime(timezone=True), default=utcnow, server_default=func.now()
+    )
 
     user: Mapped["User"] = relationship("User")
     job_postings: Mapped[list["JobPosting"]] = relationship("JobPosting", back_populates="company")
@@ -1,13 +1,13 @@
 """Job posting — linked to a company and one or more applications."""
 
 import enum
-import uuid
 from typing import TYPE_CHECKING
 
-from sqlalchemy import DateTime, Enum, ForeignKey, String, Text, func
+from sqlalchemy import DateTime, Enum, ForeignKey, Index, String, Text, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from applytrack.db.base import Base
+from applytrack.db.base import Base, utcnow
+from applytrack.db.types import UUIDKey, new_id
 
 if TYPE_CHECKING:
     from applytrack.db.models.application import Application
@@ -29,10 +29,19 @@ class JobSource(str, enum.Enum):
 
 class JobPosting(Base):
     __tablename__ = "job_postings"
+    __table_args__ = (
+        # trigram index backs case-insensitive substring search (see db/search.py)
+        Index(
+            "ix_job_postings_title_trgm",
+            "title",
+            postgresql_using="gin",
+            postgresql_ops={"title": "gin_trgm_ops"},
+        ).ddl_if(dialect="postgresql"),
+    )
 
-    id: Mapped[str] = mapped_column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
+    id: Mapped[str] = mapped_column(UUIDKey, primary_key=True, default=new_id)
     company_id: Mapped[str | None] = mapped_column(
-        String, ForeignKey("companies.id"), nullable=True
+        UUIDKey, ForeignKey("companies.id"), nullable=True
     )
     title: Mapped[str] = mapped_column(String, index=True)
     location: Mapped[str | None] = mapped_column(String, nullable=True)
@@ -41,7 +50,9 @@ class JobPosting(Base):
     source: Mapped[JobSource] = mapped_column(Enum(JobSource), default=JobSource.other)
     description_raw: Mapped[str | None] = mapped_column(Text, nullable=True)
 
-    created_at: Mapped[DateTime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    created_at: Mapped[DateTime] = mapped_column(
+        DateTime(timezone=True), default=utcnow, server_default=func.now()
+    )
 
     company: Mapped["Company"] = relationship("Company", back_populates="job_postings")
     applications: Mapped[list["Application"]] = relationship(
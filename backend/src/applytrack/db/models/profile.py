@@ -1,12 +1,12 @@
 """User profile — the grounding data source for AI prompts."""
 
-import uuid
 from typing import TYPE_CHECKING
 
 from sqlalchemy import JSON, DateTime, ForeignKey, String, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from applytrack.db.base import Base
+from applytrack.db.types import UUIDKey, new_id
 
 if TYPE_CHECKING:
     from applytrack.db.models.user import User
@@ -15,8 +15,8 @@ if TYPE_CHECKING:
 class Profile(Base):
     __tablename__ = "profiles"
 
-    id: Mapped[str] = mapped_column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
-    user_id: Mapped[str] = mapped_column(String, ForeignKey("users.id"), unique=True, index=True)
+    id: Mapped[str] = mapped_column(UUIDKey, primary_key=True, default=new_id)
+    user_id: Mapped[str] = mapped_column(UUIDKey, ForeignKey("users.id"), unique=True, index=True)
 
     headline: Mapped[str | None] = mapped_column(String, nullable=True)
     summary: Mapped[str | None] = mapped_column(String, nullable=True)
@@ -1,12 +1,12 @@
 """Reminder — user-scoped, tied to an application."""
 
-import uuid
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, String, func
+from sqlalchemy import Boolean, DateTime, ForeignKey, Index, String, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from applytrack.db.base import Base
+from applytrack.db.types import UUIDKey, new_id
 
 if TYPE_CHECKING:
     from applytrack.db.models.application import Application
@@ -14,10 +14,18 @@ if TYPE_CHECKING:
 
 class Reminder(Base):
     __tablename__ = "reminders"
-
-    id: Mapped[str] = mapped_column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
-    application_id: Mapped[str] = mapped_column(String, ForeignKey("applications.id"), index=True)
-    user_id: Mapped[str] = mapped_column(String, ForeignKey("users.id"), index=True)
+    __table_args__ = (
+        # list: WHERE user_id [AND done] ORDER BY due_at
+        Index("ix_reminders_user_due", "user_id", "due_at"),
+        Index("ix_reminders_user_done_due", "user_id", "done", "due_at"),
+        # per-application list: WHERE application_id [AND done] ORDER BY due_at, id
+        Index("ix_reminders_application_due", "application_id", "due_at", "id"),
+        Index("ix_reminders_application_done_due", "application_id", "done", "due_at", "id"),
+    )
+
+    id: Mapped[str] = mapped_column(UUIDKey, primary_key=True, default=new_id)
+    application_id: Mapped[str] = mapped_column(UUIDKey, ForeignKey("applications.id"))
+    user_id: Mapped[str] = mapped_column(UUIDKey, ForeignKey("users.id"))
 
     text: Mapped[str] = mapped_column(String)
     due_at: Mapped[DateTime] = mapped_column(DateTime(timezone=True))
@@ -0,0 +1,103 @@
+"""Connection pool profiles and checkout instrumentation.
+
+The API and the Celery worker build their engines from the same ``DB_POOL_*``
+settings but size the pool separately: the API serves many concurrent
+requests, while a worker process runs one task at a time per thread.  Pools
+record how long each checkout took, so exhaustion shows up as wait time in
+``pool_status`` before it turns into ``TimeoutError``s.
+"""
+
+import threading
+import time
+from typing import Literal
+
+from sqlalchemy import exc
+from sqlalchemy.engine import make_url
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+from applytrack.core.config import settings
+
+
+class _CheckoutStats:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+
+    def record(self, seconds: float, timed_out: bool) -> None:
+        with self._lock:
+            self.checkouts += 1
+            self.timeouts += timed_out
+            self.wait_total += seconds
+            self.wait_max = max(self.wait_max, seconds)
+
+
+class _InstrumentedPool:
+    """Mixin timing ``connect()``: waiting for a free slot plus opening a connection."""
+
+    def __init__(self, *args, **kw):
+        super().__init__(*args, **kw)
+        self.checkout_stats = _CheckoutStats()
+
+    def connect(self):
+        start = time.perf_counter()
+        timed_out = False
+        try:
+            return super().connect()
+        except exc.TimeoutError:
+            timed_out = True
+            raise
+        finally:
+            self.checkout_stats.record(time.perf_counter() - start, timed_out)
+
+
+class InstrumentedQueuePool(_InstrumentedPool, QueuePool):
+    pass
+
+
+class InstrumentedAsyncQueuePool(_InstrumentedPool, AsyncAdaptedQueuePool):
+    pass
+
+
+def pool_options(url: str, profile: Literal["api", "worker"]) -> dict:
+    """``create_engine`` / ``create_async_engine`` pool arguments for *url*."""
+    url = make_url(url)
+    if url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:"):
+        # in-memory SQLite is one connection shared through a StaticPool
+        return {}
+    if profile == "api":
+        size, overflow = settings.db_pool_size, settings.db_max_overflow
+    else:
+        size, overflow = settings.worker_db_pool_size, settings.worker_db_max_overflow
+    is_async = url.get_dialect().is_async
+    return {
+        "poolclass": InstrumentedAsyncQueuePool if is_async else InstrumentedQueuePool,
+        "pool_size": size,
+        "max_overflow": overflow,
+        "pool_timeout": settings.db_pool_timeout,
+        "pool_recycle": settings.db_pool_recycle,
+        "pool_pre_ping": settings.db_pool_pre_ping,
+    }
+
+
+def pool_status(pool) -> dict:
+    """Live occupancy and checkout wait times for a pool built by ``pool_options``."""
+    if not isinstance(pool, _InstrumentedPool):
+        return {"pool": type(pool).__name__}
+    stats = pool.checkout_stats
+    return {
+        "pool": type(pool).__name__,
+        "size": pool.size(),
+        "checked_out": pool.checkedout(),
+        "checked_in": pool.checkedin(),
+        "overflow": max(0, pool.overflow()),
+        "max_overflow": pool._max_overflow,
+        "checkouts": stats.checkouts,
+        "timeouts": stats.timeouts,
+        "wait_avg_ms": round(stats.wait_total / stats.checkouts * 1000, 3)
+        if stats.checkouts
+        else 0.0,
+        "wait_max_ms": round(stats.wait_max * 1000, 3),
+    }
@@ -0,0 +1,31 @@
+"""Startup check that the database schema is at the code's Alembic head.
+
+Cheaper than ``create_all`` on every boot (one query against
+``alembic_version`` plus reading the revision scripts) and, unlike
+``create_all``, it notices a database that is missing migrations.
+"""
+
+from alembic.config import Config
+from alembic.runtime.migration import MigrationContext
+from alembic.script import ScriptDirectory
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from applytrack.core.config import settings
+
+
+def head_revisions() -> set[str]:
+    return set(ScriptDirectory.from_config(Config(settings.alembic_config)).get_heads())
+
+
+async def check_schema_revision(engine: AsyncEngine) -> None:
+    """Raise ``RuntimeError`` unless the database is stamped at the head revision."""
+    async with engine.connect() as conn:
+        current = await conn.run_sync(
+            lambda sync_conn: set(MigrationContext.configure(sync_conn).get_current_heads())
+        )
+    expected = head_revisions()
+    if current != expected:
+        raise RuntimeError(
+            f"Database is at revision {', '.join(sorted(current)) or '<none>'}, "
+            f"expected {', '.join(sorted(expected))}; run `alembic upgrade head`"
+        )
@@ -0,0 +1,181 @@
+"""Server-side application search on job title and company name.
+
+Postgres: ``pg_trgm`` GIN indexes on ``job_postings.title`` and
+``companies.name`` (declared on the models) let ``ILIKE '%term%'`` use an
+index instead of scanning every row.  Each table is matched in a subquery of
+its own, which the planner runs once off its index.
+
+SQLite: an FTS5 shadow table with the trigram tokenizer mirrors
+``(title, company_name)`` per application and is kept in sync by triggers.
+Rows are keyed by ``application_id`` rather than ``rowid`` because SQLite may
+renumber implicit rowids on ``VACUUM``.
+Trigram matching needs at least three characters, so shorter terms fall back
+to a plain case-insensitive ``LIKE`` over the joined rows.
+"""
+
+from sqlalchemy import DDL, column, event, literal_column, or_, select, table
+from sqlalchemy.sql import Select
+
+from applytrack.db.base import Base
+from applytrack.db.models.application import Application
+from applytrack.db.models.company import Company
+from applytrack.db.models.job_posting import JobPosting
+
+SEARCH_TABLE = "application_search"
+MIN_FTS_TERM_LENGTH = 3
+
+application_search = table(SEARCH_TABLE, column("application_id"))
+
+# --- postgres ---
+
+PG_TRGM_EXTENSION = "CREATE EXTENSION IF NOT EXISTS pg_trgm"
+
+# --- sqlite ---
+
+SQLITE_SEARCH_DDL = [
+    f"""
+    CREATE VIRTUAL TABLE IF NOT EXISTS {SEARCH_TABLE} USING fts5(
+        application_id UNINDEXED,
+        title,
+        company_name,
+        tokenize = 'trigram'
+    )
+    """,
+    # backfill once, for databases that already hold applications
+    f"""
+    INSERT INTO {SEARCH_TABLE} (application_id, title, company_name)
+    SELECT a.id, p.title, c.name
+    FROM applications a
+    JOIN job_postings p ON p.id = a.job_posting_id
+    LEFT JOIN companies c ON c.id = p.company_id
+    WHERE NOT EXISTS (SELECT 1 FROM {SEARCH_TABLE})
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS applications_search_ai AFTER INSERT ON applications
+    BEGIN
+        INSERT INTO {SEARCH_TABLE} (application_id, title, company_name)
+        SELECT NEW.id, p.title, c.name
+        FROM job_postings p LEFT JOIN companies c ON c.id = p.company_id
+        WHERE p.id = NEW.job_posting_id;
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS applications_search_ad AFTER DELETE ON applications
+    BEGIN
+        DELETE FROM {SEARCH_TABLE} WHERE application_id = OLD.id;
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS applications_search_au
+    AFTER UPDATE OF job_posting_id ON applications
+    BEGIN
+        DELETE FROM {SEARCH_TABLE} WHERE application_id = OLD.id;
+        INSERT INTO {SEARCH_TABLE} (application_id, title, company_name)
+        SELECT NEW.id, p.title, c.name
+        FROM job_postings p LEFT JOIN companies c ON c.id = p.company_id
+        WHERE p.id = NEW.job_posting_id;
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS job_postings_search_au
+    AFTER UPDATE OF title, company_id ON job_postings
+    BEGIN
+        UPDATE {SEARCH_TABLE}
+        SET title = NEW.title,
+            company_name = (SELECT name FROM companies WHERE id = NEW.company_id)
+        WHERE application_id IN (SELECT id FROM applications WHERE job_posting_id = NEW.id);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS companies_search_au AFTER UPDATE OF name ON companies
+    BEGIN
+        UPDATE {SEARCH_TABLE}
+        SET company_name = NEW.name
+        WHERE application_id IN (
+            SELECT a.id FROM applications a
+            JOIN job_postings p ON p.id = a.job_posting_id
+            WHERE p.company_id = NEW.id
+        );
+    END
+    """,
+]
+
+SQLITE_SEARCH_TRIGGERS = (
+    "applications_search_ai",
+    "applications_search_ad",
+    "applications_search_au",
+    "job_postings_search_au",
+    "companies_search_au",
+)
+
+# triggers first: a dangling trigger body breaks later ALTER TABLE ... RENAME
+SQLITE_SEARCH_DROP = [f"DROP TRIGGER IF EXISTS {name}" for name in SQLITE_SEARCH_TRIGGERS] + [
+    f"DROP TABLE IF EXISTS {SEARCH_TABLE}"
+]
+
+
+def create_search_objects(connection) -> None:
+    """Create the dialect-specific search infrastructure on *connection*.
+
+    Safe to run repeatedly; used by ``create_all`` hooks and migrations.
+    """
+    if connection.dialect.name == "sqlite":
+        for stmt in SQLITE_SEARCH_DDL:
+            connection.exec_driver_sql(stmt)
+
+
+def drop_search_objects(connection) -> None:
+    if connection.dialect.name == "sqlite":
+        for stmt in SQLITE_SEARCH_DROP:
+            connection.exec_driver_sql(stmt)
+
+
+event.listen(
+    Base.metadata,
+    "before_create",
+    DDL(PG_TRGM_EXTENSION).execute_if(dialect="postgresql"),
+)
+
+
+@event.listens_for(Base.metadata, "after_create")
+def _after_create(target, connection, **kw):
+    create_search_objects(connection)
+
+
+@event.listens_for(Base.metadata, "before_drop")
+def _before_drop(target, connection, **kw):
+    drop_search_objects(connection)
+
+
+def _fts_phrase(term: str) -> str:
+    """Quote *term* as a single FTS5 phrase so user input is never parsed as syntax."""
+    return '"' + term.replace('"', '""') + '"'
+
+
+def _contains_pattern(term: str) -> str:
+    """Build a ``LIKE`` pattern with wildcards in *term* escaped by ``/``."""
+    escaped = term.replace("/", "//").replace("%", "/%").replace("_", "/_")
+    return f"%{escaped}%"
+
+
+def apply_search(stmt: Select, term: str, dialect_name: str) -> Select:
+    """Restrict an ``Application`` select to rows whose role or company contains *term*."""
+    term = term.strip()
+    if not term:
+        return stmt
+
+    if dialect_name == "sqlite" and len(term) >= MIN_FTS_TERM_LENGTH:
+        matching = select(application_search.c.application_id).where(
+            literal_column(SEARCH_TABLE).match(_fts_phrase(term))
+        )
+        return stmt.where(Application.id.in_(matching))
+
+    # a complete literal pattern lets the planner pick the trigram index; each
+    # table is filtered in its own subquery, as an OR across the joined tables
+    # can use neither index
+    pattern = _contains_pattern(term)
+    titles = select(JobPosting.id).where(JobPosting.title.ilike(pattern, escape="/"))
+    companies = select(Company.id).where(Company.name.ilike(pattern, escape="/"))
+    return stmt.join(Application.job_posting).where(
+        or_(Application.job_posting_id.in_(titles), JobPosting.company_id.in_(companies))
+    )
@@ -1,10 +1,21 @@
-"""Async SQLAlchemy session factory and FastAPI dependency."""
+"""Async SQLAlchemy session factories and FastAPI dependency.
+
+``engine`` is the primary.  With ``DATABASE_READ_URL`` set, ``read_engine``
+points at a read replica and ``ReadSessionLocal`` opens sessions on it;
+otherwise both names alias the primary.  Route reads through
+``api.deps.get_read_db``, which also handles read-your-writes.
+"""
 
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
 from applytrack.core.config import settings
+from applytrack.db.pool import pool_options
+from applytrack.db.sqlite import configure_sqlite
 
-engine = create_async_engine(settings.database_url, echo=False)
+engine = create_async_engine(
+    settings.database_url, echo=False, **pool_options(settings.database_url, "api")
+)
+configure_sqlite(engine.sync_engine)
 
 AsyncSessionLocal = async_sessionmaker(
     bind=engine,
@@ -13,6 +24,23 @@ AsyncSessionLocal = async_sessionmaker(
     autoflush=False,
 )
 
+if settings.database_read_url:
+    read_engine = create_async_engine(
+        settings.database_read_url,
+        echo=False,
+        **pool_options(settings.database_read_url, "api"),
+    )
+    configure_sqlite(read_engine.sync_engine)
+    ReadSessionLocal = async_sessionmaker(
+        bind=read_engine,
+        class_=AsyncSession,
+        expire_on_commit=False,
+        autoflush=False,
+    )
+else:
+    read_engine = engine
+    ReadSessionLocal = AsyncSessionLocal
+
 
 async def get_db():
     """Yield a database session, auto-close on exit."""
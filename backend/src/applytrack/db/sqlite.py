@@ -0,0 +1,49 @@
+"""SQLite connection profile for single-node deployments.
+
+With the default rollback journal a writer locks out every reader, so the API
+and the Celery worker stall each other on ``database is locked``.  WAL lets
+readers run alongside the single writer; ``busy_timeout`` makes a blocked
+writer wait instead of failing; ``synchronous=NORMAL`` is durable across
+application crashes in WAL mode and skips an fsync per commit; mmap and a
+larger page cache keep hot pages out of read() calls.
+"""
+
+from sqlalchemy import Engine, event
+
+from applytrack.core.config import settings
+
+
+def sqlite_pragmas() -> list[str]:
+    return [
+        "PRAGMA journal_mode=WAL",
+        f"PRAGMA busy_timeout={settings.sqlite_busy_timeout_ms}",
+        "PRAGMA synchronous=NORMAL",
+        f"PRAGMA mmap_size={settings.sqlite_mmap_size_mb * 1024 * 1024}",
+        # negative cache_size is in KiB rather than pages
+        f"PRAGMA cache_size=-{settings.sqlite_cache_size_mb * 1024}",
+        "PRAGMA temp_store=MEMORY",
+    ]
+
+
+def configure_sqlite(engine: Engine) -> None:
+    """Apply the profile to every new connection of a file-backed SQLite engine.
+
+    Pass ``AsyncEngine.sync_engine`` for async engines.  No-op for other
+    databases, in-memory SQLite or when ``SQLITE_TUNING`` is off.
+    """
+    url = engine.url
+    if url.get_backend_name() != "sqlite" or url.database in (None, "", ":memory:"):
+        return
+    if not settings.sqlite_tuning:
+        return
+
+    pragmas = sqlite_pragmas()
+
+    @event.listens_for(engine, "connect")
+    def _apply(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for pragma in pragmas:
+                cursor.execute(pragma)
+        finally:
+            cursor.close()
@@ -0,0 +1,64 @@
+"""Column types shared by the models.
+
+``UUIDKey`` stores identifiers compactly (native ``uuid`` on Postgres, a
+16-byte ``BLOB`` elsewhere) instead of 36-character text, which also shrinks
+every foreign key and index that copies them.  Python code keeps working with
+the canonical string form, so schemas, URLs and cursors are unchanged.
+"""
+
+import os
+import time
+import uuid
+
+from sqlalchemy import LargeBinary
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.types import TypeDecorator
+
+from applytrack.core.config import settings
+
+
+def uuid7() -> uuid.UUID:
+    """RFC 9562 version 7 UUID: 48-bit Unix milliseconds, then random bits.
+
+    Values generated later sort later, so inserts append to the primary-key
+    B-tree instead of landing on random pages.
+    """
+    ms = time.time_ns() // 1_000_000
+    rand = int.from_bytes(os.urandom(10), "big")
+    value = (ms & (1 << 48) - 1) << 80 | rand & ~(0xF << 76 | 0b11 << 62)
+    value |= 0x7 << 76 | 0b10 << 62  # version and variant bits
+    return uuid.UUID(int=value)
+
+
+def new_id() -> str:
+    """Primary-key default: UUIDv4, or time-ordered UUIDv7 with ID_UUID_VERSION=7."""
+    return str(uuid7() if settings.id_uuid_version == 7 else uuid.uuid4())
+
+
+class UUIDKey(TypeDecorator):
+    impl = LargeBinary(16)
+    cache_ok = True
+
+    def load_dialect_impl(self, dialect):
+        if dialect.name == "postgresql":
+            return dialect.type_descriptor(postgresql.UUID(as_uuid=True))
+        return dialect.type_descriptor(LargeBinary(16))
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        if not isinstance(value, uuid.UUID):
+            try:
+                value = uuid.UUID(value)
+            except (TypeError, ValueError):
+                # not a UUID, so it can't match any stored key: lookups by a
+                # malformed id from a URL become "not found", not a DB error
+                return None
+        return value if dialect.name == "postgresql" else value.bytes
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        if isinstance(value, bytes):
+            return str(uuid.UUID(bytes=value))
+        return str(value)
@@ -0,0 +1,48 @@
+"""``INSERT ... ON CONFLICT`` helpers for the dialects we run on.
+
+Both PostgreSQL and SQLite (3.35+) support ``ON CONFLICT DO NOTHING`` with
+``RETURNING``, but SQLAlchemy exposes it through dialect-specific
+``insert()`` constructs.
+"""
+
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from applytrack.db.models.company import Company, normalize_company_name
+
+COMPANY_CONFLICT_TARGET = ("user_id", "normalized_name")
+
+
+def dialect_insert(model, dialect_name: str):
+    """The dialect's ``insert()``, which adds ``on_conflict_do_*``."""
+    if dialect_name == "postgresql":
+        return postgresql.insert(model)
+    if dialect_name == "sqlite":
+        return sqlite.insert(model)
+    raise NotImplementedError(f"ON CONFLICT is not supported on {dialect_name}")
+
+
+async def get_or_create_company(db: AsyncSession, user_id: str, name: str) -> Company:
+    """Find-or-create in one statement; a second only when the company exists.
+
+    The unique ``(user_id, normalized_name)`` index makes this safe under
+    concurrent requests: the loser's insert is a no-op and it reads the
+    winner's row.
+    """
+    normalized = normalize_company_name(name)
+    stmt = (
+        dialect_insert(Company, db.get_bind().dialect.name)
+        .values(user_id=user_id, name=name, normalized_name=normalized)
+        .on_conflict_do_nothing(index_elements=COMPANY_CONFLICT_TARGET)
+        .returning(Company)
+    )
+    company = (await db.scalars(stmt)).first()
+    if company is None:
+        company = await db.scalar(
+            select(Company).where(
+                Company.user_id == user_id,
+                Company.normalized_name == normalized,
+            )
+        )
+    return company
@@ -0,0 +1,96 @@
+"""Import applications for an existing user from a CSV or JSON Lines file.
+
+Run with:  python -m applytrack.import_applications --email you@example.com apps.csv
+
+Columns / keys follow the API's create payload: company_name, role_title,
+job_url, job_description, status, priority, notes.  The file is streamed in
+chunks, so spreadsheets with thousands of rows import in constant memory.
+"""
+
+import argparse
+import asyncio
+import logging
+import sys
+from collections.abc import AsyncIterator
+from pathlib import Path
+
+from sqlalchemy import select
+
+from applytrack.db.base import Base
+from applytrack.db.models import User
+from applytrack.db.session import AsyncSessionLocal, engine
+from applytrack.schemas.application import ImportResult
+from applytrack.services.importer import (
+    BATCH_SIZE,
+    ApplicationImporter,
+    ImportFormat,
+    iter_lines,
+    iter_records,
+)
+
+log = logging.getLogger(__name__)
+
+CHUNK_SIZE = 64 * 1024
+
+
+async def _read_chunks(path: Path) -> AsyncIterator[bytes]:
+    with path.open("rb") as f:
+        while chunk := f.read(CHUNK_SIZE):
+            yield chunk
+
+
+def _log_progress(result: ImportResult) -> None:
+    log.info(
+        "%d rows processed: %d imported, %d failed",
+        result.processed,
+        result.imported,
+        result.failed,
+    )
+
+
+async def import_file(email: str, path: Path, fmt: ImportFormat, batch_size: int) -> int:
+    # create tables if they don't exist (handy for sqlite dev)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    async with AsyncSessionLocal() as db:
+        user = (await db.execute(select(User).where(User.email == email))).scalars().first()
+        if not user:
+            log.error("No user with email %s", email)
+            return 1
+
+        importer = ApplicationImporter(db, user.id, batch_size, on_progress=_log_progress)
+        result = await importer.run(iter_records(iter_lines(_read_chunks(path)), fmt))
+
+    for err in result.errors:
+        log.warning("row %d: %s", err.row, err.error)
+    if result.failed > len(result.errors):
+        log.warning("... and %d more failed rows", result.failed - len(result.errors))
+    log.info(
+        "Imported %d applications (%d new companies) from %s",
+        result.imported,
+        result.companies_created,
+        path,
+    )
+    return 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("path", type=Path, help="CSV or .jsonl file")
+    parser.add_argument("--email", required=True, help="owner of the imported applications")
+    parser.add_argument(
+        "--format",
+        choices=[f.value for f in ImportFormat],
+        help="defaults to the file extension (.jsonl / .ndjson → jsonl, otherwise csv)",
+    )
+    parser.add_argument("--batch-size", type=int, default=BATCH_SIZE)
+    args = parser.parse_args()
+
+    fmt = args.format or ("jsonl" if args.path.suffix.lower() in (".jsonl", ".ndjson") else "csv")
+    sys.exit(asyncio.run(import_file(args.email, args.path, ImportFormat(fmt), args.batch_size)))
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    main()
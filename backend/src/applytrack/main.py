@@ -3,12 +3,14 @@
 import logging
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI
+from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 
 from applytrack.api.router import api_router
 from applytrack.core.config import settings
+from applytrack.core.security import password_hash_stats
 from applytrack.db.base import Base
+from applytrack.db.pool import pool_status
 from applytrack.db.session import engine
 
 log = logging.getLogger(__name__)
@@ -16,13 +18,19 @@ log = logging.getLogger(__name__)
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    """Create tables on startup (for quick-start without Alembic)."""
-    # Import all models so Base.metadata is populated
-    import applytrack.db.models  # noqa: F401
+    """Prepare the schema according to DB_STARTUP."""
+    if settings.db_startup == "create_all":
+        # Import all models so Base.metadata is populated
+        import applytrack.db.models  # noqa: F401
 
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-    log.info("Database tables ensured.")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        log.info("Database tables ensured.")
+    elif settings.db_startup == "check":
+        from applytrack.db.revision import check_schema_revision
+
+        await check_schema_revision(engine)
+        log.info("Database schema is at the migration head.")
     yield
 
 
@@ -51,4 +59,24 @@ async def health():
     return {
         "status": "ok",
         "ai_mode": settings.ai_mode,
+        "password_hash": password_hash_stats(),
     }
+
+
+@app.get("/health/ai-cache")
+async def ai_cache_health():
+    """AI result-cache hits and misses, summed over every worker process."""
+    from redis.exceptions import RedisError
+
+    from applytrack.services.ai.cache import lookup_counts
+
+    try:
+        return await lookup_counts()
+    except RedisError:
+        raise HTTPException(status_code=503, detail="Redis unavailable")
+
+
+@app.get("/health/db-pool")
+async def db_pool_health():
+    """API engine pool occupancy and checkout wait times (per process)."""
+    return pool_status(engine.pool)
@@ -0,0 +1,24 @@
+"""Activity timeline schemas."""
+
+from datetime import datetime
+
+from pydantic import BaseModel
+
+from applytrack.db.models.activity_event import ActivityEventType
+
+
+class ActivityEventResponse(BaseModel):
+    id: str
+    application_id: str
+    type: ActivityEventType
+    payload_json: dict | None = None
+    created_at: datetime
+
+    model_config = {"from_attributes": True}
+
+
+class ActivityPage(BaseModel):
+    """One keyset page of timeline events, newest first."""
+
+    items: list[ActivityEventResponse]
+    next_cursor: str | None = None
@@ -11,7 +11,9 @@ from applytrack.schemas.company import CompanyResponse
 # --- job posting ---
 
 
-class JobPostingResponse(BaseModel):
+class JobPostingSummary(BaseModel):
+    """Job posting without the pasted description, for list payloads."""
+
     id: str
     title: str
     company_id: str | None = None
@@ -19,7 +21,6 @@ class JobPostingResponse(BaseModel):
     remote_type: RemoteType
     posting_url: str | None = None
     source: JobSource
-    description_raw: str | None = None
     created_at: datetime
 
     company: CompanyResponse | None = None
@@ -27,6 +28,10 @@ class JobPostingResponse(BaseModel):
     model_config = {"from_attributes": True}
 
 
+class JobPostingResponse(JobPostingSummary):
+    description_raw: str | None = None
+
+
 # --- application ---
 
 
@@ -50,19 +55,86 @@ class ApplicationUpdate(BaseModel):
     salary_expectation: int | None = None
 
 
-class ApplicationResponse(BaseModel):
+class ApplicationBulkUpdateItem(BaseModel):
+    id: str
+    status: ApplicationStatus | None = None
+    priority: ApplicationPriority | None = None
+
+
+class ApplicationBulkUpdateResult(BaseModel):
+    id: str
+    status: ApplicationStatus
+    priority: ApplicationPriority
+    updated_at: datetime
+
+    model_config = {"from_attributes": True}
+
+
+class ApplicationSummary(BaseModel):
+    """List/board card: every column except the ``Text`` bodies.
+
+    ``notes`` and ``job_posting.description_raw`` are only returned by
+    ``GET /applications/{id}``.
+    """
+
     id: str
     user_id: str
     job_posting_id: str
     status: ApplicationStatus
     priority: ApplicationPriority
-    notes: str
     applied_at: datetime | None = None
     next_followup_at: datetime | None = None
     salary_expectation: int | None = None
     created_at: datetime
     updated_at: datetime
 
-    job_posting: JobPostingResponse | None = None
+    job_posting: JobPostingSummary | None = None
 
     model_config = {"from_attributes": True}
+
+
+class ApplicationResponse(ApplicationSummary):
+    notes: str
+
+    job_posting: JobPostingResponse | None = None
+
+
+class ApplicationPage(BaseModel):
+    """One keyset page of applications, newest activity first."""
+
+    items: list[ApplicationSummary]
+    next_cursor: str | None = None
+
+
+class BoardColumn(BaseModel):
+    """One Kanban column: total count plus the most recently updated cards.
+
+    ``next_cursor`` continues the column via
+    ``GET /applications?status=<status>&cursor=<next_cursor>``.
+    """
+
+    status: ApplicationStatus
+    count: int
+    items: list[ApplicationSummary]
+    next_cursor: str | None = None
+
+
+class BoardResponse(BaseModel):
+    columns: list[BoardColumn]
+
+
+# --- bulk import ---
+
+
+class ImportRowError(BaseModel):
+    row: int  # 1-based data row, header excluded
+    error: str
+
+
+class ImportResult(BaseModel):
+    processed: int = 0
+    imported: int = 0
+    failed: int = 0
+    companies_created: int = 0
+    # first MAX_REPORTED_ERRORS failures only; ``failed`` has the full count
+    errors: list[ImportRowError] = []
@@ -22,6 +22,15 @@ class TokenPayload(BaseModel):
     sub: str | None = None
 
 
+class CurrentUser(BaseModel):
+    """The authenticated user's identity, cached by ``get_current_user``."""
+
+    id: str
+    email: EmailStr
+
+    model_config = {"from_attributes": True, "frozen": True}
+
+
 class UserResponse(BaseModel):
     id: str
     email: EmailStr
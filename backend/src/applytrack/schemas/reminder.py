@@ -26,3 +26,10 @@ class ReminderResponse(BaseModel):
     created_at: datetime
 
     model_config = {"from_attributes": True}
+
+
+class ReminderPage(BaseModel):
+    """One keyset page of reminders, soonest due first."""
+
+    items: list[ReminderResponse]
+    next_cursor: str | None = None
@@ -0,0 +1,28 @@
+"""Dashboard statistics schemas."""
+
+from datetime import date
+
+from pydantic import BaseModel
+
+from applytrack.db.models.application import ApplicationStatus
+
+
+class WeeklyCount(BaseModel):
+    week_start: date  # Monday
+    count: int
+
+
+class ReminderStats(BaseModel):
+    open: int
+    overdue: int
+    due_next_7_days: int
+
+
+class StatsResponse(BaseModel):
+    total: int
+    status_counts: dict[ApplicationStatus, int]
+    # share of submitted applications (applied or later) that got an answer:
+    # interview, offer or rejected
+    response_rate: float
+    applications_per_week: list[WeeklyCount]
+    reminders: ReminderStats
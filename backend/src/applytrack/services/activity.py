@@ -0,0 +1,30 @@
+"""Activity event recorder for application timelines.
+
+``record_event`` only adds the row to the session, so it is written by the
+caller's own commit: same transaction as the change it describes and no extra
+round trip.  Works with both the async API session and the sync worker
+session.
+"""
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from applytrack.db.base import utcnow
+from applytrack.db.models.activity_event import ActivityEvent, ActivityEventType
+
+
+def record_event(
+    db: AsyncSession | Session,
+    application_id: str,
+    type: ActivityEventType,
+    **payload,
+) -> ActivityEvent:
+    event = ActivityEvent(
+        application_id=application_id,
+        type=type,
+        payload_json=payload or None,
+        # stamped now rather than at flush, which may be much later in a worker
+        created_at=utcnow(),
+    )
+    db.add(event)
+    return event
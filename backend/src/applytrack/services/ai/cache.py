@@ -0,0 +1,115 @@
+"""Reuse stored AI outputs instead of calling the model again.
+
+An output is reusable when it was produced for the same kind, the same input
+hash (job description plus, for profile-based kinds, the profile), the same
+model and the same prompt version.  Mock mode records its outputs under the
+model ``"mock"``, so they are never served once real mode is on.  The lookup
+is global, so applications that share a posting text share its parse too.
+Rows written before prompt versions were recorded have none and never match.
+
+Every lookup is logged and counted as a hit or a miss.  The counters live in
+Redis so every worker process adds to the same pair; ``GET /health/ai-cache``
+reads them.  Counting is best effort: without Redis the task goes on.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from applytrack.core.config import settings
+from applytrack.db.models.ai_output import AIOutput, AIOutputKind
+from applytrack.db.models.profile import Profile
+
+log = logging.getLogger(__name__)
+
+HIT_KEY = "applytrack:ai_cache:hit"
+MISS_KEY = "applytrack:ai_cache:miss"
+
+_redis = None  # worker side, synchronous
+_async_redis = None  # API side
+_redis_lock = threading.Lock()
+
+
+def _forget_clients() -> None:
+    global _redis, _async_redis, _redis_lock
+    _redis = _async_redis = None
+    _redis_lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_forget_clients)
+
+
+def profile_dict(profile: Profile) -> dict:
+    return {
+        "headline": profile.headline,
+        "summary": profile.summary,
+        "skills": profile.skills_json or [],
+        "projects": profile.projects_json or [],
+        "experience": profile.experience_json or [],
+    }
+
+
+def hash_inputs(jd_text: str, profile_data: dict) -> str:
+    """Fingerprint of a task's inputs; the API and the worker must agree on it."""
+    h = hashlib.sha256()
+    for part in (jd_text, json.dumps(profile_data)):
+        h.update(str(part).encode())
+    return h.hexdigest()[:16]
+
+
+def find_cached_output(
+    session: Session,
+    kind: AIOutputKind,
+    input_hash: str,
+    model: str,
+    prompt_version: str,
+) -> AIOutput | None:
+    """Newest stored output for this cache key, logging the hit or miss."""
+    output = session.scalars(
+        select(AIOutput)
+        .where(
+            AIOutput.input_hash == input_hash,
+            AIOutput.kind == kind,
+            AIOutput.model == model,
+            AIOutput.prompt_version == prompt_version,
+        )
+        .order_by(AIOutput.created_at.desc())
+        .limit(1)
+    ).first()
+
+    log.info("AI cache %s for %s (model=%s)", "hit" if output else "miss", kind.value, model)
+    return output
+
+
+def count_lookup(hit: bool) -> None:
+    """Add one lookup to the shared counters (blocking; keep it off event loops)."""
+    global _redis
+    from redis.exceptions import RedisError
+
+    with _redis_lock:
+        if _redis is None:
+            from redis import Redis
+
+            _redis = Redis.from_url(settings.redis_url)
+        redis = _redis
+    try:
+        redis.incr(HIT_KEY if hit else MISS_KEY)
+    except RedisError:
+        log.warning("AI cache: Redis unavailable, %s not counted", "hit" if hit else "miss")
+
+
+async def lookup_counts() -> dict[str, int]:
+    """Hits and misses counted by every worker; raises ``RedisError`` without Redis."""
+    global _async_redis
+    if _async_redis is None:
+        from redis.asyncio import Redis
+
+        _async_redis = Redis.from_url(settings.redis_url)
+    hits, misses = await _async_redis.mget(HIT_KEY, MISS_KEY)
+    return {"hits": int(hits or 0), "misses": int(misses or 0)}
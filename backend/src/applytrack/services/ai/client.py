@@ -3,25 +3,107 @@
 The mode is controlled by settings.ai_mode:
   - "mock": returns pre-built JSON that passes full Pydantic validation.
   - "real": calls the configured provider (OpenRouter, OpenAI, etc.).
+
+Real-mode clients are long-lived: one per (base_url, api_key, timeout) in each
+process, so consecutive tasks reuse pooled keep-alive connections instead of
+paying for TCP and TLS setup on every call.  A forked child (Celery prefork)
+starts with an empty registry rather than sharing its parent's sockets.
+``chat_json_async`` is the ``AsyncOpenAI`` equivalent for the worker's
+asyncio runner; its clients are bound to that runner's event loop.
 """
 
+import asyncio
 import json
 import logging
+import os
+import threading
 import time
+from typing import Awaitable, Callable
 
-from openai import OpenAI
+import httpx
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient, DefaultHttpxClient, OpenAI
 
 from applytrack.core.config import settings
 
 log = logging.getLogger(__name__)
 
+_clients: dict[tuple[str, str, float], OpenAI] = {}
+_clients_lock = threading.Lock()
+# only touched from the asyncio runner's loop thread, so no lock
+_async_clients: dict[tuple[str, str, float], AsyncOpenAI] = {}
+
+
+def _forget_clients() -> None:
+    # runs in a freshly forked child: the inherited connections belong to the
+    # parent, so drop them without closing and rebuild on first use
+    global _clients_lock
+    _clients.clear()
+    _async_clients.clear()
+    _clients_lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_forget_clients)
+
+
+def _client_key() -> tuple[str, str, float]:
+    return (settings.ai_base_url, settings.ai_api_key, settings.ai_timeout_seconds)
+
+
+def _pool_options(timeout: float) -> dict:
+    return {
+        "timeout": timeout,
+        "limits": httpx.Limits(
+            max_connections=settings.ai_max_connections,
+            max_keepalive_connections=settings.ai_max_keepalive_connections,
+            keepalive_expiry=settings.ai_keepalive_expiry_seconds,
+        ),
+        "http2": settings.ai_http2,
+    }
+
+
+def _build_client(base_url: str, api_key: str, timeout: float) -> OpenAI:
+    http_client = DefaultHttpxClient(**_pool_options(timeout))
+    return OpenAI(base_url=base_url, api_key=api_key, timeout=timeout, http_client=http_client)
 
-def _build_client() -> OpenAI:
-    return OpenAI(
-        base_url=settings.ai_base_url,
-        api_key=settings.ai_api_key,
-        timeout=settings.ai_timeout_seconds,
-    )
+
+def get_client() -> OpenAI:
+    """This process's client for the configured provider, built on first use."""
+    key = _client_key()
+    with _clients_lock:
+        client = _clients.get(key)
+        if client is None:
+            client = _clients[key] = _build_client(*key)
+    return client
+
+
+def close_clients() -> None:
+    """Close every pooled client, e.g. on worker shutdown."""
+    with _clients_lock:
+        clients = list(_clients.values())
+        _clients.clear()
+    for client in clients:
+        client.close()
+
+
+def get_async_client() -> AsyncOpenAI:
+    """Async counterpart of ``get_client``; call it on the runner's loop only."""
+    key = _client_key()
+    client = _async_clients.get(key)
+    if client is None:
+        base_url, api_key, timeout = key
+        http_client = DefaultAsyncHttpxClient(**_pool_options(timeout))
+        client = _async_clients[key] = AsyncOpenAI(
+            base_url=base_url, api_key=api_key, timeout=timeout, http_client=http_client
+        )
+    return client
+
+
+async def close_async_clients() -> None:
+    clients = list(_async_clients.values())
+    _async_clients.clear()
+    for client in clients:
+        await client.close()
 
 
 # ─── mock outputs ───────────────────────────────────────────────
@@ -186,30 +268,112 @@ _MOCKS = {
 }
 
 
-def chat_json(system: str, user: str, kind: str = "") -> tuple[str, float]:
+MOCK_DELAY_SECONDS = 0.3  # tiny delay so latency field isn't zero
+MOCK_CHUNK_CHARS = 24  # mock streams arrive in pieces this size
+
+
+def model_name() -> str:
+    """The model that answers, as recorded with its outputs: ``"mock"`` in mock mode."""
+    return "mock" if settings.ai_mode == "mock" else settings.ai_model
+
+
+def _completion_request(system: str, user: str) -> dict:
+    return {
+        "model": settings.ai_model,
+        "messages": [
+            {"role": "system", "content": system},
+            {"role": "user", "content": user},
+        ],
+        "response_format": {"type": "json_object"},
+    }
+
+
+def _mock_chunks(kind: str) -> list[str]:
+    text = json.dumps(_MOCKS.get(kind, {}))
+    return [text[i : i + MOCK_CHUNK_CHARS] for i in range(0, len(text), MOCK_CHUNK_CHARS)]
+
+
+def _delta(chunk) -> str:
+    return (chunk.choices[0].delta.content or "") if chunk.choices else ""
+
+
+def chat_json(
+    system: str,
+    user: str,
+    kind: str = "",
+    on_delta: Callable[[str], None] | None = None,
+) -> tuple[str, float]:
     """Send a chat completion and return (json_text, latency_seconds).
 
     In mock mode the *kind* parameter selects which canned response to return.
+    With *on_delta* the completion is streamed and each piece of text is
+    passed to it as it arrives.
     """
     start = time.perf_counter()
 
     if settings.ai_mode == "mock":
         log.info("AI mock mode — returning sample output for %s", kind or "unknown")
-        time.sleep(0.3)  # tiny delay so latency field isn't zero
-        data = _MOCKS.get(kind, {})
-        return json.dumps(data), round(time.perf_counter() - start, 3)
+        chunks = _mock_chunks(kind)
+        if on_delta is None:
+            time.sleep(MOCK_DELAY_SECONDS)
+        else:
+            for chunk in chunks:
+                time.sleep(MOCK_DELAY_SECONDS / len(chunks))
+                on_delta(chunk)
+        return "".join(chunks), round(time.perf_counter() - start, 3)
 
     # real mode
-    client = _build_client()
+    client = get_client()
     log.info("Calling %s (model=%s)", settings.ai_provider, settings.ai_model)
-    resp = client.chat.completions.create(
-        model=settings.ai_model,
-        messages=[
-            {"role": "system", "content": system},
-            {"role": "user", "content": user},
-        ],
-        response_format={"type": "json_object"},
-    )
+    if on_delta is None:
+        resp = client.chat.completions.create(**_completion_request(system, user))
+        text = resp.choices[0].message.content or "{}"
+    else:
+        parts = []
+        stream = client.chat.completions.create(**_completion_request(system, user), stream=True)
+        for chunk in stream:
+            if piece := _delta(chunk):
+                parts.append(piece)
+                on_delta(piece)
+        text = "".join(parts) or "{}"
+    latency = round(time.perf_counter() - start, 3)
+    return text, latency
+
+
+async def chat_json_async(
+    system: str,
+    user: str,
+    kind: str = "",
+    on_delta: Callable[[str], Awaitable[None]] | None = None,
+) -> tuple[str, float]:
+    """``chat_json`` without blocking the event loop while the model answers."""
+    start = time.perf_counter()
+
+    if settings.ai_mode == "mock":
+        log.info("AI mock mode — returning sample output for %s", kind or "unknown")
+        chunks = _mock_chunks(kind)
+        if on_delta is None:
+            await asyncio.sleep(MOCK_DELAY_SECONDS)
+        else:
+            for chunk in chunks:
+                await asyncio.sleep(MOCK_DELAY_SECONDS / len(chunks))
+                await on_delta(chunk)
+        return "".join(chunks), round(time.perf_counter() - start, 3)
+
+    client = get_async_client()
+    log.info("Calling %s (model=%s)", settings.ai_provider, settings.ai_model)
+    if on_delta is None:
+        resp = await client.chat.completions.create(**_completion_request(system, user))
+        text = resp.choices[0].message.content or "{}"
+    else:
+        parts = []
+        stream = await client.chat.completions.create(
+            **_completion_request(system, user), stream=True
+        )
+        async for chunk in stream:
+            if piece := _delta(chunk):
+                parts.append(piece)
+                await on_delta(piece)
+        text = "".join(parts) or "{}"
     latency = round(time.perf_counter() - start, 3)
-    text = resp.choices[0].message.content or "{}"
     return text, latency
@@ -0,0 +1,120 @@
+"""Single-flight registry for AI tasks.
+
+Double-clicks, retries and several open tabs all trigger the same job.  Before
+enqueueing, the API claims ``(application_id, kind, input_hash)`` in Redis
+with ``SET NX`` and the new Celery task id; a trigger that finds the key taken
+by a task that is still running gets that task's id back instead of a second
+LLM call.  Keys expire after ``AI_INFLIGHT_TTL_SECONDS`` so a lost worker never
+blocks a kind for good.  A finished task's key is taken over with a
+compare-and-set, so of several triggers racing for it exactly one enqueues,
+and a claim whose enqueue fails is released again.
+
+Eager mode runs tasks inline, so nothing is ever in flight there and the
+registry is skipped.  If Redis is unreachable the trigger enqueues as before.
+"""
+
+import asyncio
+import logging
+import uuid
+
+from applytrack.core.config import settings
+
+log = logging.getLogger(__name__)
+
+_redis = None
+
+# SET / DEL only while the key still holds the expected task id
+_TAKE_OVER = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('SET', KEYS[1], ARGV[2], 'EX', ARGV[3])
+end
+return false
+"""
+_RELEASE = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+# rounds of claim / look / take over before giving up on coalescing
+_CLAIM_ATTEMPTS = 3
+
+
+def _client():
+    global _redis
+    if _redis is None:
+        # imported here so the API only loads Redis once an AI task is triggered
+        from redis.asyncio import Redis
+
+        _redis = Redis.from_url(settings.redis_url)
+    return _redis
+
+
+def _key(application_id: str, kind: str, input_hash: str, force: bool) -> str:
+    # a forced rerun must not be answered by an in-flight cached run
+    suffix = ":force" if force else ""
+    return f"applytrack:ai-inflight:{application_id}:{kind}:{input_hash}{suffix}"
+
+
+def _enabled() -> bool:
+    return not settings.celery_always_eager and settings.ai_inflight_ttl_seconds > 0
+
+
+def _is_running(task_id: str) -> bool:
+    """Blocking result-backend lookup; call it off the event loop."""
+    from celery.result import AsyncResult
+
+    from applytrack.workers.celery_app import celery_app
+
+    return not AsyncResult(task_id, app=celery_app).ready()
+
+
+async def claim_task(
+    application_id: str, kind: str, input_hash: str, force: bool = False
+) -> tuple[str, bool]:
+    """Return ``(task_id, is_new)``.
+
+    ``is_new`` means the caller owns the slot and must enqueue the task with
+    exactly this id; otherwise ``task_id`` is the job already in flight.
+    """
+    task_id = str(uuid.uuid4())
+    if not _enabled():
+        return task_id, True
+
+    from redis.exceptions import RedisError
+
+    key = _key(application_id, kind, input_hash, force)
+    ttl = settings.ai_inflight_ttl_seconds
+    redis = _client()
+    try:
+        for _ in range(_CLAIM_ATTEMPTS):
+            if await redis.set(key, task_id, nx=True, ex=ttl):
+                return task_id, True
+            existing = await redis.get(key)
+            if existing is None:
+                continue  # expired in between: claim it afresh
+            existing = existing.decode()
+            if await asyncio.to_thread(_is_running, existing):
+                log.info("AI %s for %s already in flight as %s", kind, application_id, existing)
+                return existing, False
+            # the previous task finished: take over unless another trigger just did
+            if await redis.eval(_TAKE_OVER, 1, key, existing, task_id, ttl):
+                return task_id, True
+        log.warning("AI single-flight: %s kept changing hands, enqueueing anyway", key)
+    except RedisError:
+        log.warning("AI single-flight: Redis unavailable, enqueueing without coalescing")
+    return task_id, True
+
+
+async def release_task(
+    application_id: str, kind: str, input_hash: str, force: bool, task_id: str
+) -> None:
+    """Give up a claim whose task could not be enqueued."""
+    if not _enabled():
+        return
+    from redis.exceptions import RedisError
+
+    try:
+        await _client().eval(_RELEASE, 1, _key(application_id, kind, input_hash, force), task_id)
+    except RedisError:
+        log.warning("AI single-flight: Redis unavailable, claim %s held until expiry", task_id)
@@ -15,6 +15,16 @@ from applytrack.schemas.ai_schemas import (
     TailoredCV,
 )
 
+# Bump a kind's version whenever its prompt changes meaning: cached outputs
+# are only reused for the version that produced them.
+PROMPT_VERSIONS = {
+    "parse_jd": "1",
+    "match": "1",
+    "tailor_cv": "1",
+    "outreach": "1",
+    "interview_prep": "1",
+}
+
 EVIDENCE_RULES = """
 Rules you must follow:
 1. Every skill or claim MUST include an evidence snippet showing WHERE in the
@@ -0,0 +1,337 @@
+"""Stream model output from the worker to the browser.
+
+A task triggered with ``stream=true`` calls the provider with ``stream=True``.
+Every delta is appended to a per-task buffer in Redis and published on the
+task's pub/sub channel together with its offset in the output.  The SSE
+endpoint subscribes first, then replays the buffer, so a browser that
+connects late misses nothing and never sees a delta twice.  It re-parses the
+text so far with ``parse_partial`` and emits each new partial object; the
+worker publishes the schema-validated result as the final ``done`` message.
+
+Publishing is best effort: without Redis the task still completes, and the
+endpoint falls back to reporting the task's result once it is ready.  A stream
+that outlives ``MAX_SECONDS`` ends with a ``timeout`` event; the client can go
+on polling ``/tasks/{task_id}``.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import threading
+from typing import Any, AsyncIterator
+
+from applytrack.core.config import settings
+
+log = logging.getLogger(__name__)
+
+# how long the text of a finished stream stays replayable
+BUFFER_TTL_SECONDS = 600
+# with no message for this long, the endpoint sends a keep-alive comment and
+# checks whether the task finished without publishing (e.g. Redis was down)
+IDLE_SECONDS = 1.0
+# a stream is closed after this long even if the task never reports back
+MAX_SECONDS = 600
+
+
+def channel(task_id: str) -> str:
+    return f"applytrack:ai-stream:{task_id}"
+
+
+def buffer_key(task_id: str) -> str:
+    return f"applytrack:ai-stream:{task_id}:text"
+
+
+# ─── partial JSON ───────────────────────────────────────────────
+
+
+def parse_partial(text: str) -> Any:
+    """Parse the longest meaningful prefix of a truncated JSON document.
+
+    Open containers are closed, and an unterminated string value is kept as
+    far as it got.  Anything that might still change is dropped: a trailing
+    number or literal, or an object key still waiting for its value.  Returns
+    ``None`` while nothing can be parsed yet.
+    """
+    stack: list[str] = []  # closing brackets of the open containers
+    expect_key = False  # next string in the innermost object is a key
+    in_string = False
+    string_is_key = False
+    string_start = 0
+    escape = False
+    safe_end, safe_stack = 0, ""  # longest prefix that is valid once closed
+
+    for i, ch in enumerate(text):
+        if in_string:
+            if escape:
+                escape = False
+            elif ch == "\\":
+                escape = True
+            elif ch == '"':
+                in_string = False
+                if not string_is_key:
+                    safe_end, safe_stack = i + 1, "".join(reversed(stack))
+            continue
+        if ch == '"':
+            in_string, string_is_key, string_start = True, expect_key, i
+        elif ch in "{[":
+            stack.append("}" if ch == "{" else "]")
+            expect_key = ch == "{"
+            safe_end, safe_stack = i + 1, "".join(reversed(stack))
+        elif ch in "}]":
+            if not stack:
+                break
+            stack.pop()
+            expect_key = False
+            safe_end, safe_stack = i + 1, "".join(reversed(stack))
+        elif ch == ",":
+            # everything before the comma is complete
+            safe_end, safe_stack = i, "".join(reversed(stack))
+            expect_key = bool(stack) and stack[-1] == "}"
+        elif ch == ":":
+            expect_key = False
+
+    candidate = text[:safe_end] + safe_stack
+    if in_string and not string_is_key:
+        partial = text[string_start:]
+        if escape:
+            partial = partial[:-1]
+        # drop a half-received \uXXXX escape
+        cut = partial.rfind("\\u")
+        if cut != -1 and len(partial) - cut < 6:
+            partial = partial[:cut]
+        candidate = text[:string_start] + partial + '"' + "".join(reversed(stack))
+
+    if not candidate:
+        return None
+    try:
+        return json.loads(candidate)
+    except ValueError:
+        return None
+
+
+class PartialRelay:
+    """Turn stream messages into SSE events, deduplicating by offset."""
+
+    def __init__(self):
+        self.text = ""
+        self._last = None
+
+    def replay(self, buffered: str) -> list[tuple[str, Any]]:
+        self.text = buffered
+        return self._partial()
+
+    def feed(self, message: dict) -> list[tuple[str, Any]]:
+        kind = message.get("type")
+        if kind == "delta":
+            offset, text = message["offset"], message["text"]
+            end = offset + len(text)
+            if offset > len(self.text) or end <= len(self.text):
+                return []  # a gap cannot happen after replay; a repeat can
+            self.text += text[len(self.text) - offset :]
+            return self._partial()
+        if kind == "done":
+            return [("done", message.get("result"))]
+        if kind == "error":
+            return [("error", {"detail": message.get("detail", "Task failed")})]
+        return []
+
+    def _partial(self) -> list[tuple[str, Any]]:
+        partial = parse_partial(self.text)
+        if partial is None or partial == self._last:
+            return []
+        self._last = partial
+        return [("partial", partial)]
+
+
+def sse(event: str, data: Any) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
+
+
+# ─── worker side ────────────────────────────────────────────────
+
+_redis = None
+_async_redis = None  # bound to the worker's asyncio runner loop
+_redis_lock = threading.Lock()
+
+
+def _forget_clients() -> None:
+    global _redis, _async_redis, _redis_lock
+    _redis = _async_redis = None
+    _redis_lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_forget_clients)
+
+
+class _Publisher:
+    def __init__(self, task_id: str):
+        self.task_id = task_id
+        self.offset = 0
+        self.enabled = True
+
+    def _delta(self, text: str) -> str:
+        message = json.dumps({"type": "delta", "offset": self.offset, "text": text})
+        self.offset += len(text)
+        return message
+
+    def _failed(self) -> None:
+        if self.enabled:
+            log.warning("AI stream %s: Redis unavailable, no further deltas", self.task_id)
+        self.enabled = False
+
+
+class StreamPublisher(_Publisher):
+    """Publishes one task's deltas from the synchronous task path."""
+
+    def _client(self):
+        global _redis
+        with _redis_lock:
+            if _redis is None:
+                from redis import Redis
+
+                _redis = Redis.from_url(settings.redis_url)
+            return _redis
+
+    def _send(self, message: str, text: str = "") -> None:
+        if not self.enabled:
+            return
+        from redis.exceptions import RedisError
+
+        try:
+            pipe = self._client().pipeline(transaction=False)
+            if text:
+                pipe.append(buffer_key(self.task_id), text)
+                pipe.expire(buffer_key(self.task_id), BUFFER_TTL_SECONDS)
+            pipe.publish(channel(self.task_id), message)
+            pipe.execute()
+        except RedisError:
+            self._failed()
+
+    def delta(self, text: str) -> None:
+        self._send(self._delta(text), text)
+
+    def done(self, result: dict) -> None:
+        self._send(json.dumps({"type": "done", "result": result}, default=str))
+
+    def error(self, detail: str) -> None:
+        self._send(json.dumps({"type": "error", "detail": detail}))
+
+
+class AsyncStreamPublisher(_Publisher):
+    """``StreamPublisher`` for coroutines on the worker's asyncio runner."""
+
+    def _client(self):
+        global _async_redis
+        if _async_redis is None:
+            from redis.asyncio import Redis
+
+            _async_redis = Redis.from_url(settings.redis_url)
+        return _async_redis
+
+    async def _send(self, message: str, text: str = "") -> None:
+        if not self.enabled:
+            return
+        from redis.exceptions import RedisError
+
+        try:
+            pipe = self._client().pipeline(transaction=False)
+            if text:
+                pipe.append(buffer_key(self.task_id), text)
+                pipe.expire(buffer_key(self.task_id), BUFFER_TTL_SECONDS)
+            pipe.publish(channel(self.task_id), message)
+            await pipe.execute()
+        except RedisError:
+            self._failed()
+
+    async def delta(self, text: str) -> None:
+        await self._send(self._delta(text), text)
+
+    async def done(self, result: dict) -> None:
+        await self._send(json.dumps({"type": "done", "result": result}, default=str))
+
+    async def error(self, detail: str) -> None:
+        await self._send(json.dumps({"type": "error", "detail": detail}))
+
+
+async def close_async_client() -> None:
+    global _async_redis
+    if _async_redis is not None:
+        client, _async_redis = _async_redis, None
+        await client.aclose()
+
+
+# ─── API side ───────────────────────────────────────────────────
+
+
+def _finished(task_id: str) -> tuple[str, Any] | None:
+    """The terminal event for a task that is done, else ``None``."""
+    from celery.result import AsyncResult
+
+    from applytrack.workers.celery_app import celery_app
+
+    result = AsyncResult(task_id, app=celery_app)
+    if not result.ready():
+        return None
+    if result.successful() and isinstance(result.result, dict):
+        if "error" in result.result:
+            return "error", {"detail": result.result["error"]}
+        return "done", result.result
+    return "error", {"detail": "Task failed"}
+
+
+async def relay_events(task_id: str) -> AsyncIterator[str]:
+    """SSE frames for one task: ``partial`` events, then ``done``, ``error`` or ``timeout``."""
+    from redis.asyncio import Redis
+    from redis.exceptions import RedisError
+
+    relay = PartialRelay()
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + MAX_SECONDS
+    redis = Redis.from_url(settings.redis_url)
+    pubsub = redis.pubsub()
+    try:
+        try:
+            await pubsub.subscribe(channel(task_id))
+            buffered = await redis.get(buffer_key(task_id))
+        except RedisError:
+            log.warning("AI stream %s: Redis unavailable, waiting for the result", task_id)
+            pubsub = None
+            buffered = None
+
+        for event in relay.replay(buffered.decode() if buffered else ""):
+            yield sse(*event)
+
+        while True:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                yield sse("timeout", {"detail": "Task still running, poll its status"})
+                return
+            idle = min(IDLE_SECONDS, remaining)
+            message = None
+            if pubsub is not None:
+                try:
+                    message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=idle)
+                except RedisError:
+                    pubsub = None
+            else:
+                await asyncio.sleep(idle)
+
+            if message is None:
+                # a blocking result-backend lookup
+                finished = await asyncio.to_thread(_finished, task_id)
+                if finished is not None:
+                    yield sse(*finished)
+                    return
+                yield ": keep-alive\n\n"
+                continue
+
+            for event in relay.feed(json.loads(message["data"])):
+                yield sse(*event)
+                if event[0] in ("done", "error"):
+                    return
+    finally:
+        if pubsub is not None:
+            await pubsub.aclose()
+        await redis.aclose()
@@ -0,0 +1,164 @@
+"""Streaming export of applications as NDJSON or CSV.
+
+One query joins applications with their posting, company and the latest AI
+output of each kind, and is read through a server-side cursor
+(``AsyncSession.stream`` + ``yield_per``).  Rows for the same application
+arrive together and are folded into one record at a time, so memory use is
+independent of how many applications the user has.
+
+Record keys reuse the import column names, so an export can be fed straight
+back into ``POST /applications/import``.
+"""
+
+import csv
+import enum
+import io
+import json
+from collections.abc import AsyncIterator
+from datetime import datetime
+
+from sqlalchemy import and_, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from applytrack.db.models.ai_output import AIOutput, AIOutputKind
+from applytrack.db.models.application import Application
+from applytrack.db.models.company import Company
+from applytrack.db.models.job_posting import JobPosting
+
+EXPORT_BATCH_SIZE = 500
+
+
+class ExportFormat(str, enum.Enum):
+    ndjson = "ndjson"
+    csv = "csv"
+
+
+MEDIA_TYPES = {ExportFormat.ndjson: "application/x-ndjson", ExportFormat.csv: "text/csv"}
+
+# (record key, column) pairs for the flat part of a record
+COLUMNS = (
+    ("id", Application.id),
+    ("company_name", Company.name),
+    ("company_website", Company.website_url),
+    ("role_title", JobPosting.title),
+    ("location", JobPosting.location),
+    ("remote_type", JobPosting.remote_type),
+    ("job_url", JobPosting.posting_url),
+    ("source", JobPosting.source),
+    ("job_description", JobPosting.description_raw),
+    ("status", Application.status),
+    ("priority", Application.priority),
+    ("notes", Application.notes),
+    ("applied_at", Application.applied_at),
+    ("next_followup_at", Application.next_followup_at),
+    ("salary_expectation", Application.salary_expectation),
+    ("created_at", Application.created_at),
+    ("updated_at", Application.updated_at),
+)
+CSV_HEADER = [key for key, _ in COLUMNS] + [f"ai_{kind.value}" for kind in AIOutputKind]
+
+
+def _plain(value):
+    if isinstance(value, enum.Enum):
+        return value.value
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def _export_query(user_id: str):
+    # newest output per (application, kind), ranked only over this user's rows
+    rank = (
+        func.row_number()
+        .over(
+            partition_by=(AIOutput.application_id, AIOutput.kind),
+            order_by=(AIOutput.created_at.desc(), AIOutput.id.desc()),
+        )
+        .label("rank")
+    )
+    latest = (
+        select(
+            AIOutput.application_id,
+            AIOutput.kind,
+            AIOutput.output_json,
+            AIOutput.evidence_json,
+            AIOutput.model,
+            AIOutput.created_at,
+            rank,
+        )
+        .join(Application, Application.id == AIOutput.application_id)
+        .where(Application.user_id == user_id)
+        .subquery()
+    )
+    return (
+        select(
+            *(column for _, column in COLUMNS),
+            latest.c.kind,
+            latest.c.output_json,
+            latest.c.evidence_json,
+            latest.c.model,
+            latest.c.created_at.label("output_created_at"),
+        )
+        .join(JobPosting, JobPosting.id == Application.job_posting_id)
+        .outerjoin(Company, Company.id == JobPosting.company_id)
+        .outerjoin(latest, and_(latest.c.application_id == Application.id, latest.c.rank == 1))
+        .where(Application.user_id == user_id)
+        .order_by(Application.updated_at.desc(), Application.id.desc())
+    )
+
+
+async def iter_export_records(db: AsyncSession, user_id: str) -> AsyncIterator[dict]:
+    """Yield one dict per application, newest activity first."""
+    stmt = _export_query(user_id).execution_options(yield_per=EXPORT_BATCH_SIZE)
+    result = await db.stream(stmt)
+
+    record: dict | None = None
+    async for row in result:
+        if record is None or record["id"] != row.id:
+            if record is not None:
+                yield record
+            record = {key: _plain(value) for (key, _), value in zip(COLUMNS, row)}
+            record["ai_outputs"] = {}
+        if row.kind is not None:
+            record["ai_outputs"][_plain(row.kind)] = {
+                "output": row.output_json,
+                "evidence": row.evidence_json,
+                "model": row.model,
+                "created_at": _plain(row.output_created_at),
+            }
+    if record is not None:
+        yield record
+
+
+async def ndjson_lines(records: AsyncIterator[dict]) -> AsyncIterator[str]:
+    async for record in records:
+        yield json.dumps(record, default=_plain) + "\n"
+
+
+async def csv_lines(records: AsyncIterator[dict]) -> AsyncIterator[str]:
+    """CSV with one JSON-encoded column per AI output kind."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(CSV_HEADER)
+    async for record in records:
+        outputs = record.pop("ai_outputs")
+        writer.writerow(
+            [*record.values()]
+            + [
+                json.dumps(outputs[kind.value]["output"]) if kind.value in outputs else ""
+                for kind in AIOutputKind
+            ]
+        )
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+    # header only, for an empty export
+    if buffer.tell():
+        yield buffer.getvalue()
+
+
+def export_lines(db: AsyncSession, user_id: str, fmt: ExportFormat) -> AsyncIterator[str]:
+    records = iter_export_records(db, user_id)
+    if fmt is ExportFormat.csv:
+        return csv_lines(records)
+    return ndjson_lines(records)
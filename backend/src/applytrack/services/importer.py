@@ -0,0 +1,224 @@
+"""Streaming bulk import of applications from CSV or JSON Lines.
+
+The upload is decoded line by line, so memory stays bounded by one batch no
+matter how large the file is.  Rows are validated with ``ApplicationCreate``,
+companies are deduplicated through an in-memory normalized name → id map, and
+Company / JobPosting / Application rows are written with one executemany
+INSERT per table per batch.  Each batch commits on its own, so a failure
+part-way through keeps the batches already reported as imported.
+"""
+
+import codecs
+import csv
+import enum
+import json
+from collections.abc import AsyncIterable, AsyncIterator, Callable
+
+from pydantic import ValidationError
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from applytrack.db.models.application import Application
+from applytrack.db.models.company import Company, normalize_company_name
+from applytrack.db.models.job_posting import JobPosting
+from applytrack.db.types import new_id
+from applytrack.db.upsert import COMPANY_CONFLICT_TARGET, dialect_insert
+from applytrack.schemas.application import ApplicationCreate, ImportResult, ImportRowError
+
+BATCH_SIZE = 500
+MAX_REPORTED_ERRORS = 100
+
+# (1-based row number, parsed fields or the reason the row could not be parsed)
+Record = tuple[int, dict | ValueError]
+
+
+class ImportFormat(str, enum.Enum):
+    csv = "csv"
+    jsonl = "jsonl"
+
+
+async def iter_lines(chunks: AsyncIterable[bytes]) -> AsyncIterator[str]:
+    """Split a byte stream into text lines without buffering the whole body."""
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    pending = ""
+    async for chunk in chunks:
+        pending += decoder.decode(chunk)
+        *lines, pending = pending.split("\n")
+        for line in lines:
+            yield line.removesuffix("\r")
+    pending += decoder.decode(b"", final=True)
+    if pending:
+        yield pending.removesuffix("\r")
+
+
+async def _csv_records(lines: AsyncIterable[str]) -> AsyncIterator[Record]:
+    header: list[str] | None = None
+    buffer: list[str] = []
+    quotes = 0
+    row = 0
+    async for line in lines:
+        buffer.append(line)
+        quotes += line.count('"')
+        if quotes % 2:
+            continue  # inside a quoted field that spans lines
+        record, buffer, quotes = "\n".join(buffer), [], 0
+        if not record.strip():
+            continue
+        values = next(csv.reader([record]))
+        if header is None:
+            header = [name.strip().lower() for name in values]
+            continue
+        row += 1
+        yield row, dict(zip(header, values))
+    if buffer:
+        yield row + 1, ValueError("unterminated quoted field")
+
+
+async def _jsonl_records(lines: AsyncIterable[str]) -> AsyncIterator[Record]:
+    row = 0
+    async for line in lines:
+        if not line.strip():
+            continue
+        row += 1
+        try:
+            data = json.loads(line)
+        except ValueError as exc:
+            yield row, ValueError(f"invalid JSON: {exc}")
+            continue
+        if not isinstance(data, dict):
+            yield row, ValueError("expected a JSON object")
+            continue
+        yield row, data
+
+
+def iter_records(lines: AsyncIterable[str], fmt: ImportFormat) -> AsyncIterator[Record]:
+    """Parse lines as CSV (header row required) or JSON Lines."""
+    if fmt is ImportFormat.csv:
+        return _csv_records(lines)
+    return _jsonl_records(lines)
+
+
+def _describe(exc: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(map(str, err['loc'])) or 'row'}: {err['msg']}" for err in exc.errors()
+    )
+
+
+class ApplicationImporter:
+    def __init__(
+        self,
+        db: AsyncSession,
+        user_id: str,
+        batch_size: int = BATCH_SIZE,
+        on_progress: Callable[[ImportResult], None] | None = None,
+    ):
+        self.db = db
+        self.user_id = user_id
+        self.batch_size = batch_size
+        self.on_progress = on_progress
+        self.result = ImportResult()
+        self._company_ids: dict[str, str] = {}
+        self._companies: list[dict] = []
+        self._postings: list[dict] = []
+        self._applications: list[dict] = []
+
+    async def run(self, records: AsyncIterable[Record]) -> ImportResult:
+        result = await self.db.execute(
+            select(Company.normalized_name, Company.id).where(Company.user_id == self.user_id)
+        )
+        self._company_ids = dict(result.all())
+
+        async for row, data in records:
+            self._add(row, data)
+            if len(self._applications) >= self.batch_size:
+                await self._flush()
+        await self._flush()
+        return self.result
+
+    def _fail(self, row: int, error: str) -> None:
+        self.result.failed += 1
+        if len(self.result.errors) < MAX_REPORTED_ERRORS:
+            self.result.errors.append(ImportRowError(row=row, error=error))
+
+    def _add(self, row: int, data: dict | ValueError) -> None:
+        self.result.processed += 1
+        if isinstance(data, ValueError):
+            self._fail(row, str(data))
+            return
+        # blank cells / nulls fall back to the schema defaults
+        data = {k: v for k, v in data.items() if v not in ("", None)}
+        try:
+            body = ApplicationCreate.model_validate(data)
+        except ValidationError as exc:
+            self._fail(row, _describe(exc))
+            return
+
+        normalized = normalize_company_name(body.company_name)
+        company_id = self._company_ids.get(normalized)
+        if company_id is None:
+            company_id = self._company_ids[normalized] = new_id()
+            self._companies.append(
+                {
+                    "id": company_id,
+                    "user_id": self.user_id,
+                    "name": body.company_name,
+                    "normalized_name": normalized,
+                }
+            )
+
+        posting_id = new_id()
+        self._postings.append(
+            {
+                "id": posting_id,
+                "company_id": company_id,
+                "title": body.role_title,
+                "posting_url": body.job_url,
+                "description_raw": body.job_description,
+            }
+        )
+        self._applications.append(
+            {
+                "id": new_id(),
+                "user_id": self.user_id,
+                "job_posting_id": posting_id,
+                "status": body.status,
+                "priority": body.priority,
+                "notes": body.notes,
+            }
+        )
+
+    async def _insert_companies(self) -> None:
+        """Insert new companies, adopting rows another request created meanwhile."""
+        stmt = dialect_insert(Company, self.db.get_bind().dialect.name).on_conflict_do_nothing(
+            index_elements=COMPANY_CONFLICT_TARGET
+        )
+        await self.db.execute(stmt, self._companies)
+
+        result = await self.db.execute(
+            select(Company.normalized_name, Company.id).where(
+                Company.user_id == self.user_id,
+                Company.normalized_name.in_([c["normalized_name"] for c in self._companies]),
+            )
+        )
+        stored = dict(result.all())
+        remap = {c["id"]: stored[c["normalized_name"]] for c in self._companies}
+        if any(old != new for old, new in remap.items()):
+            self._companies = [c for c in self._companies if remap[c["id"]] == c["id"]]
+            for posting in self._postings:
+                posting["company_id"] = remap.get(posting["company_id"], posting["company_id"])
+            self._company_ids.update(stored)
+
+    async def _flush(self) -> None:
+        if not self._applications:
+            return
+        if self._companies:
+            await self._insert_companies()
+        await self.db.execute(insert(JobPosting), self._postings)
+        await self.db.execute(insert(Application), self._applications)
+        await self.db.commit()
+
+        self.result.imported += len(self._applications)
+        self.result.companies_created += len(self._companies)
+        self._companies, self._postings, self._applications = [], [], []
+        if self.on_progress:
+            self.on_progress(self.result)
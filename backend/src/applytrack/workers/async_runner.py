@@ -0,0 +1,143 @@
+"""Per-process asyncio runner for AI tasks.
+
+With ``AI_ASYNC_RUNNER=true`` every AI task in a worker process runs as a
+coroutine on one long-lived event loop (a daemon thread), using
+``AsyncOpenAI`` and an async SQLAlchemy session.  A task the worker received
+is handed over with ``dispatch`` and its Celery slot is free again at once;
+the pipeline stores its own result when it ends.  Each process so keeps up to
+``AI_MAX_CONCURRENCY`` pipelines in flight whatever the pool and its
+``--concurrency``: throughput is bounded by that cap (set it to the provider's
+rate limit), not by the process or thread count.  Once the cap is reached,
+``dispatch`` blocks the slot until a pipeline finishes, so a worker never
+takes more messages off the queue than it can run.
+
+Everything here is created lazily and forgotten in a forked child, like the
+client registry in ``services.ai.client``.
+"""
+
+import asyncio
+import os
+import threading
+from concurrent.futures import Future, wait
+from contextlib import asynccontextmanager
+
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+
+from applytrack.core.config import settings
+from applytrack.db.pool import pool_options
+from applytrack.db.sqlite import configure_sqlite
+from applytrack.services.ai.client import close_async_clients
+from applytrack.services.ai.stream import close_async_client as close_stream_client
+
+_loop: asyncio.AbstractEventLoop | None = None
+_loop_lock = threading.Lock()
+# created on the loop thread by the first pipeline that needs them
+_semaphore: asyncio.Semaphore | None = None
+_engine: AsyncEngine | None = None
+_SessionLocal: async_sessionmaker[AsyncSession] | None = None
+# admission for dispatched pipelines, taken by the Celery thread handing one over
+_admission: threading.BoundedSemaphore | None = None
+_dispatched: set[Future] = set()
+
+
+def _reset() -> None:
+    global _loop, _loop_lock, _semaphore, _engine, _SessionLocal, _admission, _dispatched
+    _loop = None
+    _loop_lock = threading.Lock()
+    _semaphore = None
+    _engine = None
+    _SessionLocal = None
+    _admission = None
+    _dispatched = set()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset)
+
+
+def _ensure_loop() -> asyncio.AbstractEventLoop:
+    global _loop
+    with _loop_lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            threading.Thread(target=_loop.run_forever, name="ai-runner", daemon=True).start()
+        return _loop
+
+
+def submit(coro) -> Future:
+    """Schedule *coro* on the runner's loop and return its future."""
+    return asyncio.run_coroutine_threadsafe(coro, _ensure_loop())
+
+
+def run(coro):
+    """Run *coro* on the runner's loop and block the calling thread for the result."""
+    return submit(coro).result()
+
+
+def dispatch(coro) -> Future:
+    """Start *coro* on the runner's loop without waiting for it to finish.
+
+    Blocks only while ``AI_MAX_CONCURRENCY`` dispatched coroutines are still
+    running in this process.
+    """
+    global _admission
+    with _loop_lock:
+        if _admission is None:
+            _admission = threading.BoundedSemaphore(settings.ai_max_concurrency)
+        admission = _admission
+    admission.acquire()
+    future = submit(coro)
+    _dispatched.add(future)
+
+    def _done(future: Future) -> None:
+        _dispatched.discard(future)
+        admission.release()
+
+    future.add_done_callback(_done)
+    return future
+
+
+@asynccontextmanager
+async def slot():
+    """Hold one of the process's ``AI_MAX_CONCURRENCY`` pipeline slots."""
+    global _semaphore
+    if _semaphore is None:
+        _semaphore = asyncio.Semaphore(settings.ai_max_concurrency)
+    async with _semaphore:
+        yield
+
+
+def session() -> AsyncSession:
+    global _engine, _SessionLocal
+    if _SessionLocal is None:
+        _engine = create_async_engine(
+            settings.database_url, echo=False, **pool_options(settings.database_url, "worker")
+        )
+        configure_sqlite(_engine.sync_engine)
+        _SessionLocal = async_sessionmaker(bind=_engine, expire_on_commit=False)
+    return _SessionLocal()
+
+
+async def _close() -> None:
+    await close_async_clients()
+    await close_stream_client()
+    if _engine is not None:
+        await _engine.dispose()
+
+
+def shutdown() -> None:
+    """Finish dispatched pipelines, then close clients and stop the loop."""
+    global _loop
+    wait(list(_dispatched))
+    with _loop_lock:
+        loop, _loop = _loop, None
+    if loop is None:
+        return
+    asyncio.run_coroutine_threadsafe(_close(), loop).result()
+    loop.call_soon_threadsafe(loop.stop)
+    _reset()
@@ -1,29 +1,39 @@
 """Celery tasks for AI processing.
 
 Each task:
-  1. Loads the application + profile from the DB (sync session).
-  2. Builds the prompt.
-  3. Calls the AI client (mock or real).
+  1. Loads the application + profile from the DB.
+  2. Reuses a stored output for the same inputs, model and prompt version,
+     unless called with ``force=True``.
+  3. Otherwise builds the prompt and calls the AI client (mock or real),
+     streaming the output to the SSE endpoint if triggered with ``stream=true``.
   4. Validates the response against its Pydantic schema.
   5. Persists the AIOutput row.
   6. Returns the validated data as a dict.
 
-We use a *synchronous* SQLAlchemy session here because Celery workers
-run in their own process — no need for async, and it avoids the
-nest_asyncio hack entirely.
+By default a task runs synchronously with a sync SQLAlchemy session, so a
+prefork slot handles one model call at a time.  With ``AI_ASYNC_RUNNER=true``
+the same steps run as a coroutine on the process's asyncio runner (see
+``workers.async_runner``), which overlaps many calls in one process.  Neither
+path holds a database connection while waiting for the model.
 """
 
-import hashlib
+import asyncio
 import json
 import logging
+from dataclasses import dataclass
 
+from celery.exceptions import Ignore
+from celery.signals import worker_process_shutdown
 from sqlalchemy import create_engine, select
 from sqlalchemy.orm import Session, selectinload, sessionmaker
 
 from applytrack.core.config import settings
+from applytrack.db.models.activity_event import ActivityEventType
 from applytrack.db.models.ai_output import AIOutput, AIOutputKind
 from applytrack.db.models.application import Application
 from applytrack.db.models.profile import Profile
+from applytrack.db.pool import pool_options
+from applytrack.db.sqlite import configure_sqlite
 from applytrack.schemas.ai_schemas import (
     InterviewPrepResult,
     MatchResult,
@@ -31,14 +41,24 @@ from applytrack.schemas.ai_schemas import (
     ParsedJD,
     TailoredCV,
 )
-from applytrack.services.ai.client import chat_json
+from applytrack.services.activity import record_event
+from applytrack.services.ai.cache import (
+    count_lookup,
+    find_cached_output,
+    hash_inputs,
+    profile_dict,
+)
+from applytrack.services.ai.client import chat_json, chat_json_async, close_clients, model_name
 from applytrack.services.ai.prompts import (
+    PROMPT_VERSIONS,
     build_interview_prep_prompt,
     build_match_prompt,
     build_outreach_prompt,
     build_parse_jd_prompt,
     build_tailor_cv_prompt,
 )
+from applytrack.services.ai.stream import AsyncStreamPublisher, StreamPublisher
+from applytrack.workers import async_runner
 from applytrack.workers.celery_app import celery_app
 
 log = logging.getLogger(__name__)
@@ -46,15 +66,15 @@ log = logging.getLogger(__name__)
 # Synchronous engine for worker tasks.
 # The URL for asyncpg needs to be swapped to psycopg2 (or plain sqlite) for sync use.
 _sync_url = settings.database_url.replace("+aiosqlite", "").replace("+asyncpg", "+psycopg2")
-_engine = create_engine(_sync_url, echo=False)
+_engine = create_engine(_sync_url, echo=False, **pool_options(_sync_url, "worker"))
+configure_sqlite(_engine)
 _SessionLocal = sessionmaker(bind=_engine, expire_on_commit=False)
 
 
-def _hash_inputs(*parts: str) -> str:
-    h = hashlib.sha256()
-    for p in parts:
-        h.update(str(p).encode())
-    return h.hexdigest()[:16]
+@worker_process_shutdown.connect
+def _close_ai_clients(**kwargs):
+    close_clients()
+    async_runner.shutdown()
 
 
 def _load_app(session: Session, app_id: str) -> Application | None:
@@ -70,16 +90,6 @@ def _load_profile(session: Session, user_id: str) -> Profile | None:
     return session.execute(select(Profile).where(Profile.user_id == user_id)).scalars().first()
 
 
-def _profile_dict(profile: Profile) -> dict:
-    return {
-        "headline": profile.headline,
-        "summary": profile.summary,
-        "skills": profile.skills_json or [],
-        "projects": profile.projects_json or [],
-        "experience": profile.experience_json or [],
-    }
-
-
 def _save_output(
     session: Session,
     app_id: str,
@@ -88,6 +98,7 @@ def _save_output(
     latency: float,
     input_hash: str,
     evidence: list[dict] | None = None,
+    cached: bool = False,
 ):
     output = AIOutput(
         application_id=app_id,
@@ -95,10 +106,20 @@ def _save_output(
         input_hash=input_hash,
         output_json=data,
         evidence_json=evidence or [],
-        model=settings.ai_model,
+        model=model_name(),
+        prompt_version=PROMPT_VERSIONS[kind.value],
         latency_seconds=latency,
     )
     session.add(output)
+    record_event(
+        session,
+        app_id,
+        ActivityEventType.ai_ready,
+        kind=kind.value,
+        model=model_name(),
+        latency_seconds=latency,
+        **({"cached": True} if cached else {}),
+    )
     session.commit()
 
 
@@ -122,107 +143,278 @@ def _extract_evidence(data: dict) -> list[dict]:
     return evidence
 
 
+@dataclass
+class _Job:
+    """A prompt ready for the model, plus the hash its output is stored under."""
+
+    system: str
+    user: str
+    input_hash: str
+
+
+def _prepare(
+    session: Session,
+    app_id: str,
+    kind: AIOutputKind,
+    prompt_builder,
+    needs_profile: bool,
+    force: bool,
+) -> tuple[dict | _Job, bool | None]:
+    """Everything before the model call.
+
+    Returns the task's result when it ends here (missing data or a cache hit),
+    otherwise the prompt to send; and whether the cache hit, ``None`` if it was
+    not consulted.  The caller counts the lookup, outside the session.
+    """
+    app = _load_app(session, app_id)
+    if not app or not app.job_posting:
+        return {"error": "Application or job posting not found"}, None
+
+    jd_text = app.job_posting.description_raw or ""
+
+    profile_data = {}
+    if needs_profile:
+        profile = _load_profile(session, app.user_id)
+        if not profile:
+            return {"error": "Profile not found"}, None
+        profile_data = profile_dict(profile)
+
+    input_hash = hash_inputs(jd_text, profile_data)
+    if not force:
+        cached = find_cached_output(
+            session, kind, input_hash, model_name(), PROMPT_VERSIONS[kind.value]
+        )
+        if cached is not None:
+            if cached.application_id == app_id:
+                # already stored for this application: nothing to write
+                return cached.output_json, True
+            # same inputs on another application (e.g. a shared posting)
+            _save_output(
+                session,
+                app_id,
+                kind,
+                cached.output_json,
+                0.0,
+                input_hash,
+                evidence=cached.evidence_json,
+                cached=True,
+            )
+            return cached.output_json, True
+
+    # build prompt
+    if needs_profile:
+        system, user = prompt_builder(jd_text, profile_data)
+    else:
+        system, user = prompt_builder(jd_text)
+    return _Job(system, user, input_hash), (None if force else False)
+
+
+def _parse_output(text: str, schema_cls) -> tuple[dict, list[dict]]:
+    # parse + validate — failures surface as task errors
+    raw = json.loads(text)
+    validated = schema_cls.model_validate(raw)
+    data = validated.model_dump()
+
+    # extract evidence refs from the validated output
+    return data, _extract_evidence(data)
+
+
+def _publish_result(publisher, result: dict):
+    if "error" in result:
+        return publisher.error(result["error"])
+    return publisher.done(result)
+
+
 def _run_task(
     app_id: str,
     kind: AIOutputKind,
     prompt_builder,
     schema_cls,
     needs_profile=False,
+    force=False,
+    stream_id: str | None = None,
+    task_id: str | None = None,
 ):
-    """Shared task runner used by every AI task."""
-    with _SessionLocal() as session:
-        app = _load_app(session, app_id)
-        if not app or not app.job_posting:
-            return {"error": "Application or job posting not found"}
-
-        jd_text = app.job_posting.description_raw or ""
-
-        profile_data = {}
-        if needs_profile:
-            profile = _load_profile(session, app.user_id)
-            if not profile:
-                return {"error": "Profile not found"}
-            profile_data = _profile_dict(profile)
-
-        # build prompt
-        if needs_profile:
-            system, user = prompt_builder(jd_text, profile_data)
-        else:
-            system, user = prompt_builder(jd_text)
-
-        # call AI (mock or real)
-        text, latency = chat_json(system, user, kind=kind.value)
-
-        # parse + validate — failures surface as task errors
-        raw = json.loads(text)
-        validated = schema_cls.model_validate(raw)
-        data = validated.model_dump()
-
-        # extract evidence refs from the validated output
-        evidence = _extract_evidence(data)
-
-        input_hash = _hash_inputs(jd_text, json.dumps(profile_data))
-        _save_output(
-            session,
-            app_id,
-            kind,
-            data,
-            latency,
-            input_hash,
-            evidence=evidence,
+    """Shared task runner used by every AI task.
+
+    With *stream_id* (the Celery task id) the model output is streamed to the
+    SSE endpoint as it arrives; see ``services.ai.stream``.  On the asyncio
+    runner a task with a *task_id* (one a worker received) is dispatched and
+    the worker slot released with ``Ignore``; the pipeline records the task's
+    outcome itself.  Without one (eager mode, direct calls) it is awaited.
+    """
+    if settings.ai_async_runner:
+        pipeline = _run_task_async(
+            app_id, kind, prompt_builder, schema_cls, needs_profile, force, stream_id
         )
-        return data
-
-
-@celery_app.task
-def task_parse_jd(application_id: str):
+        if task_id is None:
+            return async_runner.run(pipeline)
+        async_runner.dispatch(_store_outcome(task_id, pipeline))
+        raise Ignore()
+
+    publisher = StreamPublisher(stream_id) if stream_id else None
+    try:
+        # separate sessions so no connection is held while the model answers
+        with _SessionLocal() as session:
+            job, hit = _prepare(session, app_id, kind, prompt_builder, needs_profile, force)
+        if hit is not None:
+            count_lookup(hit)
+        if isinstance(job, dict):
+            result = job
+        else:
+            # call AI (mock or real)
+            text, latency = chat_json(
+                job.system,
+                job.user,
+                kind=kind.value,
+                on_delta=publisher.delta if publisher else None,
+            )
+            result, evidence = _parse_output(text, schema_cls)
+
+            with _SessionLocal() as session:
+                _save_output(
+                    session, app_id, kind, result, latency, job.input_hash, evidence=evidence
+                )
+    except Exception:
+        if publisher:
+            publisher.error("Task failed")
+        raise
+    if publisher:
+        _publish_result(publisher, result)
+    return result
+
+
+async def _run_task_async(
+    app_id: str,
+    kind: AIOutputKind,
+    prompt_builder,
+    schema_cls,
+    needs_profile=False,
+    force=False,
+    stream_id: str | None = None,
+):
+    """``_run_task`` as a coroutine on the process's asyncio runner."""
+    publisher = AsyncStreamPublisher(stream_id) if stream_id else None
+    async with async_runner.slot():
+        try:
+            async with async_runner.session() as session:
+                job, hit = await session.run_sync(
+                    _prepare, app_id, kind, prompt_builder, needs_profile, force
+                )
+            if hit is not None:
+                await asyncio.to_thread(count_lookup, hit)
+            if isinstance(job, dict):
+                result = job
+            else:
+                text, latency = await chat_json_async(
+                    job.system,
+                    job.user,
+                    kind=kind.value,
+                    on_delta=publisher.delta if publisher else None,
+                )
+                result, evidence = _parse_output(text, schema_cls)
+
+                async with async_runner.session() as session:
+                    await session.run_sync(
+                        _save_output, app_id, kind, result, latency, job.input_hash, evidence
+                    )
+        except Exception:
+            if publisher:
+                await publisher.error("Task failed")
+            raise
+    if publisher:
+        await _publish_result(publisher, result)
+    return result
+
+
+def _mark_outcome(task_id: str, result: dict | None, exc: Exception | None) -> None:
+    # blocking backend call; result backends are per thread, so fetch it here
+    if exc is not None:
+        celery_app.backend.mark_as_failure(task_id, exc)
+    else:
+        celery_app.backend.mark_as_done(task_id, result)
+
+
+async def _store_outcome(task_id: str, pipeline) -> None:
+    """Await a dispatched pipeline and record its outcome as the task's result."""
+    try:
+        result = await pipeline
+    except Exception as exc:
+        log.exception("AI task %s failed", task_id)
+        await asyncio.to_thread(_mark_outcome, task_id, None, exc)
+    else:
+        await asyncio.to_thread(_mark_outcome, task_id, result, None)
+
+
+def _worker_task_id(task) -> str | None:
+    """The id of a task a worker received; ``None`` when it runs inline."""
+    return None if task.request.is_eager else task.request.id
+
+
+@celery_app.task(bind=True)
+def task_parse_jd(self, application_id: str, force: bool = False, stream: bool = False):
     return _run_task(
         application_id,
         AIOutputKind.parse_jd,
         build_parse_jd_prompt,
         ParsedJD,
+        force=force,
+        stream_id=self.request.id if stream else None,
+        task_id=_worker_task_id(self),
     )
 
 
-@celery_app.task
-def task_match(application_id: str):
+@celery_app.task(bind=True)
+def task_match(self, application_id: str, force: bool = False, stream: bool = False):
     return _run_task(
         application_id,
         AIOutputKind.match,
         build_match_prompt,
         MatchResult,
         needs_profile=True,
+        force=force,
+        stream_id=self.request.id if stream else None,
+        task_id=_worker_task_id(self),
     )
 
 
-@celery_app.task
-def task_tailor_cv(application_id: str):
+@celery_app.task(bind=True)
+def task_tailor_cv(self, application_id: str, force: bool = False, stream: bool = False):
     return _run_task(
         application_id,
         AIOutputKind.tailor_cv,
         build_tailor_cv_prompt,
         TailoredCV,
         needs_profile=True,
+        force=force,
+        stream_id=self.request.id if stream else None,
+        task_id=_worker_task_id(self),
     )
 
 
-@celery_app.task
-def task_outreach(application_id: str):
+@celery_app.task(bind=True)
+def task_outreach(self, application_id: str, force: bool = False, stream: bool = False):
     return _run_task(
         application_id,
         AIOutputKind.outreach,
         build_outreach_prompt,
         OutreachResult,
         needs_profile=True,
+        force=force,
+        stream_id=self.request.id if stream else None,
+        task_id=_worker_task_id(self),
     )
 
 
-@celery_app.task
-def task_interview_prep(application_id: str):
+@celery_app.task(bind=True)
+def task_interview_prep(self, application_id: str, force: bool = False, stream: bool = False):
     return _run_task(
         application_id,
         AIOutputKind.interview_prep,
         build_interview_prep_prompt,
         InterviewPrepResult,
         needs_profile=True,
+        force=force,
+        stream_id=self.request.id if stream else None,
+        task_id=_worker_task_id(self),
     )
@@ -7,11 +7,31 @@ we test AI endpoints by verifying:
 1. API dispatch returns 200 with a task_id.
 2. Schema validation of mock outputs (covered in test_schemas.py).
 3. Ownership guard returns 404 for missing apps.
+
+The result cache runs the task body directly against a file database with a
+sync session of its own.
 """
 
+import asyncio
+import json
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
+from celery.exceptions import Ignore
 from conftest import register_and_login
 from httpx import AsyncClient
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import sessionmaker
+
+from applytrack.core.config import settings
+from applytrack.db.base import Base
+from applytrack.db.models.ai_output import AIOutput
+from applytrack.db.models.application import Application
+from applytrack.db.models.job_posting import JobPosting
+from applytrack.db.models.user import User
+from applytrack.services.ai import cache, inflight
+from applytrack.services.ai import client as ai_client
+from applytrack.workers import async_runner, tasks_ai
 
 
 async def _create_app_for_ai(client: AsyncClient):
@@ -79,6 +99,17 @@ async def test_interview_prep_dispatch(client: AsyncClient):
     assert "task_id" in resp.json()
 
 
+@pytest.mark.asyncio
+async def test_dispatch_records_request(client: AsyncClient):
+    headers, app_id = await _create_app_for_ai(client)
+    task_id = (await client.post(f"/api/v1/ai/match/{app_id}", headers=headers)).json()["task_id"]
+
+    # recorded on acceptance, even though the eager task fails here
+    resp = await client.get(f"/api/v1/applications/{app_id}/timeline", headers=headers)
+    events = [e for e in resp.json()["items"] if e["type"] == "ai_requested"]
+    assert [e["payload_json"] for e in events] == [{"kind": "match", "task_id": task_id}]
+
+
 @pytest.mark.asyncio
 async def test_ai_requires_ownership(client: AsyncClient):
     _, headers = await register_and_login(client)
@@ -90,3 +121,291 @@ async def test_ai_requires_ownership(client: AsyncClient):
 async def test_ai_requires_auth(client: AsyncClient):
     resp = await client.post("/api/v1/ai/parse-jd/some-id")
     assert resp.status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_dispatch_with_force(client: AsyncClient):
+    headers, app_id = await _create_app_for_ai(client)
+    resp = await client.post(f"/api/v1/ai/parse-jd/{app_id}?force=true", headers=headers)
+    assert resp.status_code == 200
+    assert "task_id" in resp.json()
+
+
+class _FakeRedis:
+    def __init__(self):
+        self.data = {}
+
+    async def set(self, key, value, nx=False, ex=None):
+        if nx and key in self.data:
+            return None
+        self.data[key] = str(value).encode()
+        return True
+
+    async def get(self, key):
+        value = self.data.get(key)
+        await asyncio.sleep(0)  # let racing triggers interleave here
+        return value
+
+    async def eval(self, script, numkeys, key, expected, *args):
+        if self.data.get(key) != expected.encode():
+            return None
+        if script == inflight._TAKE_OVER:
+            return await self.set(key, args[0])
+        del self.data[key]
+        return 1
+
+
+@pytest.mark.asyncio
+async def test_duplicate_trigger_coalesced(client: AsyncClient, monkeypatch):
+    headers, app_id = await _create_app_for_ai(client)
+    running = {"value": True}
+    monkeypatch.setattr(settings, "celery_always_eager", False)  # the app stays eager
+    monkeypatch.setattr(inflight, "_redis", _FakeRedis())
+    monkeypatch.setattr(inflight, "_is_running", lambda task_id: running["value"])
+
+    first = (await client.post(f"/api/v1/ai/match/{app_id}", headers=headers)).json()
+    second = (await client.post(f"/api/v1/ai/match/{app_id}", headers=headers)).json()
+    assert first["status"] == "submitted"
+    assert second == {"task_id": first["task_id"], "status": "in_progress"}
+
+    # other kinds and forced reruns are separate jobs
+    other = (await client.post(f"/api/v1/ai/parse-jd/{app_id}", headers=headers)).json()
+    forced = (await client.post(f"/api/v1/ai/match/{app_id}?force=true", headers=headers)).json()
+    assert other["status"] == forced["status"] == "submitted"
+    assert len({first["task_id"], other["task_id"], forced["task_id"]}) == 3
+
+    # once the task has finished, the next trigger starts a new one
+    running["value"] = False
+    third = (await client.post(f"/api/v1/ai/match/{app_id}", headers=headers)).json()
+    assert third["status"] == "submitted"
+    assert third["task_id"] != first["task_id"]
+
+
+@pytest.mark.asyncio
+async def test_stale_claim_taken_over_once(monkeypatch):
+    monkeypatch.setattr(settings, "celery_always_eager", False)
+    redis = _FakeRedis()
+    monkeypatch.setattr(inflight, "_redis", redis)
+    monkeypatch.setattr(inflight, "_is_running", lambda task_id: task_id != "finished")
+    await redis.set(inflight._key("app", "match", "h", False), "finished")
+
+    claims = await asyncio.gather(*(inflight.claim_task("app", "match", "h") for _ in range(3)))
+    assert sum(is_new for _, is_new in claims) == 1
+    assert len({task_id for task_id, _ in claims}) == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_enqueue_releases_claim(client: AsyncClient, monkeypatch):
+    headers, app_id = await _create_app_for_ai(client)
+    monkeypatch.setattr(settings, "celery_always_eager", False)
+    redis = _FakeRedis()
+    monkeypatch.setattr(inflight, "_redis", redis)
+    monkeypatch.setattr(inflight, "_is_running", lambda task_id: True)
+
+    def broker_down(*args, **kwargs):
+        raise ConnectionError("broker down")
+
+    monkeypatch.setattr(tasks_ai.task_match, "apply_async", broker_down)
+    with pytest.raises(ConnectionError):
+        await client.post(f"/api/v1/ai/match/{app_id}", headers=headers)
+    assert redis.data == {}
+
+
+@pytest.fixture
+def worker_session(tmp_path, monkeypatch):
+    engine = create_engine(f"sqlite:///{tmp_path / 'worker.db'}")
+    Base.metadata.create_all(engine)
+    session_factory = sessionmaker(bind=engine, expire_on_commit=False)
+    monkeypatch.setattr(tasks_ai, "_SessionLocal", session_factory)
+    yield session_factory
+    engine.dispose()
+
+
+def _seed_applications(session_factory, descriptions: list[str]) -> list[str]:
+    with session_factory() as session:
+        user = User(email="worker@example.com", password_hash="x")
+        session.add(user)
+        session.flush()
+        app_ids = []
+        for description in descriptions:
+            posting = JobPosting(title="SWE", description_raw=description)
+            session.add(posting)
+            session.flush()
+            app = Application(user_id=user.id, job_posting_id=posting.id)
+            session.add(app)
+            session.flush()
+            app_ids.append(app.id)
+        session.commit()
+    return app_ids
+
+
+class _FakeCounters:
+    """Sync ``INCR`` for the worker, async ``MGET`` for the API."""
+
+    def __init__(self):
+        self.data = {}
+
+    def incr(self, key):
+        self.data[key] = self.data.get(key, 0) + 1
+        return self.data[key]
+
+    async def mget(self, *keys):
+        return [str(self.data[key]).encode() if key in self.data else None for key in keys]
+
+
+def test_result_cache(worker_session, monkeypatch):
+    counters = _FakeCounters()
+    monkeypatch.setattr(cache, "_redis", counters)
+    calls = []
+    real_chat_json = tasks_ai.chat_json
+
+    def counting_chat_json(system, user, kind="", on_delta=None):
+        calls.append(kind)
+        return real_chat_json(system, user, kind=kind, on_delta=on_delta)
+
+    monkeypatch.setattr(tasks_ai, "chat_json", counting_chat_json)
+    monkeypatch.setattr("applytrack.services.ai.client.time.sleep", lambda _: None)
+
+    first, second = _seed_applications(worker_session, ["Same posting text."] * 2)
+
+    result = tasks_ai.task_parse_jd.run(first)
+    assert calls == ["parse_jd"]
+    assert counters.data == {cache.MISS_KEY: 1}
+
+    # same application: served from the stored row, nothing new written
+    assert tasks_ai.task_parse_jd.run(first) == result
+    # another application with the same posting text reuses it too
+    assert tasks_ai.task_parse_jd.run(second) == result
+    assert calls == ["parse_jd"]
+    assert counters.data == {cache.MISS_KEY: 1, cache.HIT_KEY: 2}
+
+    # force skips the cache, and is not a lookup
+    tasks_ai.task_parse_jd.run(second, force=True)
+    assert calls == ["parse_jd", "parse_jd"]
+    assert counters.data == {cache.MISS_KEY: 1, cache.HIT_KEY: 2}
+
+    # mock outputs are stored under the model "mock": real mode calls the model
+    def real_model(system, user, kind="", on_delta=None):
+        calls.append("real")
+        return json.dumps(result), 0.1
+
+    monkeypatch.setattr(settings, "ai_mode", "real")
+    monkeypatch.setattr(tasks_ai, "chat_json", real_model)
+    tasks_ai.task_parse_jd.run(first)
+    assert calls == ["parse_jd", "parse_jd", "real"]
+
+    with worker_session() as session:
+        counts = dict(
+            session.execute(
+                select(AIOutput.application_id, func.count()).group_by(AIOutput.application_id)
+            ).all()
+        )
+        rows = session.scalars(select(AIOutput).where(AIOutput.application_id == second)).all()
+    assert counts == {first: 2, second: 2}
+    assert 0.0 in {row.latency_seconds for row in rows}  # the copied hit
+    assert all(row.prompt_version for row in rows)
+    assert {row.model for row in rows} == {"mock"}
+
+
+@pytest.mark.asyncio
+async def test_cache_counts_endpoint(client: AsyncClient, monkeypatch):
+    counters = _FakeCounters()
+    monkeypatch.setattr(cache, "_async_redis", counters)
+    assert (await client.get("/health/ai-cache")).json() == {"hits": 0, "misses": 0}
+
+    monkeypatch.setattr(cache, "_redis", counters)
+    cache.count_lookup(True)
+    cache.count_lookup(False)
+    cache.count_lookup(True)
+    assert (await client.get("/health/ai-cache")).json() == {"hits": 2, "misses": 1}
+
+
+def test_async_runner_bounds_concurrency(worker_session, tmp_path, monkeypatch):
+    app_ids = _seed_applications(worker_session, [f"Posting {i}" for i in range(6)])
+    monkeypatch.setattr(settings, "database_url", f"sqlite+aiosqlite:///{tmp_path / 'worker.db'}")
+    monkeypatch.setattr(settings, "ai_async_runner", True)
+    monkeypatch.setattr(settings, "ai_max_concurrency", 2)
+
+    # every pipeline runs on the runner's one event loop: no locks needed
+    in_flight = {"now": 0, "max": 0}
+    # model calls go through in pairs, so two are known to overlap; under a
+    # cap of one no pair forms and the timeout fails the task instead
+    pairs = asyncio.Barrier(2)
+    real_chat_json_async = tasks_ai.chat_json_async
+
+    async def tracking_chat_json_async(system, user, kind="", on_delta=None):
+        in_flight["now"] += 1
+        in_flight["max"] = max(in_flight["max"], in_flight["now"])
+        try:
+            await asyncio.wait_for(pairs.wait(), timeout=5)
+            return await real_chat_json_async(system, user, kind=kind, on_delta=on_delta)
+        finally:
+            in_flight["now"] -= 1
+
+    monkeypatch.setattr(tasks_ai, "chat_json_async", tracking_chat_json_async)
+    monkeypatch.setattr(ai_client, "MOCK_DELAY_SECONDS", 0)
+    try:
+        # called without a worker request, each task waits for its pipeline
+        with ThreadPoolExecutor(len(app_ids)) as pool:
+            results = list(pool.map(tasks_ai.task_parse_jd.run, app_ids))
+    finally:
+        async_runner.shutdown()
+
+    assert all("role_title" in result for result in results)
+    assert in_flight["max"] <= 2  # the cap held
+    assert in_flight["max"] == 2  # and was reached
+    with worker_session() as session:
+        assert session.scalar(select(func.count()).select_from(AIOutput)) == len(app_ids)
+
+
+def test_async_runner_frees_worker_slot(worker_session, tmp_path, monkeypatch):
+    app_ids = _seed_applications(worker_session, [f"Posting {i}" for i in range(6)])
+    monkeypatch.setattr(settings, "database_url", f"sqlite+aiosqlite:///{tmp_path / 'worker.db'}")
+    monkeypatch.setattr(settings, "ai_async_runner", True)
+    monkeypatch.setattr(settings, "ai_max_concurrency", 3)
+
+    # three model calls must be in flight at once for any of them to finish
+    trio = asyncio.Barrier(3)
+    real_chat_json_async = tasks_ai.chat_json_async
+
+    async def gated_chat_json_async(system, user, kind="", on_delta=None):
+        await asyncio.wait_for(trio.wait(), timeout=5)
+        return await real_chat_json_async(system, user, kind=kind, on_delta=on_delta)
+
+    outcomes = {}
+    monkeypatch.setattr(tasks_ai, "chat_json_async", gated_chat_json_async)
+    monkeypatch.setattr(
+        tasks_ai, "_mark_outcome", lambda *outcome: outcomes.update({outcome[0]: outcome[1:]})
+    )
+    monkeypatch.setattr(ai_client, "MOCK_DELAY_SECONDS", 0)
+    task = tasks_ai.task_parse_jd
+    try:
+        # a worker with --concurrency 1: this thread is its only slot
+        for i, app_id in enumerate(app_ids):
+            task.push_request(id=f"task-{i}", is_eager=False)
+            try:
+                with pytest.raises(Ignore):
+                    task.run(app_id)
+            finally:
+                task.pop_request()
+    finally:
+        async_runner.shutdown()  # waits for the dispatched pipelines
+
+    assert sorted(outcomes) == [f"task-{i}" for i in range(len(app_ids))]
+    assert all(exc is None and "role_title" in result for result, exc in outcomes.values())
+
+
+def test_client_registry(monkeypatch):
+    monkeypatch.setattr(ai_client, "_clients", {})
+    first = ai_client.get_client()
+    assert ai_client.get_client() is first
+
+    # a different timeout (or key, or base URL) gets its own client
+    monkeypatch.setattr(settings, "ai_timeout_seconds", settings.ai_timeout_seconds + 1)
+    assert ai_client.get_client() is not first
+    assert len(ai_client._clients) == 2
+
+    # a forked child starts empty instead of reusing the parent's connections
+    ai_client._forget_clients()
+    assert ai_client._clients == {}
+    ai_client.close_clients()
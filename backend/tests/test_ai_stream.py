@@ -0,0 +1,117 @@
+"""AI output streaming: partial JSON parsing, relay and the SSE endpoint.
+
+No Redis runs under test, so the endpoint tests cover the fallback path: the
+stream ends with the task's outcome once Celery reports it ready, or with a
+timeout.
+"""
+
+import json
+
+import pytest
+from conftest import register_and_login
+from httpx import AsyncClient
+
+from applytrack.schemas.ai_schemas import ParsedJD
+from applytrack.services.ai import client as ai_client
+from applytrack.services.ai import stream
+from applytrack.services.ai.stream import PartialRelay, parse_partial
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("", None),
+        ("{", {}),
+        ('{"role_title"', {}),
+        ('{"role_title": "Back', {"role_title": "Back"}),
+        ('{"skills": ["Python", "Fast', {"skills": ["Python", "Fast"]}),
+        ('{"skills": [{"name": "Py", "evid', {"skills": [{"name": "Py"}]}),
+        ('{"score": 7', {}),  # the number may still grow
+        ('{"score": 78, "ok": tr', {"score": 78}),
+        ('{"text": "a\\u00', {"text": "a"}),
+        ('{"text": "say \\"hi\\"', {"text": 'say "hi"'}),
+        ('{"a": [1, 2], "b": {}}', {"a": [1, 2], "b": {}}),
+    ],
+)
+def test_parse_partial(text, expected):
+    assert parse_partial(text) == expected
+
+
+def test_relay_replays_then_skips_seen_deltas():
+    relay = PartialRelay()
+    assert relay.replay('{"keywords": ["a"') == [("partial", {"keywords": ["a"]})]
+
+    # published before the buffer was read: already part of the replay
+    assert relay.feed({"type": "delta", "offset": 0, "text": '{"keywords": '}) == []
+    # overlaps the replay, only the new tail counts
+    assert relay.feed({"type": "delta", "offset": 13, "text": '["a", "b"'}) == [
+        ("partial", {"keywords": ["a", "b"]})
+    ]
+    # no visible change, no event
+    assert relay.feed({"type": "delta", "offset": 22, "text": ", "}) == []
+    assert relay.feed({"type": "done", "result": {"keywords": ["a", "b"]}}) == [
+        ("done", {"keywords": ["a", "b"]})
+    ]
+
+
+def test_mock_stream_yields_partials(monkeypatch):
+    monkeypatch.setattr(ai_client, "MOCK_DELAY_SECONDS", 0)
+    relay = PartialRelay()
+    offset, skills_seen = 0, []
+
+    def on_delta(piece):
+        nonlocal offset
+        for event, data in relay.feed({"type": "delta", "offset": offset, "text": piece}):
+            skills_seen.append(len(data.get("must_have_skills", [])))
+        offset += len(piece)
+
+    text, _ = ai_client.chat_json("system", "user", kind="parse_jd", on_delta=on_delta)
+
+    ParsedJD.model_validate(json.loads(text))
+    assert relay.text == text
+    # the skills list fills up item by item before the stream ends
+    assert 1 in skills_seen and skills_seen[-1] == 3
+
+
+@pytest.mark.asyncio
+async def test_stream_endpoint_ends_with_task_outcome(client: AsyncClient, monkeypatch):
+    monkeypatch.setattr(stream, "IDLE_SECONDS", 0.01)
+    _, headers = await register_and_login(client)
+    resp = await client.post(
+        "/api/v1/applications/",
+        json={"company_name": "StreamCo", "role_title": "SWE", "job_description": "Python"},
+        headers=headers,
+    )
+    app_id = resp.json()["id"]
+
+    resp = await client.post(f"/api/v1/ai/parse-jd/{app_id}?stream=true", headers=headers)
+    assert resp.status_code == 200
+    task_id = resp.json()["task_id"]
+
+    resp = await client.get(f"/api/v1/ai/tasks/{task_id}/stream", headers=headers)
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("text/event-stream")
+    events = [line for line in resp.text.splitlines() if line.startswith("event: ")]
+    # the eager worker cannot see the test database, so the task fails
+    assert events[-1] == "event: error"
+
+    _, other = await register_and_login(client, email="other@test.com")
+    resp = await client.get(f"/api/v1/ai/tasks/{task_id}/stream", headers=other)
+    assert resp.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_stream_times_out(monkeypatch):
+    monkeypatch.setattr(stream, "IDLE_SECONDS", 0.01)
+    monkeypatch.setattr(stream, "MAX_SECONDS", 0.05)
+    monkeypatch.setattr(stream, "_finished", lambda task_id: None)  # never finishes
+
+    frames = [frame async for frame in stream.relay_events("stuck-task")]
+    assert frames[0] == ": keep-alive\n\n"
+    assert frames[-1].startswith("event: timeout\n")
+
+
+@pytest.mark.asyncio
+async def test_stream_endpoint_requires_auth(client: AsyncClient):
+    resp = await client.get("/api/v1/ai/tasks/some-id/stream")
+    assert resp.status_code == 401
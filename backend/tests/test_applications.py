@@ -3,6 +3,10 @@
 import pytest
 from conftest import register_and_login
 from httpx import AsyncClient
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from applytrack.db.models.ai_output import AIOutput, AIOutputKind
 
 
 async def _create_app(client: AsyncClient, headers: dict, **overrides) -> dict:
@@ -35,6 +39,42 @@ async def test_create_application(client: AsyncClient):
     assert data["job_posting"]["company"]["name"] == "Acme Corp"
 
 
+@pytest.mark.asyncio
+async def test_create_application_reuses_company(client: AsyncClient, db_session: AsyncSession):
+    _, headers = await register_and_login(client)
+    first = await _create_app(client, headers, company_name="Acme Corp")
+
+    statements = []
+    engine = db_session.get_bind()
+
+    def _record(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", _record)
+    try:
+        second = await _create_app(client, headers, company_name="  ACME   corp")
+    finally:
+        event.remove(engine, "before_cursor_execute", _record)
+
+    company = second["job_posting"]["company"]
+    assert company["id"] == first["job_posting"]["company"]["id"]
+    assert company["name"] == "Acme Corp"
+    assert second["job_posting"]["created_at"]
+    # no reload of the new rows: the response is built from the inserted objects
+    assert not any(
+        s.lstrip().startswith("SELECT") and ("applications" in s or "job_postings" in s)
+        for s in statements
+    )
+
+    resp = await client.get("/api/v1/companies/", headers=headers)
+    assert len(resp.json()) == 1
+
+    # names are only unique per user
+    _, other = await register_and_login(client, email="other@test.com")
+    third = await _create_app(client, other, company_name="Acme Corp")
+    assert third["job_posting"]["company"]["id"] != company["id"]
+
+
 @pytest.mark.asyncio
 async def test_list_applications(client: AsyncClient):
     _, headers = await register_and_login(client)
@@ -43,7 +83,7 @@ async def test_list_applications(client: AsyncClient):
 
     resp = await client.get("/api/v1/applications/", headers=headers)
     assert resp.status_code == 200
-    assert len(resp.json()) == 2
+    assert len(resp.json()["items"]) == 2
 
 
 @pytest.mark.asyncio
@@ -54,7 +94,7 @@ async def test_list_applications_filter_by_status(client: AsyncClient):
 
     resp = await client.get("/api/v1/applications/?status=interview", headers=headers)
     assert resp.status_code == 200
-    apps = resp.json()
+    apps = resp.json()["items"]
     assert len(apps) == 1
     assert apps[0]["status"] == "interview"
 
@@ -67,8 +107,275 @@ async def test_list_applications_search(client: AsyncClient):
 
     resp = await client.get("/api/v1/applications/?search=google", headers=headers)
     assert resp.status_code == 200
+    assert len(resp.json()["items"]) == 1
+
+
+@pytest.mark.asyncio
+async def test_list_applications_search_matches_role_title(client: AsyncClient):
+    _, headers = await register_and_login(client)
+    await _create_app(client, headers, company_name="A", role_title="Platform Engineer")
+    await _create_app(client, headers, company_name="B", role_title="Data Analyst")
+
+    resp = await client.get("/api/v1/applications/?search=PLATFORM", headers=headers)
+    assert [a["job_posting"]["title"] for a in resp.json()["items"]] == ["Platform Engineer"]
+
+    # short terms skip the trigram index but still match
+    resp = await client.get("/api/v1/applications/?search=da", headers=headers)
+    assert [a["job_posting"]["title"] for a in resp.json()["items"]] == ["Data Analyst"]
+
+
+@pytest.mark.asyncio
+async def test_list_applications_search_is_scoped_and_literal(client: AsyncClient):
+    _, headers = await register_and_login(client)
+    _, other = await register_and_login(client, email="other@test.com")
+    await _create_app(client, other, company_name="Google")
+    created = await _create_app(client, headers, company_name="Google")
+
+    resp = await client.get("/api/v1/applications/?search=google", headers=headers)
+    assert [a["id"] for a in resp.json()["items"]] == [created["id"]]
+
+    # wildcards and FTS syntax are treated as plain text
+    for term in ("%", "_", '"goo', "google OR x"):
+        resp = await client.get("/api/v1/applications/", params={"search": term}, headers=headers)
+        assert resp.status_code == 200
+        assert resp.json()["items"] == []
+
+    await client.delete(f"/api/v1/applications/{created['id']}", headers=headers)
+    resp = await client.get("/api/v1/applications/?search=google", headers=headers)
+    assert resp.json()["items"] == []
+
+
+@pytest.mark.asyncio
+async def test_list_applications_keyset_pagination(client: AsyncClient):
+    _, headers = await register_and_login(client)
+    created = [(await _create_app(client, headers, company_name=f"Co {i}"))["id"] for i in range(5)]
+
+    seen, cursor = [], None
+    while True:
+        params = {"limit": 2, **({"cursor": cursor} if cursor else {})}
+        resp = await client.get("/api/v1/applications/", params=params, headers=headers)
+        assert resp.status_code == 200
+        page = resp.json()
+        assert len(page["items"]) <= 2
+        seen.extend(a["id"] for a in page["items"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+
+    # newest first, every row exactly once
+    assert seen == list(reversed(created))
+
+
+@pytest.mark.asyncio
+async def test_list_applications_cursor_survives_updates(client: AsyncClient):
+    _, headers = await register_and_login(client)
+    first = await _create_app(client, headers, company_name="First")
+    await _create_app(client, headers, company_name="Second")
+
+    resp = await client.get("/api/v1/applications/?limit=1", headers=headers)
+    cursor = resp.json()["next_cursor"]
+
+    # a row touched after the first page moves to the front, not into later pages
+    await client.patch(f"/api/v1/applications/{first['id']}", json={"notes": "x"}, headers=headers)
+    resp = await client.get("/api/v1/applications/", params={"cursor": cursor}, headers=headers)
+    assert resp.json() == {"items": [], "next_cursor": None}
+
+
+@pytest.mark.asyncio
+async def test_list_applications_invalid_cursor(client: AsyncClient):
+    _, headers = await register_and_login(client)
+    resp = await client.get("/api/v1/applications/?cursor=not-a-cursor", headers=headers)
+    assert resp.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_board_groups_by_status(client: AsyncClient):
+    _, headers = await register_and_login(client)
+    applied = [
+        (await _create_app(client, headers, company_name=f"A{i}", status="applied"))["id"]
+        for i in range(3)
+    ]
+    offer = await _create_app(client, headers, company_name="O", status="offer")
+
+    resp = await client.get("/api/v1/applications/board?per_column=2", headers=headers)
+    assert resp.status_code == 200
+    columns = {c["status"]: c for c in resp.json()["columns"]}
+    assert list(columns) == [
+        "not_applied",
+        "applied",
+        "interview",
+        "offer",
+        "rejected",
+        "archived",
+    ]
+
+    assert columns["applied"]["count"] == 3
+    assert [a["id"] for a in columns["applied"]["items"]] == applied[:0:-1]
+    assert columns["offer"]["count"] == 1
+    assert [a["id"] for a in columns["offer"]["items"]] == [offer["id"]]
+    assert columns["offer"]["next_cursor"] is None
+    assert columns["interview"] == {
+        "status": "interview",
+        "count": 0,
+        "items": [],
+        "next_cursor": None,
+    }
+
+    # "load more" continues the column through the list endpoint
+    resp = await client.get(
+        "/api/v1/applications/",
+        params={"status": "applied", "cursor": columns["applied"]["next_cursor"]},
+        headers=headers,
+    )
+    assert [a["id"] for a in resp.json()["items"]] == applied[:1]
+
+
+@pytest.mark.asyncio
+async def test_board_search(client: AsyncClient):
+    _, headers = await register_and_login(client)
+    await _create_app(client, headers, company_name="Google", status="applied")
+    await _create_app(client, headers, company_name="Meta", status="applied")
+
+    resp = await client.get("/api/v1/applications/board?search=goog", headers=headers)
+    columns = {c["status"]: c for c in resp.json()["columns"]}
+    assert columns["applied"]["count"] == 1
+    assert columns["applied"]["items"][0]["job_posting"]["company"]["name"] == "Google"
+
+
+@pytest.mark.asyncio
+async def test_list_and_board_omit_text_bodies(client: AsyncClient, db_session: AsyncSession):
+    _, headers = await register_and_login(client)
+    created = await _create_app(client, headers, job_description="x" * 20_000)
+    db_session.expunge_all()
+
+    resp = await client.get("/api/v1/applications/", headers=headers)
+    item = resp.json()["items"][0]
+    assert "notes" not in item
+    assert "description_raw" not in item["job_posting"]
+    assert item["job_posting"]["company"]["name"] == "Acme Corp"
+
+    resp = await client.get("/api/v1/applications/board", headers=headers)
+    columns = {c["status"]: c for c in resp.json()["columns"]}
+    assert "notes" not in columns["applied"]["items"][0]
+
+    # the detail endpoint still returns the full bodies
+    resp = await client.get(f"/api/v1/applications/{created['id']}", headers=headers)
+    assert resp.json()["notes"] == "Looks promising"
+    assert resp.json()["job_posting"]["description_raw"] == "x" * 20_000
+
+
+@pytest.mark.asyncio
+async def test_list_applications_sparse_fields(client: AsyncClient, db_session: AsyncSession):
+    _, headers = await register_and_login(client)
+    for i in range(3):
+        await _create_app(client, headers, role_title=f"Role {i}")
+    db_session.expunge_all()
+
+    resp = await client.get(
+        "/api/v1/applications/", params={"fields": "status, id", "limit": 2}, headers=headers
+    )
+    assert resp.status_code == 200
+    body = resp.json()
+    assert [set(item) for item in body["items"]] == [{"id", "status"}] * 2
+    assert body["next_cursor"]
+
+    resp = await client.get(
+        "/api/v1/applications/",
+        params={"fields": "id,job_posting", "cursor": body["next_cursor"]},
+        headers=headers,
+    )
+    (item,) = resp.json()["items"]
+    assert item["job_posting"]["title"] == "Role 0"
+    assert "description_raw" not in item["job_posting"]
+
+
+@pytest.mark.asyncio
+async def test_list_applications_rejects_unknown_fields(client: AsyncClient):
+    _, headers = await register_and_login(client)
+    resp = await client.get("/api/v1/applications/?fields=id,notes", headers=headers)
+    assert resp.status_code == 400
+    assert "notes" in resp.json()["detail"]
+
+
+@pytest.mark.asyncio
+async def test_list_and_board_etag(client: AsyncClient):
+    _, headers = await register_and_login(client)
+    created = await _create_app(client, headers)
+
+    for url in ("/api/v1/applications/", "/api/v1/applications/?fields=id"):
+        resp = await client.get(url, headers=headers)
+        etag = resp.headers["etag"]
+        assert resp.headers["cache-control"] == "private, no-cache"
+
+        resp = await client.get(url, headers={**headers, "If-None-Match": etag})
+        assert resp.status_code == 304
+        assert resp.headers["etag"] == etag
+        assert resp.content == b""
+
+    resp = await client.get("/api/v1/applications/board", headers=headers)
+    board_etag = resp.headers["etag"]
+
+    await client.patch(
+        f"/api/v1/applications/{created['id']}", json={"status": "offer"}, headers=headers
+    )
+    resp = await client.get("/api/v1/applications/", headers={**headers, "If-None-Match": etag})
+    assert resp.status_code == 200
+    assert resp.json()["items"][0]["status"] == "offer"
+    resp = await client.get(
+        "/api/v1/applications/board", headers={**headers, "If-None-Match": board_etag}
+    )
+    assert resp.status_code == 200
+
+    # deleting a card invalidates the validator too
+    other = await _create_app(client, headers, company_name="Other")
+    resp = await client.get("/api/v1/applications/board", headers=headers)
+    etag = resp.headers["etag"]
+    await client.delete(f"/api/v1/applications/{other['id']}", headers=headers)
+    resp = await client.get(
+        "/api/v1/applications/board", headers={**headers, "If-None-Match": etag}
+    )
+    assert resp.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_detail_and_ai_outputs_etag(client: AsyncClient, db_session: AsyncSession):
+    _, headers = await register_and_login(client)
+    created = await _create_app(client, headers)
+    detail_url = f"/api/v1/applications/{created['id']}"
+    outputs_url = f"{detail_url}/ai-outputs"
+
+    resp = await client.get(detail_url, headers=headers)
+    detail_etag = resp.headers["etag"]
+    resp = await client.get(detail_url, headers={**headers, "If-None-Match": detail_etag})
+    assert resp.status_code == 304
+
+    resp = await client.get(outputs_url, headers=headers)
+    outputs_etag = resp.headers["etag"]
+    resp = await client.get(
+        outputs_url, headers={**headers, "If-None-Match": f'"other", {outputs_etag}'}
+    )
+    assert resp.status_code == 304
+
+    db_session.add(
+        AIOutput(
+            application_id=created["id"],
+            kind=AIOutputKind.parse_jd,
+            input_hash="abc",
+            output_json={},
+            model="mock",
+            latency_seconds=0.1,
+        )
+    )
+    await db_session.commit()
+    resp = await client.get(outputs_url, headers={**headers, "If-None-Match": outputs_etag})
+    assert resp.status_code == 200
     assert len(resp.json()) == 1
 
+    await client.patch(detail_url, json={"notes": "Changed"}, headers=headers)
+    resp = await client.get(detail_url, headers={**headers, "If-None-Match": detail_etag})
+    assert resp.status_code == 200
+    assert resp.json()["notes"] == "Changed"
+
 
 @pytest.mark.asyncio
 async def test_read_application(client: AsyncClient):
@@ -95,6 +402,138 @@ async def test_update_application(client: AsyncClient):
     assert resp.json()["notes"] == "First round scheduled"
 
 
+@pytest.mark.asyncio
+async def test_bulk_update_applications(client: AsyncClient):
+    _, headers = await register_and_login(client)
+    apps = [await _create_app(client, headers, role_title=f"Role {i}") for i in range(4)]
+    ids = [a["id"] for a in apps]
+
+    resp = await client.patch(
+        "/api/v1/applications/",
+        json=[
+            {"id": ids[0], "status": "archived"},
+            {"id": ids[1], "status": "archived"},
+            {"id": ids[2], "priority": "low"},
+            {"id": ids[2], "status": "interview"},
+            {"id": ids[3]},
+        ],
+        headers=headers,
+    )
+    assert resp.status_code == 200, resp.text
+    results = resp.json()
+    assert [r["id"] for r in results] == ids[:3]
+    assert [r["status"] for r in results] == ["archived", "archived", "interview"]
+    assert results[2]["priority"] == "low"
+    assert results[0]["updated_at"] > apps[0]["updated_at"]
+
+    resp = await client.get("/api/v1/applications/?status=archived", headers=headers)
+    assert {a["id"] for a in resp.json()["items"]} == set(ids[:2])
+
+
+@pytest.mark.asyncio
+async def test_bulk_update_records_only_status_changes(client: AsyncClient):
+    _, headers = await register_and_login(client)
+    apps = [await _create_app(client, headers) for _ in range(2)]
+    ids = [a["id"] for a in apps]
+
+    resp = await client.patch(
+        "/api/v1/applications/",
+        json=[{"id": ids[0], "status": "interview"}, {"id": ids[1], "status": "applied"}],
+        headers=headers,
+    )
+    assert resp.status_code == 200, resp.text
+
+    timelines = [
+        (await client.get(f"/api/v1/applications/{app_id}/timeline", headers=headers)).json()
+        for app_id in ids
+    ]
+    changes = [
+        [e["payload_json"] for e in t["items"] if e["type"] == "status_changed"] for t in timelines
+    ]
+    assert changes == [[{"from": "applied", "to": "interview"}], []]
+
+
+@pytest.mark.asyncio
+async def test_bulk_update_is_all_or_nothing(client: AsyncClient):
+    _, headers_a = await register_and_login(client, email="a@test.com")
+    _, headers_b = await register_and_login(client, email="b@test.com")
+    mine = await _create_app(client, headers_a)
+    theirs = await _create_app(client, headers_b)
+
+    resp = await client.patch(
+        "/api/v1/applications/",
+        json=[{"id": mine["id"], "status": "offer"}, {"id": theirs["id"], "status": "offer"}],
+        headers=headers_a,
+    )
+    assert resp.status_code == 404
+    assert theirs["id"] in resp.json()["detail"]
+
+    for app, headers in ((mine, headers_a), (theirs, headers_b)):
+        resp = await client.get(f"/api/v1/applications/{app['id']}", headers=headers)
+        assert resp.json()["status"] == "applied"
+
+    resp = await client.patch("/api/v1/applications/", json=[], headers=headers_a)
+    assert resp.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_timeline_records_changes(client: AsyncClient):
+    _, headers = await register_and_login(client)
+    app_id = (await _create_app(client, headers))["id"]
+    url = f"/api/v1/applications/{app_id}"
+
+    await client.patch(url, json={"status": "interview", "notes": "Call"}, headers=headers)
+    await client.patch(url, json={"priority": "low"}, headers=headers)
+    await client.patch(
+        "/api/v1/applications/", json=[{"id": app_id, "status": "offer"}], headers=headers
+    )
+    resp = await client.post(
+        f"{url}/reminders",
+        json={"text": "Follow up", "due_at": "2026-03-01T10:00:00Z"},
+        headers=headers,
+    )
+    await client.patch(
+        f"/api/v1/reminders/{resp.json()['id']}", json={"done": True}, headers=headers
+    )
+
+    resp = await client.get(f"{url}/timeline", headers=headers)
+    assert resp.status_code == 200
+    events = resp.json()["items"]
+    assert [e["type"] for e in events] == [
+        "reminder_done",
+        "reminder_created",
+        "status_changed",
+        "note_added",
+        "status_changed",
+    ]
+    assert events[1]["payload_json"]["text"] == "Follow up"
+    assert events[2]["payload_json"] == {"from": "interview", "to": "offer"}
+    assert events[4]["payload_json"] == {"from": "applied", "to": "interview"}
+    assert resp.json()["next_cursor"] is None
+
+
+@pytest.mark.asyncio
+async def test_timeline_pagination(client: AsyncClient):
+    _, headers = await register_and_login(client)
+    app_id = (await _create_app(client, headers))["id"]
+    url = f"/api/v1/applications/{app_id}"
+    for status in ("interview", "offer", "rejected"):
+        await client.patch(url, json={"status": status}, headers=headers)
+
+    first = (await client.get(f"{url}/timeline?limit=2", headers=headers)).json()
+    assert [e["payload_json"]["to"] for e in first["items"]] == ["rejected", "offer"]
+    rest = (
+        await client.get(
+            f"{url}/timeline", params={"limit": 2, "cursor": first["next_cursor"]}, headers=headers
+        )
+    ).json()
+    assert [e["payload_json"]["to"] for e in rest["items"]] == ["interview"]
+    assert rest["next_cursor"] is None
+
+    _, other = await register_and_login(client, email="other@test.com")
+    assert (await client.get(f"{url}/timeline", headers=other)).status_code == 404
+
+
 @pytest.mark.asyncio
 async def test_delete_application(client: AsyncClient):
     _, headers = await register_and_login(client)
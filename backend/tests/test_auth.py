@@ -1,8 +1,22 @@
 """Auth endpoint tests: register, login, /me, edge cases."""
 
+import asyncio
+
 import pytest
 from conftest import register_and_login
 from httpx import AsyncClient
+from sqlalchemy import delete, event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from applytrack.api import deps
+from applytrack.api.deps import invalidate_user
+from applytrack.core.config import settings
+from applytrack.core.security import (
+    hash_password_async,
+    password_hash_stats,
+    verify_password_async,
+)
+from applytrack.db.models.user import User
 
 
 @pytest.mark.asyncio
@@ -71,3 +85,76 @@ async def test_me_returns_current_user(client: AsyncClient):
 async def test_me_without_token(client: AsyncClient):
     resp = await client.get("/api/v1/auth/me")
     assert resp.status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_password_hashing_runs_in_pool():
+    hashed = await hash_password_async("Str0ng!Pass")
+    results = await asyncio.gather(
+        *(verify_password_async(pw, hashed) for pw in ("Str0ng!Pass", "wrong") * 3)
+    )
+    assert results == [True, False] * 3
+    assert password_hash_stats()["in_flight"] == 0
+
+
+@pytest.mark.asyncio
+async def test_health_reports_password_hash_pool(client: AsyncClient):
+    resp = await client.get("/health")
+    assert resp.json()["password_hash"] == password_hash_stats()
+
+
+@pytest.mark.asyncio
+async def test_current_user_is_cached(client: AsyncClient, db_session: AsyncSession):
+    _, headers = await register_and_login(client, "cached@test.com")
+    resp = await client.get("/api/v1/auth/me", headers=headers)
+    user_id = resp.json()["id"]
+
+    statements = []
+    engine = db_session.get_bind()
+
+    def _record(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", _record)
+    try:
+        resp = await client.get("/api/v1/auth/me", headers=headers)
+        assert resp.json() == {"id": user_id, "email": "cached@test.com"}
+        assert statements == []
+
+        await invalidate_user(user_id)
+        await db_session.execute(delete(User).where(User.id == user_id))
+        await db_session.commit()
+        statements.clear()
+        resp = await client.get("/api/v1/auth/me", headers=headers)
+        assert resp.status_code == 401
+        assert any("FROM users" in s for s in statements)
+    finally:
+        event.remove(engine, "before_cursor_execute", _record)
+
+
+class _FakeRedis:
+    def __init__(self):
+        self.data = {}
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def set(self, key, value, ex=None):
+        self.data[key] = value
+
+    async def delete(self, key):
+        self.data.pop(key, None)
+
+
+@pytest.mark.asyncio
+async def test_invalidate_user_clears_redis_tier(client: AsyncClient, monkeypatch):
+    redis = _FakeRedis()
+    monkeypatch.setattr(settings, "user_cache_redis", True)
+    monkeypatch.setattr(deps, "_redis", redis)
+    _, headers = await register_and_login(client, "shared@test.com")
+    user_id = (await client.get("/api/v1/auth/me", headers=headers)).json()["id"]
+    assert deps._redis_key(user_id) in redis.data
+
+    await invalidate_user(user_id)
+    assert redis.data == {}
+    assert deps.user_cache.get(user_id) is None
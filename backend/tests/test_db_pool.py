@@ -0,0 +1,70 @@
+"""Connection pool profile and instrumentation tests."""
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import create_engine, exc, text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from applytrack.core.config import settings
+from applytrack.db.pool import (
+    InstrumentedAsyncQueuePool,
+    InstrumentedQueuePool,
+    pool_options,
+    pool_status,
+)
+
+
+def test_pool_options_profiles():
+    api = pool_options("postgresql+asyncpg://u:p@db/app", "api")
+    assert api["poolclass"] is InstrumentedAsyncQueuePool
+    assert api["pool_size"] == settings.db_pool_size
+    assert api["pool_pre_ping"] is settings.db_pool_pre_ping
+
+    worker = pool_options("postgresql+psycopg2://u:p@db/app", "worker")
+    assert worker["poolclass"] is InstrumentedQueuePool
+    assert worker["pool_size"] == settings.worker_db_pool_size
+    assert worker["max_overflow"] == settings.worker_db_max_overflow
+
+    assert pool_options("sqlite+aiosqlite://", "api") == {}
+
+
+def test_pool_status_tracks_checkouts_and_timeouts(tmp_path):
+    url = f"sqlite:///{tmp_path / 'pool.db'}"
+    options = pool_options(url, "worker") | {
+        "pool_size": 1,
+        "max_overflow": 0,
+        "pool_timeout": 0.05,
+    }
+    engine = create_engine(url, **options)
+
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+        status = pool_status(engine.pool)
+        assert status["checked_out"] == 1
+        with pytest.raises(exc.TimeoutError):
+            engine.connect()
+
+    status = pool_status(engine.pool)
+    assert status["checked_out"] == 0
+    assert status["checkouts"] == 2
+    assert status["timeouts"] == 1
+    assert status["wait_max_ms"] >= 50
+    engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_async_pool_status(tmp_path):
+    url = f"sqlite+aiosqlite:///{tmp_path / 'pool.db'}"
+    engine = create_async_engine(url, **pool_options(url, "api"))
+    async with engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
+        assert pool_status(engine.pool)["checked_out"] == 1
+    assert pool_status(engine.pool)["checkouts"] == 1
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_db_pool_endpoint(client: AsyncClient):
+    resp = await client.get("/health/db-pool")
+    assert resp.status_code == 200
+    assert "pool" in resp.json()
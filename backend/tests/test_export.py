@@ -0,0 +1,96 @@
+"""Streaming export endpoint tests."""
+
+import csv
+import io
+import json
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from conftest import register_and_login
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from applytrack.db.models.ai_output import AIOutput, AIOutputKind
+
+
+async def _seed(client: AsyncClient, db_session: AsyncSession) -> tuple[dict, list[str]]:
+    _, headers = await register_and_login(client)
+    ids = []
+    for company, role in (("Acme", "Backend"), ("Globex", "SRE")):
+        resp = await client.post(
+            "/api/v1/applications/",
+            json={
+                "company_name": company,
+                "role_title": role,
+                "job_description": f"{role} at {company}",
+                "status": "applied",
+            },
+            headers=headers,
+        )
+        ids.append(resp.json()["id"])
+
+    now = datetime.now(timezone.utc)
+    for age, score in ((2, 40), (1, 75)):
+        db_session.add(
+            AIOutput(
+                application_id=ids[0],
+                kind=AIOutputKind.match,
+                input_hash="h",
+                output_json={"match_score": score},
+                model="mock",
+                latency_seconds=0.1,
+                created_at=now - timedelta(hours=age),
+            )
+        )
+    await db_session.commit()
+    return headers, ids
+
+
+@pytest.mark.asyncio
+async def test_export_ndjson(client: AsyncClient, db_session: AsyncSession):
+    headers, ids = await _seed(client, db_session)
+    # other users' data never leaks into the export
+    _, other = await register_and_login(client, email="other@test.com")
+    await client.post(
+        "/api/v1/applications/", json={"company_name": "X", "role_title": "Y"}, headers=other
+    )
+
+    resp = await client.get("/api/v1/applications/export", headers=headers)
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("application/x-ndjson")
+    records = [json.loads(line) for line in resp.text.splitlines()]
+
+    assert [r["id"] for r in records] == ids[::-1]
+    globex, acme = records
+    assert acme["company_name"] == "Acme"
+    assert acme["job_description"] == "Backend at Acme"
+    assert acme["status"] == "applied"
+    assert acme["ai_outputs"]["match"]["output"] == {"match_score": 75}
+    assert globex["ai_outputs"] == {}
+
+
+@pytest.mark.asyncio
+async def test_export_csv_round_trips_through_import(client: AsyncClient, db_session: AsyncSession):
+    headers, _ = await _seed(client, db_session)
+
+    resp = await client.get("/api/v1/applications/export?format=csv", headers=headers)
+    assert resp.headers["content-type"].startswith("text/csv")
+    assert "applications.csv" in resp.headers["content-disposition"]
+    rows = list(csv.DictReader(io.StringIO(resp.text)))
+    assert [r["company_name"] for r in rows] == ["Globex", "Acme"]
+    assert json.loads(rows[1]["ai_match"]) == {"match_score": 75}
+    assert rows[0]["ai_match"] == ""
+
+    _, other = await register_and_login(client, email="other@test.com")
+    resp = await client.post("/api/v1/applications/import", content=resp.text, headers=other)
+    assert resp.json()["imported"] == 2
+
+
+@pytest.mark.asyncio
+async def test_export_empty(client: AsyncClient):
+    _, headers = await register_and_login(client)
+    resp = await client.get("/api/v1/applications/export", headers=headers)
+    assert resp.text == ""
+    resp = await client.get("/api/v1/applications/export?format=csv", headers=headers)
+    assert resp.text.startswith("id,company_name,")
+    assert len(resp.text.splitlines()) == 1
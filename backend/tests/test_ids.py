@@ -0,0 +1,49 @@
+"""UUID primary-key type and generator tests."""
+
+import uuid
+
+import pytest
+from conftest import register_and_login
+from httpx import AsyncClient
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from applytrack.core.config import settings
+from applytrack.db.types import new_id, uuid7
+
+
+def test_uuid7_layout_and_order():
+    ids = [uuid7() for _ in range(50)]
+    assert all(u.version == 7 and u.variant == uuid.RFC_4122 for u in ids)
+    # the 48-bit millisecond prefix never goes backwards
+    prefixes = [u.int >> 80 for u in ids]
+    assert prefixes == sorted(prefixes)
+
+
+def test_new_id_version(monkeypatch):
+    assert uuid.UUID(new_id()).version == 4
+    monkeypatch.setattr(settings, "id_uuid_version", 7)
+    assert uuid.UUID(new_id()).version == 7
+
+
+@pytest.mark.asyncio
+async def test_keys_stored_as_16_bytes(client: AsyncClient, db_session: AsyncSession):
+    _, headers = await register_and_login(client)
+    resp = await client.post(
+        "/api/v1/applications/", json={"company_name": "Acme", "role_title": "Dev"}, headers=headers
+    )
+    app_id = resp.json()["id"]
+
+    row = (
+        await db_session.execute(
+            text("SELECT typeof(id), length(id), length(user_id) FROM applications")
+        )
+    ).one()
+    assert tuple(row) == ("blob", 16, 16)
+
+    resp = await client.get(f"/api/v1/applications/{app_id}", headers=headers)
+    assert resp.json()["id"] == app_id
+    resp = await client.get(f"/api/v1/applications/{app_id.upper()}", headers=headers)
+    assert resp.json()["id"] == app_id
+    resp = await client.get("/api/v1/applications/not-a-uuid", headers=headers)
+    assert resp.status_code == 404
@@ -0,0 +1,113 @@
+"""Bulk import endpoint and importer tests."""
+
+import json
+
+import pytest
+from conftest import register_and_login
+from httpx import AsyncClient
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from applytrack.db.models.company import Company
+from applytrack.services.importer import (
+    ApplicationImporter,
+    ImportFormat,
+    iter_lines,
+    iter_records,
+)
+
+CSV = (
+    "company_name,role_title,status,priority,job_description,notes\r\n"
+    "Acme Corp,Backend Engineer,applied,high,Python,\r\n"
+    'Globex,SRE,interview,,"Multi-line\r\ndescription with ""quotes""",Referral\r\n'
+    "  ACME corp ,Platform Engineer,,,,\r\n"
+    ",Missing Company,applied,,,\r\n"
+    "Initech,QA,bogus,,,\r\n"
+)
+
+
+async def _stream(data: bytes, chunk_size: int = 7):
+    for i in range(0, len(data), chunk_size):
+        yield data[i : i + chunk_size]
+
+
+@pytest.mark.asyncio
+async def test_import_csv(client: AsyncClient, db_session: AsyncSession):
+    _, headers = await register_and_login(client)
+    await client.post(
+        "/api/v1/applications/",
+        json={"company_name": "Acme Corp", "role_title": "Existing"},
+        headers=headers,
+    )
+
+    resp = await client.post(
+        "/api/v1/applications/import", content=_stream(CSV.encode()), headers=headers
+    )
+    assert resp.status_code == 200, resp.text
+    result = resp.json()
+    assert result["processed"] == 5
+    assert result["imported"] == 3
+    assert result["companies_created"] == 1  # Globex; "  ACME corp " matches the existing Acme Corp
+    assert [e["row"] for e in result["errors"]] == [4, 5]
+    assert "company_name" in result["errors"][0]["error"]
+    assert "status" in result["errors"][1]["error"]
+
+    count = await db_session.scalar(select(func.count()).select_from(Company))
+    assert count == 2
+
+    resp = await client.get("/api/v1/applications/?search=SRE", headers=headers)
+    (globex,) = resp.json()["items"]
+    assert globex["status"] == "interview"
+    assert globex["priority"] == "medium"
+    detail = await client.get(f"/api/v1/applications/{globex['id']}", headers=headers)
+    assert detail.json()["job_posting"]["description_raw"] == (
+        'Multi-line\ndescription with "quotes"'
+    )
+    assert detail.json()["notes"] == "Referral"
+
+
+@pytest.mark.asyncio
+async def test_import_jsonl(client: AsyncClient):
+    _, headers = await register_and_login(client)
+    body = "\n".join(
+        [
+            json.dumps({"company_name": "Acme", "role_title": "Dev", "job_url": None}),
+            "{not json",
+            json.dumps(["not", "an", "object"]),
+            "",
+            json.dumps({"company_name": "Acme", "role_title": "Lead", "status": "offer"}),
+        ]
+    )
+    resp = await client.post(
+        "/api/v1/applications/import?format=jsonl", content=body, headers=headers
+    )
+    result = resp.json()
+    assert (result["imported"], result["failed"], result["companies_created"]) == (2, 2, 1)
+    assert [e["row"] for e in result["errors"]] == [2, 3]
+
+    resp = await client.get("/api/v1/stats/", headers=headers)
+    assert resp.json()["total"] == 2
+
+
+@pytest.mark.asyncio
+async def test_importer_flushes_in_batches(client: AsyncClient, db_session: AsyncSession):
+    _, headers = await register_and_login(client)
+    user_id = (await client.get("/api/v1/auth/me", headers=headers)).json()["id"]
+    lines = ["company_name,role_title"] + [f"Company {i % 3},Role {i}" for i in range(7)]
+
+    progress = []
+    importer = ApplicationImporter(
+        db_session, user_id, batch_size=3, on_progress=lambda r: progress.append(r.imported)
+    )
+    records = iter_records(iter_lines(_stream("\n".join(lines).encode())), ImportFormat.csv)
+    result = await importer.run(records)
+
+    assert progress == [3, 6, 7]
+    assert result.imported == 7
+    assert result.companies_created == 3
+
+
+@pytest.mark.asyncio
+async def test_import_requires_auth(client: AsyncClient):
+    resp = await client.post("/api/v1/applications/import", content=CSV)
+    assert resp.status_code == 401
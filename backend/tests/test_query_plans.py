@@ -0,0 +1,173 @@
+"""Query-plan regression tests.
+
+Every SQL statement issued by the hot read endpoints is captured and run
+through ``EXPLAIN QUERY PLAN``.  A full scan of a user-scoped table or a
+temp B-tree sort means an index no longer matches the query shape.
+"""
+
+import os
+import re
+from contextlib import contextmanager
+
+import pytest
+from conftest import register_and_login
+from httpx import AsyncClient
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from applytrack.db.base import Base
+from applytrack.db.models.application import Application
+from applytrack.db.search import apply_search
+from applytrack.services.ai import stream
+
+HOT_TABLES = ("applications", "reminders", "ai_outputs", "activity_events")
+FULL_SCAN = re.compile(rf"^SCAN ({'|'.join(HOT_TABLES)})\b(?! USING (COVERING )?INDEX)")
+# any temp B-tree sort, including SQLite's partial "FOR RIGHT PART OF ORDER BY";
+# GROUP BY is exempt: /stats buckets by a computed week no index can serve
+FILESORT = re.compile(r"USE TEMP B-TREE FOR (?!GROUP BY)")
+
+
+@contextmanager
+def _capture_sql(db_session: AsyncSession):
+    statements = []
+    engine = db_session.get_bind()
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", _record)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", _record)
+
+
+async def _assert_plans_use_indexes(db_session: AsyncSession, statements):
+    assert statements, "no SQL captured"
+    conn = await db_session.connection()
+    for statement, parameters in statements:
+        if not any(t in statement for t in HOT_TABLES):
+            continue
+        result = await conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters)
+        details = [row[-1] for row in result.all()]
+        for detail in details:
+            assert not FULL_SCAN.search(detail), f"full scan in {details} for {statement}"
+            assert not FILESORT.search(detail), f"sort in {details} for {statement}"
+
+
+async def _seed(client: AsyncClient) -> tuple[dict, str]:
+    _, headers = await register_and_login(client)
+    resp = await client.post(
+        "/api/v1/applications/",
+        json={"company_name": "Acme", "role_title": "Dev", "status": "applied"},
+        headers=headers,
+    )
+    app_id = resp.json()["id"]
+    await client.post(
+        f"/api/v1/applications/{app_id}/reminders",
+        json={"text": "Follow up", "due_at": "2026-03-01T10:00:00Z"},
+        headers=headers,
+    )
+    return headers, app_id
+
+
+@pytest.mark.asyncio
+async def test_application_list_plans(client: AsyncClient, db_session: AsyncSession):
+    headers, _ = await _seed(client)
+    await client.post(
+        "/api/v1/applications/",
+        json={"company_name": "Globex", "role_title": "SRE"},
+        headers=headers,
+    )
+    first = await client.get("/api/v1/applications/?limit=1", headers=headers)
+    cursor = first.json()["next_cursor"]
+
+    with _capture_sql(db_session) as statements:
+        await client.get("/api/v1/applications/", headers=headers)
+        await client.get("/api/v1/applications/?status=applied", headers=headers)
+        await client.get("/api/v1/applications/", params={"cursor": cursor}, headers=headers)
+        await client.get("/api/v1/applications/board", headers=headers)
+        await client.get("/api/v1/applications/?search=acme", headers=headers)
+        await client.get("/api/v1/applications/?search=de", headers=headers)
+        await client.get("/api/v1/applications/board?search=de", headers=headers)
+    await _assert_plans_use_indexes(db_session, statements)
+
+
+@pytest.mark.asyncio
+async def test_reminder_list_plans(client: AsyncClient, db_session: AsyncSession):
+    headers, app_id = await _seed(client)
+    with _capture_sql(db_session) as statements:
+        await client.get("/api/v1/reminders", headers=headers)
+        await client.get("/api/v1/reminders?done=false", headers=headers)
+        await client.get("/api/v1/reminders?done=false&limit=5", headers=headers)
+        await client.get("/api/v1/stats/", headers=headers)
+        await client.get(f"/api/v1/applications/{app_id}/reminders?done=false", headers=headers)
+        await client.get(f"/api/v1/applications/{app_id}/reminders?limit=200", headers=headers)
+    await _assert_plans_use_indexes(db_session, statements)
+
+
+@pytest.mark.asyncio
+async def test_ai_output_list_plans(client: AsyncClient, db_session: AsyncSession):
+    headers, app_id = await _seed(client)
+    with _capture_sql(db_session) as statements:
+        await client.get(f"/api/v1/applications/{app_id}/ai-outputs", headers=headers)
+    await _assert_plans_use_indexes(db_session, statements)
+
+
+@pytest.mark.asyncio
+async def test_timeline_plans(client: AsyncClient, db_session: AsyncSession):
+    headers, app_id = await _seed(client)
+    url = f"/api/v1/applications/{app_id}"
+    await client.patch(url, json={"status": "interview"}, headers=headers)
+    first = await client.get(f"{url}/timeline?limit=1", headers=headers)
+    cursor = first.json()["next_cursor"]
+
+    with _capture_sql(db_session) as statements:
+        await client.get(f"{url}/timeline", headers=headers)
+        await client.get(f"{url}/timeline", params={"cursor": cursor}, headers=headers)
+    await _assert_plans_use_indexes(db_session, statements)
+
+
+@pytest.mark.asyncio
+async def test_ai_stream_ownership_plan(client: AsyncClient, db_session: AsyncSession, monkeypatch):
+    monkeypatch.setattr(stream, "IDLE_SECONDS", 0.01)
+    headers, app_id = await _seed(client)
+    resp = await client.post(f"/api/v1/ai/parse-jd/{app_id}?stream=true", headers=headers)
+    task_id = resp.json()["task_id"]
+
+    with _capture_sql(db_session) as statements:
+        resp = await client.get(f"/api/v1/ai/tasks/{task_id}/stream", headers=headers)
+    assert resp.status_code == 200
+    await _assert_plans_use_indexes(db_session, statements)
+
+    # without the task_id index the lookup walks every event of the user's
+    # applications, which is no full scan but grows with their history
+    statement, parameters = next(s for s in statements if "activity_events" in s[0])
+    conn = await db_session.connection()
+    result = await conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters)
+    details = [row[-1] for row in result.all()]
+    assert any("ix_activity_events_task_id" in d for d in details), details
+
+
+@pytest.mark.asyncio
+@pytest.mark.skipif(not os.environ.get("TEST_POSTGRES_URL"), reason="TEST_POSTGRES_URL is not set")
+async def test_postgres_search_uses_trigram_indexes():
+    engine = create_async_engine(os.environ["TEST_POSTGRES_URL"])
+    stmt = apply_search(select(Application.id), "engineer", "postgresql")
+    sql = stmt.compile(dialect=engine.dialect, compile_kwargs={"literal_binds": True})
+    try:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.drop_all)
+            await conn.run_sync(Base.metadata.create_all)
+            # the tables are empty: forbid seq scans so the plan shows which
+            # indexes the query shape can use at all
+            await conn.exec_driver_sql("SET LOCAL enable_seqscan = off")
+            result = await conn.exec_driver_sql(f"EXPLAIN {sql}")
+            plan = "\n".join(row[0] for row in result.all())
+            await conn.run_sync(Base.metadata.drop_all)
+    finally:
+        await engine.dispose()
+
+    assert "ix_job_postings_title_trgm" in plan, plan
+    assert "ix_companies_name_trgm" in plan, plan
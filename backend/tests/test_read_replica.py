@@ -0,0 +1,92 @@
+"""Read-replica routing tests.
+
+The "replica" is a second, empty in-memory database, so a read that returns
+the user's data must have gone to the primary.  Write markers go to a fake
+Redis; clearing ``recent_writes`` alone plays a request served by another API
+worker.
+"""
+
+import pytest
+import pytest_asyncio
+from conftest import register_and_login
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from applytrack.api import deps
+from applytrack.db.base import Base
+
+
+class _FakeRedis:
+    def __init__(self):
+        self.data = {}
+
+    async def set(self, key, value, px=None):
+        self.data[key] = value
+
+    async def exists(self, key):
+        return int(key in self.data)
+
+
+@pytest_asyncio.fixture
+async def markers(monkeypatch):
+    redis = _FakeRedis()
+    monkeypatch.setattr(deps, "_redis", redis)
+    return redis
+
+
+def _forget_writes(markers: _FakeRedis) -> None:
+    deps.recent_writes.clear()
+    markers.data.clear()
+
+
+@pytest_asyncio.fixture
+async def replica(monkeypatch, markers):
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    monkeypatch.setattr(deps, "read_engine", engine)
+    monkeypatch.setattr(deps, "ReadSessionLocal", async_sessionmaker(engine, class_=AsyncSession))
+    yield engine
+    deps.recent_writes.clear()
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_reads_use_replica_outside_write_window(client: AsyncClient, replica, markers):
+    _, headers = await register_and_login(client)
+    await client.post(
+        "/api/v1/applications/", json={"company_name": "Acme", "role_title": "Dev"}, headers=headers
+    )
+
+    # right after the write, reads stick to the primary
+    resp = await client.get("/api/v1/applications/", headers=headers)
+    assert len(resp.json()["items"]) == 1
+    resp = await client.get("/api/v1/companies/", headers=headers)
+    assert len(resp.json()) == 1
+
+    # another worker only has the shared marker
+    deps.recent_writes.clear()
+    resp = await client.get("/api/v1/applications/", headers=headers)
+    assert len(resp.json()["items"]) == 1
+
+    _forget_writes(markers)
+    resp = await client.get("/api/v1/applications/", headers=headers)
+    assert resp.json()["items"] == []
+    resp = await client.get("/api/v1/profile/", headers=headers)
+    assert resp.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_bulk_update_opens_write_window(client: AsyncClient, replica, markers):
+    _, headers = await register_and_login(client)
+    resp = await client.post(
+        "/api/v1/applications/", json={"company_name": "Acme", "role_title": "Dev"}, headers=headers
+    )
+    app_id = resp.json()["id"]
+    _forget_writes(markers)
+
+    await client.patch(
+        "/api/v1/applications/", json=[{"id": app_id, "status": "offer"}], headers=headers
+    )
+    resp = await client.get(f"/api/v1/applications/{app_id}", headers=headers)
+    assert resp.json()["status"] == "offer"
@@ -77,6 +77,19 @@ async def test_list_reminders_filter_done(client: AsyncClient):
     assert len(resp.json()) == 1
 
 
+@pytest.mark.asyncio
+async def test_list_reminders_limit(client: AsyncClient):
+    headers, app_id = await _create_app_with_reminder_setup(client)
+    for day in (3, 1, 2):
+        await client.post(
+            f"/api/v1/applications/{app_id}/reminders",
+            json={"text": f"Day {day}", "due_at": f"2026-03-0{day}T10:00:00Z"},
+            headers=headers,
+        )
+    resp = await client.get("/api/v1/reminders?done=false&limit=2", headers=headers)
+    assert [r["text"] for r in resp.json()] == ["Day 1", "Day 2"]
+
+
 @pytest.mark.asyncio
 async def test_update_reminder(client: AsyncClient):
     headers, app_id = await _create_app_with_reminder_setup(client)
@@ -106,3 +119,67 @@ async def test_reminder_not_found(client: AsyncClient):
         headers=headers,
     )
     assert resp.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_list_application_reminders(client: AsyncClient):
+    headers, app_id = await _create_app_with_reminder_setup(client)
+    resp = await client.post(
+        "/api/v1/applications/",
+        json={"company_name": "Other", "role_title": "Dev"},
+        headers=headers,
+    )
+    other_id = resp.json()["id"]
+    await client.post(
+        f"/api/v1/applications/{other_id}/reminders",
+        json={"text": "Elsewhere", "due_at": "2026-03-01T09:00:00Z"},
+        headers=headers,
+    )
+    ids = []
+    for day in (3, 1, 2, 4):
+        resp = await client.post(
+            f"/api/v1/applications/{app_id}/reminders",
+            json={"text": f"Day {day}", "due_at": f"2026-03-0{day}T10:00:00Z"},
+            headers=headers,
+        )
+        ids.append(resp.json()["id"])
+    await client.patch(f"/api/v1/reminders/{ids[3]}", json={"done": True}, headers=headers)
+
+    url = f"/api/v1/applications/{app_id}/reminders"
+    resp = await client.get(url, headers=headers)
+    assert [r["text"] for r in resp.json()["items"]] == ["Day 1", "Day 2", "Day 3", "Day 4"]
+
+    resp = await client.get(url, params={"done": False}, headers=headers)
+    assert [r["text"] for r in resp.json()["items"]] == ["Day 1", "Day 2", "Day 3"]
+
+    resp = await client.get(
+        url,
+        params={"due_after": "2026-03-02T10:00:00Z", "due_before": "2026-03-04T00:00:00Z"},
+        headers=headers,
+    )
+    assert [r["text"] for r in resp.json()["items"]] == ["Day 2", "Day 3"]
+
+    # keyset pagination
+    seen = []
+    cursor = None
+    while True:
+        params = {"limit": 3, **({"cursor": cursor} if cursor else {})}
+        page = (await client.get(url, params=params, headers=headers)).json()
+        seen += [r["text"] for r in page["items"]]
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+    assert seen == ["Day 1", "Day 2", "Day 3", "Day 4"]
+
+
+@pytest.mark.asyncio
+async def test_list_application_reminders_not_found(client: AsyncClient):
+    headers, _ = await _create_app_with_reminder_setup(client)
+    _, other_headers = await register_and_login(client, email="other@test.com")
+    resp = await client.post(
+        "/api/v1/applications/",
+        json={"company_name": "Acme", "role_title": "Dev"},
+        headers=other_headers,
+    )
+    resp = await client.get(f"/api/v1/applications/{resp.json()['id']}/reminders", headers=headers)
+    assert resp.status_code == 404
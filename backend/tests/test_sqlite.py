@@ -0,0 +1,45 @@
+"""SQLite connection profile tests."""
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from applytrack.core.config import settings
+from applytrack.db.sqlite import configure_sqlite
+
+
+async def _pragmas(conn) -> tuple:
+    values = []
+    for name in ("journal_mode", "busy_timeout", "synchronous", "cache_size"):
+        values.append((await conn.execute(text(f"PRAGMA {name}"))).scalar())
+    return tuple(values)
+
+
+@pytest.mark.asyncio
+async def test_file_database_gets_profile(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'app.db'}")
+    configure_sqlite(engine.sync_engine)
+    async with engine.connect() as conn:
+        journal, busy, synchronous, cache = await _pragmas(conn)
+    await engine.dispose()
+    assert journal == "wal"
+    assert busy == settings.sqlite_busy_timeout_ms
+    assert synchronous == 1  # NORMAL
+    assert cache == -settings.sqlite_cache_size_mb * 1024
+
+    # the worker's sync engine on the same file
+    sync_engine = create_engine(f"sqlite:///{tmp_path / 'app.db'}")
+    configure_sqlite(sync_engine)
+    with sync_engine.connect() as conn:
+        assert conn.execute(text("PRAGMA synchronous")).scalar() == 1
+    sync_engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_memory_database_untouched():
+    engine = create_async_engine("sqlite+aiosqlite://")
+    configure_sqlite(engine.sync_engine)
+    async with engine.connect() as conn:
+        journal, *_ = await _pragmas(conn)
+    await engine.dispose()
+    assert journal == "memory"
@@ -0,0 +1,54 @@
+"""Startup cost tests: import-time footprint and the schema revision check."""
+
+import os
+import subprocess
+import sys
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from applytrack.db.revision import check_schema_revision, head_revisions
+
+# loaded on first use (AI requests, the Redis user-cache tier, DB_STARTUP=check)
+DEFERRED = ("openai", "celery", "kombu", "redis", "alembic", "applytrack.workers")
+
+
+def _imported_modules(module: str) -> dict[str, int]:
+    """Run ``python -X importtime`` and return {module: cumulative microseconds}."""
+    env = os.environ | {"DATABASE_URL": "sqlite+aiosqlite://"}
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+    modules = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.removeprefix("import time:").split("|")
+        modules[name.strip()] = int(cumulative)
+    return modules
+
+
+def test_api_import_defers_worker_stack():
+    modules = _imported_modules("applytrack.main")
+    assert "applytrack.main" in modules
+    loaded = [m for m in modules if any(m == d or m.startswith(f"{d}.") for d in DEFERRED)]
+    assert loaded == []
+
+
+@pytest.mark.asyncio
+async def test_check_schema_revision(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'app.db'}")
+    with pytest.raises(RuntimeError, match="alembic upgrade head"):
+        await check_schema_revision(engine)
+
+    async with engine.begin() as conn:
+        await conn.execute(text("CREATE TABLE alembic_version (version_num VARCHAR(32))"))
+        for rev in head_revisions():
+            await conn.execute(text("INSERT INTO alembic_version VALUES (:rev)"), {"rev": rev})
+    await check_schema_revision(engine)
+    await engine.dispose()
@@ -0,0 +1,89 @@
+"""Dashboard stats endpoint tests."""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from conftest import register_and_login
+from httpx import AsyncClient
+
+from applytrack.api.stats import stats_cache
+
+
+async def _create_app(client: AsyncClient, headers: dict, status: str) -> str:
+    resp = await client.post(
+        "/api/v1/applications/",
+        json={"company_name": f"Co {status}", "role_title": "Dev", "status": status},
+        headers=headers,
+    )
+    return resp.json()["id"]
+
+
+@pytest.mark.asyncio
+async def test_stats_aggregates(client: AsyncClient):
+    _, headers = await register_and_login(client)
+    for status in ("applied", "applied", "interview", "rejected", "not_applied"):
+        app_id = await _create_app(client, headers, status)
+
+    now = datetime.now(timezone.utc)
+    for due in (now - timedelta(days=1), now + timedelta(days=2)):
+        await client.post(
+            f"/api/v1/applications/{app_id}/reminders",
+            json={"text": "r", "due_at": due.isoformat()},
+            headers=headers,
+        )
+    await client.post(
+        f"/api/v1/applications/{app_id}/reminders",
+        json={"text": "later", "due_at": (now + timedelta(days=30)).isoformat()},
+        headers=headers,
+    )
+
+    resp = await client.get("/api/v1/stats/?weeks=4", headers=headers)
+    assert resp.status_code == 200
+    data = resp.json()
+
+    assert data["total"] == 5
+    assert data["status_counts"]["applied"] == 2
+    assert data["status_counts"]["offer"] == 0
+    # 2 of 4 submitted applications got an answer
+    assert data["response_rate"] == 0.5
+
+    weeks = data["applications_per_week"]
+    assert len(weeks) == 4
+    this_monday = now.date() - timedelta(days=now.weekday())
+    assert weeks[-1] == {"week_start": this_monday.isoformat(), "count": 5}
+    assert sum(w["count"] for w in weeks) == 5
+
+    assert data["reminders"] == {"open": 3, "overdue": 1, "due_next_7_days": 1}
+
+
+@pytest.mark.asyncio
+async def test_stats_empty(client: AsyncClient):
+    _, headers = await register_and_login(client)
+    resp = await client.get("/api/v1/stats/", headers=headers)
+    data = resp.json()
+    assert data["total"] == 0
+    assert data["response_rate"] == 0.0
+    assert len(data["applications_per_week"]) == 12
+
+
+@pytest.mark.asyncio
+async def test_stats_cache_invalidated_on_write(client: AsyncClient, monkeypatch):
+    monkeypatch.setattr(stats_cache, "ttl", 60)
+    stats_cache.clear()
+    _, headers = await register_and_login(client)
+
+    await _create_app(client, headers, "applied")
+    assert (await client.get("/api/v1/stats/", headers=headers)).json()["total"] == 1
+    assert len(stats_cache) == 1
+
+    await _create_app(client, headers, "offer")
+    data = (await client.get("/api/v1/stats/", headers=headers)).json()
+    assert data["total"] == 2
+    assert data["status_counts"]["offer"] == 1
+    stats_cache.clear()
+
+
+@pytest.mark.asyncio
+async def test_stats_requires_auth(client: AsyncClient):
+    resp = await client.get("/api/v1/stats/")
+    assert resp.status_code == 401
@@ -1,12 +1,12 @@
 'use client';
 
-import { Application, AIOutput, Reminder, STATUS_META, ApplicationStatus } from '@/lib/types';
-import { api, pollTaskUntilDone } from '@/lib/api';
+import { Application, AIOutput, Reminder, ReminderPage, STATUS_META, ApplicationStatus } from '@/lib/types';
+import { api, pollTaskUntilDone, streamTask } from '@/lib/api';
 import { useQuery, useMutation, useQueryClient } from '@tanstack/react-query';
 import { useParams, useSearchParams } from 'next/navigation';
 import { useState } from 'react';
 import Link from 'next/link';
-import { AIOutputDisplay } from '@/components/AIOutputDisplay';
+import { AIOutputDisplay, withPartialDefaults } from '@/components/AIOutputDisplay';
 import {
   ArrowLeft,
   ExternalLink,
@@ -40,6 +40,9 @@ export default function ApplicationDetailPage() {
 
   const [activeTab, setActiveTab] = useState<TabKey>(isNew ? 'ai' : 'overview');
   const [runningKind, setRunningKind] = useState<string | null>(null);
+  const [partialOutput, setPartialOutput] = useState<{ kind: string; output_json: Record<string, unknown> } | null>(
+    null,
+  );
   const [notesValue, setNotesValue] = useState<string | null>(null);
   const [notesSaved, setNotesSaved] = useState(false);
 
@@ -61,14 +64,14 @@ export default function ApplicationDetailPage() {
     enabled: !!id,
   });
 
-  const { data: reminders = [], refetch: refetchReminders } = useQuery<Reminder[]>({
-    queryKey: ['reminders', id],
-    queryFn: async () => {
-      const all: Reminder[] = (await api.get('/reminders')).data;
-      return all.filter((r) => r.application_id === id);
-    },
+  const remindersKey = ['reminders', id];
+  const { data: reminderPage, refetch: refetchReminders } = useQuery<ReminderPage>({
+    queryKey: remindersKey,
+    queryFn: async () => (await api.get(`/applications/${id}/reminders`)).data,
     enabled: !!id,
   });
+  const reminders: Reminder[] = reminderPage?.items ?? [];
+  const moreReminders = !!reminderPage?.next_cursor;
 
   // — mutations —
   const saveNotesMutation = useMutation({
@@ -101,18 +104,40 @@ export default function ApplicationDetailPage() {
     onSuccess: () => refetchReminders(),
   });
 
+  // "load more" continues the list from its keyset cursor, as the board does
+  const loadMoreRemindersMutation = useMutation({
+    mutationFn: async (cursor: string) =>
+      (await api.get(`/applications/${id}/reminders`, { params: { cursor } })).data as ReminderPage,
+    onSuccess: (page) => {
+      queryClient.setQueryData<ReminderPage>(remindersKey, (old) =>
+        old && { items: [...old.items, ...page.items], next_cursor: page.next_cursor },
+      );
+    },
+  });
+
   // — AI runner —
   const handleRunAI = async (kind: string) => {
     setRunningKind(kind);
     try {
-      const res = await api.post(`/ai/${kind}/${id}`);
+      const res = await api.post(`/ai/${kind}/${id}`, null, { params: { stream: true } });
       const taskId = res.data.task_id;
-      await pollTaskUntilDone(taskId);
+      const outputKind = kind.replace(/-/g, '_');
+      try {
+        const outcome = await streamTask(taskId, (partial) =>
+          setPartialOutput({ kind: outputKind, output_json: withPartialDefaults(outputKind, partial) }),
+        );
+        // the stream gave up before the task finished
+        if (outcome.status === 'TIMEOUT') await pollTaskUntilDone(taskId);
+      } catch (e) {
+        console.warn('AI stream unavailable, polling instead', e);
+        await pollTaskUntilDone(taskId);
+      }
       refetchAI();
     } catch (e) {
       console.error(e);
     } finally {
       setRunningKind(null);
+      setPartialOutput(null);
     }
   };
 
@@ -135,7 +160,7 @@ export default function ApplicationDetailPage() {
     { key: 'overview', label: 'Overview' },
     { key: 'notes', label: 'Notes' },
     { key: 'ai', label: 'AI Outputs' },
-    { key: 'reminders', label: `Reminders (${reminders.length})` },
+    { key: 'reminders', label: `Reminders (${reminders.length}${moreReminders ? '+' : ''})` },
   ];
 
   return (
@@ -274,6 +299,13 @@ export default function ApplicationDetailPage() {
                 </div>
               )}
 
+              {/* streamed output so far */}
+              {partialOutput && (
+                <div className="border border-dashed border-indigo-200 rounded-xl p-4 bg-white opacity-80">
+                  <AIOutputDisplay output={partialOutput} />
+                </div>
+              )}
+
               {/* outputs */}
               <div className="space-y-4">
                 {aiOutputs.map((output) => (
@@ -383,6 +415,15 @@ export default function ApplicationDetailPage() {
                     </div>
                   </div>
                 ))}
+                {moreReminders && (
+                  <button
+                    onClick={() => loadMoreRemindersMutation.mutate(reminderPage!.next_cursor!)}
+                    disabled={loadMoreRemindersMutation.isPending}
+                    className="w-full rounded-lg py-1.5 text-xs text-[var(--fg-muted)] hover:bg-slate-100 transition-colors disabled:opacity-50"
+                  >
+                    {loadMoreRemindersMutation.isPending ? 'Loading…' : 'Load more'}
+                  </button>
+                )}
                 {reminders.length === 0 && (
                   <p className="text-sm text-[var(--fg-muted)] italic text-center py-8">No reminders set.</p>
                 )}
@@ -5,7 +5,14 @@ import { useQuery, useMutation, useQueryClient } from '@tanstack/react-query';
 import { api } from '@/lib/api';
 import KanbanColumn from '@/components/KanbanColumn';
 import NewApplicationModal from '@/components/NewApplicationModal';
-import { Application, KANBAN_COLUMNS, STATUS_META, ApplicationStatus } from '@/lib/types';
+import {
+  ApplicationPage,
+  ApplicationStatus,
+  BoardColumn,
+  BoardResponse,
+  KANBAN_COLUMNS,
+  STATUS_META,
+} from '@/lib/types';
 import {
   DndContext,
   DragEndEvent,
@@ -25,29 +32,70 @@ export default function ApplicationsPage() {
   const [activeId, setActiveId] = useState<string | null>(null);
   const [search, setSearch] = useState('');
 
-  const { data: applications = [], isLoading } = useQuery<Application[]>({
-    queryKey: ['applications'],
-    queryFn: async () => (await api.get('/applications')).data,
+  const boardKey = ['applications', 'board', search];
+
+  const { data: board, isLoading } = useQuery<BoardResponse>({
+    queryKey: boardKey,
+    queryFn: async () =>
+      (await api.get('/applications/board', { params: { search: search || undefined } })).data,
   });
 
+  const columns = board?.columns ?? [];
+  const applications = columns.flatMap((c) => c.items);
+
   const updateStatusMutation = useMutation({
     mutationFn: async ({ id, status }: { id: string; status: string }) => {
       await api.patch(`/applications/${id}`, { status });
     },
     onMutate: async ({ id, status }) => {
-      await queryClient.cancelQueries({ queryKey: ['applications'] });
-      const prev = queryClient.getQueryData<Application[]>(['applications']);
-      queryClient.setQueryData<Application[]>(['applications'], (old) =>
-        old?.map((a) => (a.id === id ? { ...a, status: status as ApplicationStatus } : a)) || [],
-      );
+      await queryClient.cancelQueries({ queryKey: boardKey });
+      const prev = queryClient.getQueryData<BoardResponse>(boardKey);
+      queryClient.setQueryData<BoardResponse>(boardKey, (old) => {
+        if (!old) return old;
+        const moved = old.columns.flatMap((c) => c.items).find((a) => a.id === id);
+        if (!moved) return old;
+        return {
+          columns: old.columns.map((c) => {
+            if (c.status === moved.status) {
+              return { ...c, count: c.count - 1, items: c.items.filter((a) => a.id !== id) };
+            }
+            if (c.status === status) {
+              const card = { ...moved, status: status as ApplicationStatus };
+              return { ...c, count: c.count + 1, items: [card, ...c.items] };
+            }
+            return c;
+          }),
+        };
+      });
       return { prev };
     },
     onError: (_err, _vars, ctx) => {
-      if (ctx?.prev) queryClient.setQueryData(['applications'], ctx.prev);
+      if (ctx?.prev) queryClient.setQueryData(boardKey, ctx.prev);
     },
     onSettled: () => queryClient.invalidateQueries({ queryKey: ['applications'] }),
   });
 
+  // "load more" continues one column from its keyset cursor
+  const loadMoreMutation = useMutation({
+    mutationFn: async (column: BoardColumn) =>
+      (
+        await api.get('/applications', {
+          params: { status: column.status, cursor: column.next_cursor, search: search || undefined },
+        })
+      ).data as ApplicationPage,
+    onSuccess: (page, column) => {
+      queryClient.setQueryData<BoardResponse>(boardKey, (old) =>
+        old && {
+          columns: old.columns.map((c) =>
+            c.status === column.status
+              ? { ...c, items: [...c.items, ...page.items], next_cursor: page.next_cursor }
+              : c,
+          ),
+        },
+      );
+    },
+  });
+
   const sensors = useSensors(
     useSensor(PointerSensor, { activationConstraint: { distance: 5 } }),
   );
@@ -77,17 +125,6 @@ export default function ApplicationsPage() {
     }
   };
 
-  // filter by search
-  const filtered = search
-    ? applications.filter((a) => {
-      const q = search.toLowerCase();
-      return (
-        (a.job_posting?.title || '').toLowerCase().includes(q) ||
-        (a.job_posting?.company?.name || '').toLowerCase().includes(q)
-      );
-    })
-    : applications;
-
   const activeApp = activeId ? applications.find((a) => a.id === activeId) : null;
 
   if (isLoading) {
@@ -130,14 +167,21 @@ export default function ApplicationsPage() {
         onDragEnd={handleDragEnd}
       >
         <div className="flex gap-4 overflow-x-auto pb-4 flex-1 items-start">
-          {KANBAN_COLUMNS.map((col) => (
-            <KanbanColumn
-              key={col}
-              id={col}
-              title={STATUS_META[col].label}
-              applications={filtered.filter((a) => a.status === col)}
-            />
-          ))}
+          {KANBAN_COLUMNS.map((col) => {
+            const column = columns.find((c) => c.status === col);
+            return (
+              <KanbanColumn
+                key={col}
+                id={col}
+                title={STATUS_META[col].label}
+                applications={column?.items ?? []}
+                count={column?.count ?? 0}
+                hasMore={!!column?.next_cursor}
+                loadingMore={loadMoreMutation.isPending && loadMoreMutation.variables?.status === col}
+                onLoadMore={() => column && loadMoreMutation.mutate(column)}
+              />
+            );
+          })}
         </div>
         <DragOverlay>{activeApp ? <ApplicationCard application={activeApp} /> : null}</DragOverlay>
       </DndContext>
@@ -5,7 +5,7 @@ import { useRouter } from 'next/navigation';
 import { useEffect } from 'react';
 import { useQuery } from '@tanstack/react-query';
 import { api } from '@/lib/api';
-import { Application, Reminder, STATUS_META, ApplicationStatus } from '@/lib/types';
+import { ApplicationPage, Reminder, STATUS_META, ApplicationStatus, Stats } from '@/lib/types';
 import Link from 'next/link';
 import { Briefcase, CheckCircle, MessageSquare, Trophy, Clock, ArrowRight } from 'lucide-react';
 
@@ -14,29 +14,41 @@ const STAT_CARDS: {
   label: string;
   icon: typeof Briefcase;
   color: string;
-  filter: (a: Application) => boolean;
+  value: (s: Stats) => number;
 }[] = [
-    { key: 'total', label: 'Total', icon: Briefcase, color: 'border-indigo-400', filter: () => true },
-    { key: 'applied', label: 'Applied', icon: CheckCircle, color: 'border-blue-400', filter: (a) => a.status === 'applied' },
-    { key: 'interview', label: 'Interviewing', icon: MessageSquare, color: 'border-violet-400', filter: (a) => a.status === 'interview' },
-    { key: 'offer', label: 'Offers', icon: Trophy, color: 'border-emerald-400', filter: (a) => a.status === 'offer' },
+    { key: 'total', label: 'Total', icon: Briefcase, color: 'border-indigo-400', value: (s) => s.total },
+    { key: 'applied', label: 'Applied', icon: CheckCircle, color: 'border-blue-400', value: (s) => s.status_counts.applied },
+    { key: 'interview', label: 'Interviewing', icon: MessageSquare, color: 'border-violet-400', value: (s) => s.status_counts.interview },
+    { key: 'offer', label: 'Offers', icon: Trophy, color: 'border-emerald-400', value: (s) => s.status_counts.offer },
   ];
 
+const REMINDER_PREVIEW = 5;
+
 export default function Dashboard() {
   const { user, loading } = useAuth();
   const router = useRouter();
 
-  const { data: applications = [] } = useQuery<Application[]>({
-    queryKey: ['applications'],
-    queryFn: async () => (await api.get('/applications')).data,
+  const { data: stats } = useQuery<Stats>({
+    queryKey: ['stats'],
+    queryFn: async () => (await api.get('/stats')).data,
     enabled: !!user,
   });
 
+  const { data: applications = [] } = useQuery({
+    queryKey: ['applications', 'recent'],
+    queryFn: async () =>
+      ((await api.get('/applications', { params: { limit: 6 } })).data as ApplicationPage).items,
+    enabled: !!user,
+  });
+
+  // the soonest few only; /stats carries the open and overdue totals
   const { data: reminders = [] } = useQuery<Reminder[]>({
-    queryKey: ['reminders', 'pending'],
-    queryFn: async () => (await api.get('/reminders', { params: { done: false } })).data,
+    queryKey: ['reminders', 'pending', 'next'],
+    queryFn: async () =>
+      (await api.get('/reminders', { params: { done: false, limit: REMINDER_PREVIEW } })).data,
     enabled: !!user,
   });
+  const openReminders = stats?.reminders.open ?? reminders.length;
 
   useEffect(() => {
     if (!loading && !user) router.push('/login');
@@ -69,8 +81,8 @@ export default function Dashboard() {
 
       {/* stats */}
       <div className="grid grid-cols-2 md:grid-cols-4 gap-4 mb-10">
-        {STAT_CARDS.map(({ key, label, icon: Icon, color, filter }) => {
-          const count = applications.filter(filter).length;
+        {STAT_CARDS.map(({ key, label, icon: Icon, color, value }) => {
+          const count = stats ? value(stats) : 0;
           return (
             <div
               key={key}
@@ -99,7 +111,7 @@ export default function Dashboard() {
             </Link>
           </div>
           <div className="divide-y divide-[var(--border)]">
-            {applications.slice(0, 6).map((app) => {
+            {applications.map((app) => {
               const sm = STATUS_META[app.status as ApplicationStatus];
               return (
                 <Link
@@ -132,11 +144,19 @@ export default function Dashboard() {
 
         {/* reminders */}
         <div className="bg-white rounded-xl border border-[var(--border)] p-5">
-          <h2 className="text-base font-semibold mb-4 flex items-center gap-2">
+          <h2 className="text-base font-semibold mb-1 flex items-center gap-2">
             <Clock size={16} className="text-[var(--accent)]" /> Upcoming Reminders
           </h2>
-          <div className="space-y-3">
-            {reminders.slice(0, 5).map((r) => (
+          {stats && stats.reminders.open > 0 && (
+            <p className="text-xs text-[var(--fg-muted)]">
+              {stats.reminders.open} open · {stats.reminders.due_next_7_days} due in 7 days
+              {stats.reminders.overdue > 0 && (
+                <span className="text-red-600"> · {stats.reminders.overdue} overdue</span>
+              )}
+            </p>
+          )}
+          <div className="space-y-3 mt-4">
+            {reminders.map((r) => (
               <div key={r.id} className="flex items-start gap-3 text-sm">
                 <div className="w-2 h-2 rounded-full bg-indigo-400 mt-1.5 flex-shrink-0" />
                 <div>
@@ -152,6 +172,11 @@ export default function Dashboard() {
                 </div>
               </div>
             ))}
+            {openReminders > reminders.length && (
+              <p className="text-xs text-[var(--fg-muted)]">
+                +{openReminders - reminders.length} more
+              </p>
+            )}
             {reminders.length === 0 && (
               <p className="text-sm text-[var(--fg-muted)] italic">No pending reminders.</p>
             )}
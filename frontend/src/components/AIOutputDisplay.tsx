@@ -223,6 +223,27 @@ function InterviewPrepDisplay({ data }: { data: InterviewPrepResult }) {
     );
 }
 
+// Empty values for the fields a streamed partial output may not have reached
+// yet, so the displays above can render it as it grows.
+const PARTIAL_DEFAULTS: Record<string, Record<string, unknown>> = {
+    parse_jd: {
+        role_title: '',
+        must_have_skills: [],
+        nice_to_have_skills: [],
+        responsibilities: [],
+        keywords: [],
+        questions_to_ask: [],
+    },
+    match: { match_score: 0, strong_matches: [], gaps: [], recommended_projects: [], recommended_experience: [] },
+    tailor_cv: { tailored_summary: '', bullet_suggestions: [], top_keywords: [], warnings: [] },
+    outreach: { linkedin_message: '', email_message: '' },
+    interview_prep: { likely_questions: [], checklist: [], suggested_stories: [] },
+};
+
+export function withPartialDefaults(kind: string, partial: Record<string, unknown>) {
+    return { ...PARTIAL_DEFAULTS[kind], ...partial };
+}
+
 export function AIOutputDisplay({ output }: { output: { kind: string; output_json: Record<string, unknown> } }) {
     const data = output.output_json;
     const kind = output.kind;
@@ -1,11 +1,11 @@
-import { Application } from '@/lib/types';
+import { ApplicationSummary } from '@/lib/types';
 import { useSortable } from '@dnd-kit/sortable';
 import { CSS } from '@dnd-kit/utilities';
 import Link from 'next/link';
 import { ExternalLink } from 'lucide-react';
 
 interface Props {
-  application: Application;
+  application: ApplicationSummary;
 }
 
 const PRIORITY_DOT: Record<string, string> = {
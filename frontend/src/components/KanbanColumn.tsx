@@ -1,4 +1,4 @@
-import { Application, STATUS_META, ApplicationStatus } from '@/lib/types';
+import { ApplicationSummary, STATUS_META, ApplicationStatus } from '@/lib/types';
 import ApplicationCard from './ApplicationCard';
 import { useDroppable } from '@dnd-kit/core';
 import { SortableContext, verticalListSortingStrategy } from '@dnd-kit/sortable';
@@ -6,10 +6,22 @@ import { SortableContext, verticalListSortingStrategy } from '@dnd-kit/sortable'
 interface Props {
   id: string;
   title: string;
-  applications: Application[];
+  applications: ApplicationSummary[];
+  count: number;
+  hasMore: boolean;
+  loadingMore: boolean;
+  onLoadMore: () => void;
 }
 
-export default function KanbanColumn({ id, title, applications }: Props) {
+export default function KanbanColumn({
+  id,
+  title,
+  applications,
+  count,
+  hasMore,
+  loadingMore,
+  onLoadMore,
+}: Props) {
   const { setNodeRef, isOver } = useDroppable({ id });
   const sm = STATUS_META[id as ApplicationStatus];
 
@@ -21,7 +33,7 @@ export default function KanbanColumn({ id, title, applications }: Props) {
       <h3 className="font-semibold text-sm mb-3 flex items-center justify-between px-1">
         <span>{title}</span>
         <span className={`badge ${sm?.color || 'bg-gray-100 text-gray-600 border-gray-200'}`}>
-          {applications.length}
+          {count}
         </span>
       </h3>
 
@@ -36,6 +48,15 @@ export default function KanbanColumn({ id, title, applications }: Props) {
             Drop here
           </div>
         )}
+        {hasMore && (
+          <button
+            onClick={onLoadMore}
+            disabled={loadingMore}
+            className="w-full mt-1 rounded-lg py-1.5 text-xs text-[var(--fg-muted)] hover:bg-slate-100 transition-colors disabled:opacity-50"
+          >
+            {loadingMore ? 'Loading…' : `Load more (${count - applications.length})`}
+          </button>
+        )}
       </div>
     </div>
   );
@@ -58,3 +58,49 @@ export async function pollTaskUntilDone(taskId: string, intervalMs = 1500, maxPo
   }
   return { status: 'TIMEOUT', result: null };
 }
+
+/* ── AI task stream (Server-Sent Events) ── */
+
+// Follows a task triggered with ?stream=true.  EventSource cannot send the
+// Authorization header, so the SSE frames are read from a fetch body instead.
+export async function streamTask(
+  taskId: string,
+  onPartial: (partial: Record<string, unknown>) => void,
+) {
+  const token = typeof window !== 'undefined' ? localStorage.getItem('token') : null;
+  const res = await fetch(`${BASE_URL}/ai/tasks/${taskId}/stream`, {
+    headers: token ? { Authorization: `Bearer ${token}` } : {},
+  });
+  if (!res.ok || !res.body) {
+    throw new Error(`AI stream failed with ${res.status}`);
+  }
+
+  const reader = res.body.getReader();
+  const decoder = new TextDecoder();
+  let buffer = '';
+  for (;;) {
+    const { value, done } = await reader.read();
+    if (done) break;
+    buffer += decoder.decode(value, { stream: true });
+
+    let end;
+    while ((end = buffer.indexOf('\n\n')) !== -1) {
+      const frame = buffer.slice(0, end);
+      buffer = buffer.slice(end + 2);
+      let event = 'message';
+      let data = '';
+      for (const line of frame.split('\n')) {
+        if (line.startsWith('event: ')) event = line.slice(7);
+        else if (line.startsWith('data: ')) data += line.slice(6);
+      }
+      if (!data) continue; // keep-alive comment
+
+      const payload = JSON.parse(data);
+      if (event === 'partial') onPartial(payload);
+      else if (event === 'done') return { status: 'SUCCESS', result: payload };
+      else if (event === 'error') return { status: 'FAILURE', result: payload };
+      else if (event === 'timeout') return { status: 'TIMEOUT', result: null };
+    }
+  }
+  return { status: 'TIMEOUT', result: null };
+}
@@ -53,6 +53,35 @@ export interface Application {
   job_posting?: JobPosting;
 }
 
+/* list/board payloads leave out notes and job_posting.description_raw */
+export type ApplicationSummary = Omit<Application, 'notes' | 'job_posting'> & {
+  job_posting?: Omit<JobPosting, 'description_raw'>;
+};
+
+export interface ApplicationPage {
+  items: ApplicationSummary[];
+  next_cursor: string | null;
+}
+
+export interface BoardColumn {
+  status: ApplicationStatus;
+  count: number;
+  items: ApplicationSummary[];
+  next_cursor: string | null;
+}
+
+export interface BoardResponse {
+  columns: BoardColumn[];
+}
+
+export interface Stats {
+  total: number;
+  status_counts: Record<ApplicationStatus, number>;
+  response_rate: number;
+  applications_per_week: { week_start: string; count: number }[];
+  reminders: { open: number; overdue: number; due_next_7_days: number };
+}
+
 export interface Reminder {
   id: string;
   application_id: string;
@@ -63,6 +92,11 @@ export interface Reminder {
   created_at: string;
 }
 
+export interface ReminderPage {
+  items: Reminder[];
+  next_cursor: string | null;
+}
+
 export interface EvidenceSnippet {
   source: string;
   text: string;